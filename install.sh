@@ -45,11 +45,14 @@ if [ $? == 1 ]; then
 fi
 
 echo "Compiling camera..."
-gcc -O2 -fPIC -c ./mantra/camera.c -I$PYPATH -L/usr/lib -lv4l2 -o ./mantra/camera.o
-if [ $? == 1 ]; then
-	echo "Error compiling camera.c"
-	exit
-fi
+for SRC in camera source bench capture workers components background
+do
+	gcc -O2 -fPIC -c ./mantra/$SRC.c -I$PYPATH -L/usr/lib -lv4l2 -o ./mantra/$SRC.o
+	if [ $? == 1 ]; then
+		echo "Error compiling $SRC.c"
+		exit
+	fi
+done
 
 echo "Compiling camera_wrap..."
 gcc -O2 -fPIC -c ./mantra/camera_wrap.c -I$PYPATH -I/usr/include/opencv -L/usr/lib -lv4l2 -o ./mantra/camera_wrap.o
@@ -59,7 +62,7 @@ if [ $? == 1 ]; then
 fi
 
 echo "Linking.."
-gcc -shared ./mantra/camera.o ./mantra/camera_wrap.o -o ./mantra/_camera.so -I/usr/include/opencv -L/usr/lib -lv4l2
+gcc -shared ./mantra/camera.o ./mantra/source.o ./mantra/bench.o ./mantra/capture.o ./mantra/workers.o ./mantra/components.o ./mantra/background.o ./mantra/camera_wrap.o -o ./mantra/_camera.so -I/usr/include/opencv -L/usr/lib -lv4l2 -lpthread
 if [ $? == 1 ]; then
 	echo "Error linking"
 	exit
@@ -0,0 +1,150 @@
+#include <stdlib.h>
+#include <string.h>
+#include "camera.h"
+
+// The background model is kept for blocks of BACKGROUND_BLOCK x
+// BACKGROUND_BLOCK pixels, of which only a few pixels are sampled
+#define BACKGROUND_SAMPLES	4
+
+// The model is stored in fixed point with this many fractional bits
+#define BACKGROUND_SHIFT	4
+
+// Blocks that did not change slowly adapt to changes in lighting
+#define BACKGROUND_ADAPT	64
+
+// If background_model is set, the brightness of every block is learned
+// during the first background_warmup frames. After that, a block counts as
+// changed if its brightness differs more than background_threshold from the
+// model. If motion_acquire is set, objects are only searched for in blocks
+// that changed (and their neighbours), so that static clutter of the same
+// color is ignored. The model itself belongs to the camera
+short background_model = 0;
+int background_warmup = 30;
+int background_threshold = 20;
+short motion_acquire = 0;
+
+void background_free(CAMERA *cam)
+{
+	free(cam->background);
+	free(cam->background_changed);
+	free(cam->background_mask);
+	cam->background = NULL;
+	cam->background_changed = NULL;
+	cam->background_mask = NULL;
+	cam->background_columns = 0;
+	cam->background_rows = 0;
+}
+
+void background_reset(CAMERA *cam)
+{
+
+	/**
+	Discards the background model, so that it is learned again from the next
+	frames. The model is sized to the current resolution
+	**/
+
+	int n;
+
+	background_free(cam);
+	cam->background_columns = (cam->format.fmt.pix.width + BACKGROUND_BLOCK - 1) / BACKGROUND_BLOCK;
+	cam->background_rows = (cam->format.fmt.pix.height + BACKGROUND_BLOCK - 1) / BACKGROUND_BLOCK;
+	n = cam->background_columns * cam->background_rows;
+	cam->background = calloc(n, sizeof(unsigned short));
+	cam->background_changed = calloc(n, 1);
+	cam->background_mask = calloc(n, 1);
+	cam->background_frames = 0;
+	cam->background_ready = 0;
+}
+
+int background_sample(CAMERA *cam, int bx, int by)
+{
+
+	/**
+	Returns the summed brightness of a few pixels of a block
+	**/
+
+	int x0 = bx * BACKGROUND_BLOCK + BACKGROUND_BLOCK / 4;
+	int y0 = by * BACKGROUND_BLOCK + BACKGROUND_BLOCK / 4;
+	int x1 = MIN(cam->format.fmt.pix.width - 1, x0 + BACKGROUND_BLOCK / 2);
+	int y1 = MIN(cam->format.fmt.pix.height - 1, y0 + BACKGROUND_BLOCK / 2);
+	unsigned char *frame = cam->frame;
+
+	x0 = MIN(cam->format.fmt.pix.width - 1, x0);
+	y0 = MIN(cam->format.fmt.pix.height - 1, y0);
+	return frame_luma(cam, frame, x0, y0) + frame_luma(cam, frame, x1, y0) + frame_luma(cam, frame, x0, y1) + frame_luma(cam, frame, x1, y1);
+}
+
+void background_update(CAMERA *cam)
+{
+
+	/**
+	Learns the current frame into the model during the warm-up, and
+	determines which blocks changed afterwards
+	**/
+
+	extern int background_warmup, background_threshold;
+
+	unsigned short *background = cam->background;
+	unsigned char *changed = cam->background_changed;
+	int columns = cam->background_columns;
+	int rows = cam->background_rows;
+	int bx, by, i, dx, dy, sample, diff;
+	int limit = background_threshold * BACKGROUND_SAMPLES << BACKGROUND_SHIFT;
+
+	if (background == NULL) {
+		return;
+	}
+
+	if (!cam->background_ready) {
+		for (i = 0, by = 0; by < rows; by++) {
+			for (bx = 0; bx < columns; bx++, i++) {
+				sample = background_sample(cam, bx, by) << BACKGROUND_SHIFT;
+				background[i] += (sample - background[i]) / (cam->background_frames + 1);
+			}
+		}
+		cam->background_frames++;
+		cam->background_ready = cam->background_frames >= background_warmup;
+		return;
+	}
+
+	for (i = 0, by = 0; by < rows; by++) {
+		for (bx = 0; bx < columns; bx++, i++) {
+			sample = background_sample(cam, bx, by) << BACKGROUND_SHIFT;
+			diff = sample - background[i];
+			changed[i] = diff > limit || diff < -limit;
+			if (!changed[i]) {
+				background[i] += diff / BACKGROUND_ADAPT;
+			}
+		}
+	}
+
+	// Grow the changed blocks by one block, so that the edges of a moving
+	// object are not cut off
+	memset(cam->background_mask, 0, columns * rows);
+	for (i = 0, by = 0; by < rows; by++) {
+		for (bx = 0; bx < columns; bx++, i++) {
+			if (!changed[i]) {
+				continue;
+			}
+			for (dy = MAX(0, by - 1); dy <= MIN(rows - 1, by + 1); dy++) {
+				for (dx = MAX(0, bx - 1); dx <= MIN(columns - 1, bx + 1); dx++) {
+					cam->background_mask[dy * columns + dx] = 1;
+				}
+			}
+		}
+	}
+}
+
+short background_mask_at(CAMERA *cam, int x, int y)
+{
+
+	/**
+	Returns 1 if the pixel is in a block that changed (or neighbours one),
+	0 if it didn't change and -1 if the model is not ready
+	**/
+
+	if (!cam->background_ready || cam->background_mask == NULL) {
+		return -1;
+	}
+	return cam->background_mask[(y / BACKGROUND_BLOCK) * cam->background_columns + x / BACKGROUND_BLOCK];
+}
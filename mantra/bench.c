@@ -0,0 +1,168 @@
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+#include "camera.h"
+
+// The maximum number of objects that are passed to a single benchmark
+#define MAX_BENCH_OBJECTS	16
+
+// The pixel budget of a single BENCH_TRACK_SLICE run
+#define BENCH_SLICE_BUDGET	4096
+
+// An object as passed to camera_benchmark()
+typedef struct {
+	int color_r;
+	int color_g;
+	int color_b;
+	int fuzziness;
+	int pre_x;
+	int pre_y;
+	int half_w;
+	int half_h;
+} BENCH_OBJECT;
+
+// Receives the result of the matching_pixel sweep, so that the compiler cannot
+// optimize the sweep away
+volatile int bench_hits;
+
+long bench_ns(struct timespec *start, struct timespec *end)
+{
+	return (end->tv_sec - start->tv_sec) * 1000000000L + (end->tv_nsec - start->tv_nsec);
+}
+
+void bench_kernel(CAMERA *cam, int kernel, BENCH_OBJECT *o)
+{
+
+	/**
+	Runs a single kernel for a single object. The lower-level kernels receive
+	the same arguments as they would while tracking. The GIL is not released,
+	so that this overhead is not included in the timings
+	**/
+
+	int width = cam->format.fmt.pix.width;
+	int height = cam->format.fmt.pix.height;
+	int ex = MAX(0, MIN(width - o->pre_x, width));
+	int ey = MAX(0, MIN(o->pre_y, height));
+	int x, y, hits = 0;
+	WINDOW window = frame_window(cam);
+	COLOR_TABLE *table;
+
+	if (kernel == BENCH_TRACK_OBJECT) {
+		track_object_kernel(cam, o->color_r, o->color_g, o->color_b, o->fuzziness, o->pre_x, o->pre_y, 0, 0, 0);
+		return;
+	}
+
+	if (kernel == BENCH_TRACK_WINDOW) {
+		track_object_kernel(cam, o->color_r, o->color_g, o->color_b, o->fuzziness, o->pre_x, o->pre_y, o->half_w, o->half_h, 0);
+		return;
+	}
+
+	if (kernel == BENCH_TRACK_HIGHLIGHT) {
+		track_object_kernel(cam, o->color_r, o->color_g, o->color_b, o->fuzziness, o->pre_x, o->pre_y, 0, 0, 1);
+		return;
+	}
+
+	if (kernel == BENCH_TRACK_SLICE) {
+		track_object_slice_kernel(cam, o->color_r, o->color_g, o->color_b, o->fuzziness, o->pre_x, o->pre_y, 0, 0, -1, BENCH_SLICE_BUDGET, 0);
+		return;
+	}
+
+	if (kernel == BENCH_HIGHLIGHT_COLOR) {
+		highlight_color_kernel(cam, o->color_r, o->color_g, o->color_b, o->fuzziness);
+		return;
+	}
+
+	table = color_table(cam, o->color_r, o->color_g, o->color_b, o->fuzziness);
+
+	switch (kernel) {
+		case BENCH_SPIRAL_SCAN:
+			spiral_scan(cam, ex, ey, table, &window);
+			break;
+		case BENCH_COMPONENT_SCAN:
+			component_scan(cam, ex, ey, table, &window);
+			break;
+		case BENCH_FIND_OBJECT:
+			find_object(cam, table, &ex, &ey, &window);
+			break;
+		case BENCH_FIND_PYRAMID:
+			find_object_pyramid(cam, table, &ex, &ey, &window);
+			break;
+		case BENCH_MATCHING_PIXEL:
+			for (y = 0; y < height; y++) {
+				for (x = 0; x < width; x++) {
+					hits += matching_pixel(cam, table, x, y);
+				}
+			}
+			bench_hits = hits;
+			break;
+	}
+}
+
+PyObject *camera_benchmark(CAMERA *cam, int kernel, int n, PyObject *objects)
+{
+
+	/**
+	Runs a kernel n times on the current frame of a camera, each time for all
+	objects, which is a list of (r, g, b, fuzziness, pre_x, pre_y[, half_w,
+	half_h]) tuples. The window size is only used by BENCH_TRACK_WINDOW.
+	Returns a list of (nanoseconds, pixels touched) tuples, one for each run.
+	The frame is restored before every run, so kernels that modify the frame
+	always see the same input
+	**/
+
+	BENCH_OBJECT bench_objects[MAX_BENCH_OBJECTS];
+	COLOR_TABLE *tables[MAX_BENCH_OBJECTS];
+	LABEL_SUMS sums[MAX_BENCH_OBJECTS + 1];
+	struct timespec start, end;
+	unsigned char *original;
+	PyObject *result, *item;
+	int nr_of_objects, i, j;
+
+	if (!PySequence_Check(objects)) {
+		PyErr_SetString(PyExc_TypeError, "objects should be a sequence");
+		return NULL;
+	}
+
+	nr_of_objects = MIN(PySequence_Size(objects), MAX_BENCH_OBJECTS);
+	for (i = 0; i < nr_of_objects; i++) {
+		BENCH_OBJECT *o = &bench_objects[i];
+		o->half_w = 0;
+		o->half_h = 0;
+		item = PySequence_GetItem(objects, i);
+		if (item == NULL || !PyArg_ParseTuple(item, "iiiiii|ii", &o->color_r, &o->color_g, &o->color_b, &o->fuzziness, &o->pre_x, &o->pre_y, &o->half_w, &o->half_h)) {
+			Py_XDECREF(item);
+			return NULL;
+		}
+		Py_DECREF(item);
+	}
+
+	// Build the color tables in advance, so that this isn't timed
+	for (i = 0; i < nr_of_objects; i++) {
+		tables[i] = color_table(cam, bench_objects[i].color_r, bench_objects[i].color_g,
+			bench_objects[i].color_b, bench_objects[i].fuzziness);
+	}
+
+	original = malloc(cam->format.fmt.pix.sizeimage);
+	memcpy(original, cam->frame, cam->format.fmt.pix.sizeimage);
+
+	result = PyList_New(n);
+	for (i = 0; i < n; i++) {
+		memcpy(cam->frame, original, cam->format.fmt.pix.sizeimage);
+		cam->pixels_touched = 0;
+		clock_gettime(CLOCK_MONOTONIC, &start);
+		if (kernel == BENCH_LABEL_SCAN) {
+			label_scan(cam, tables, nr_of_objects, 0, sums);
+		} else {
+			for (j = 0; j < nr_of_objects; j++) {
+				bench_kernel(cam, kernel, &bench_objects[j]);
+			}
+		}
+		clock_gettime(CLOCK_MONOTONIC, &end);
+		PyList_SET_ITEM(result, i, Py_BuildValue("(lk)", bench_ns(&start, &end), cam->pixels_touched));
+	}
+
+	memcpy(cam->frame, original, cam->format.fmt.pix.sizeimage);
+	free(original);
+
+	return result;
+}
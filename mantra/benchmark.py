@@ -0,0 +1,256 @@
+#!/usr/bin/env python
+#-*- coding:utf-8 -*-
+
+"""
+This file is part of Mantra.
+
+Mantra is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Mantra is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Mantra.  If not, see <http://www.gnu.org/licenses/>.
+
+USAGE
+=====
+
+python -m mantra.benchmark [--repeats N] [--threads N]
+	[--output results.json] [--compare baseline.json] [--threshold 0.1]
+
+Feeds fixed synthetic frames into the tracking kernels and reports the
+latency percentiles and the number of pixels that were touched. Each factor
+(resolution, object size, fuzziness, number of objects, match mode, size mode
+and pixel format) is varied separately, while the others are kept at their baseline
+value. The results can be saved as JSON and compared with the results of an
+earlier release, in which case the exit status is 1 if any scenario became
+slower than the threshold allows. The number of threads applies to the
+kernels that process the entire frame (label_scan and highlight_color). The
+track_window kernel scans a window around the predicted position that is
+somewhat larger than the object. The component_scan kernel labels the
+connected components of the entire frame. The find_pyramid kernel is the
+coarse-to-fine alternative to find_object, which is used with
+ACQUIRE_PYRAMID. The track_slice kernel is a single step of the search for a
+lost object, with a budget of 4096 pixels. The track_highlight kernel is
+track_object with the scanned region highlighted, as when the webcam image is
+monitored.
+"""
+
+import sys
+import json
+import optparse
+from mantra import camera
+
+# Distinct colors for the synthetic objects
+colors = [(255, 0, 0), (0, 200, 0), (0, 0, 255), (255, 255, 0)]
+
+# The baseline scenario
+baseline = {
+	"resolution" : (640, 480),
+	"radius" : 20,
+	"fuzziness" : 50,
+	"objects" : 1,
+	"match_mode" : 1,
+	"size_mode" : 1,
+	"start" : "on_target",
+	"pixel_format" : "rgb24"
+	}
+
+# The values that are tried for each factor
+factors = [
+	("resolution", [(320, 240), (640, 480), (800, 600), (1280, 1024), (1920, 1080)]),
+	("radius", [5, 20, 60]),
+	("fuzziness", [20, 50, 100]),
+	("objects", [1, 2, 4]),
+	("match_mode", [0, 1]),
+	("size_mode", [0, 1]),
+	("start", ["on_target", "far"]),
+	("pixel_format", ["rgb24", "yuyv", "yuv420"])
+	]
+
+# The pixel formats and the corresponding camera constants
+pixel_formats = {
+	"rgb24" : camera.PIXEL_RGB24,
+	"yuyv" : camera.PIXEL_YUYV,
+	"yuv420" : camera.PIXEL_YUV420
+	}
+
+# The kernels and the corresponding camera constants
+kernels = [
+	("track_object", camera.BENCH_TRACK_OBJECT),
+	("spiral_scan", camera.BENCH_SPIRAL_SCAN),
+	("find_object", camera.BENCH_FIND_OBJECT),
+	("matching_pixel", camera.BENCH_MATCHING_PIXEL),
+	("highlight_color", camera.BENCH_HIGHLIGHT_COLOR),
+	("label_scan", camera.BENCH_LABEL_SCAN),
+	("track_window", camera.BENCH_TRACK_WINDOW),
+	("component_scan", camera.BENCH_COMPONENT_SCAN),
+	("find_pyramid", camera.BENCH_FIND_PYRAMID),
+	("track_slice", camera.BENCH_TRACK_SLICE),
+	("track_highlight", camera.BENCH_TRACK_HIGHLIGHT)
+	]
+
+def percentile(values, p):
+
+	"""
+	Returns the p-th percentile (nearest rank) of a list of values
+	"""
+
+	values = sorted(values)
+	i = int(round(p / 100.0 * (len(values) - 1)))
+	return values[i]
+
+def scenarios():
+
+	"""
+	Yields all scenarios, by varying one factor at a time. The baseline
+	scenario is only yielded once
+	"""
+
+	seen = []
+	for factor, values in factors:
+		for value in values:
+			scenario = baseline.copy()
+			scenario[factor] = value
+			if scenario not in seen:
+				seen.append(scenario)
+				yield scenario
+
+def scenario_name(kernel, scenario):
+
+	"""
+	Returns a name that uniquely identifies a kernel/ scenario combination
+	"""
+
+	name = "%s/res=%dx%d/radius=%d/fuzziness=%d/objects=%d/match_mode=%d/size_mode=%d/start=%s" \
+		% ((kernel, ) + scenario["resolution"] + (scenario["radius"], \
+		scenario["fuzziness"], scenario["objects"], scenario["match_mode"], \
+		scenario["size_mode"], scenario["start"]))
+
+	# The format is left out for RGB24, so that the names remain comparable
+	# with results from before the format could be varied
+	if scenario["pixel_format"] != "rgb24":
+		name += "/format=%s" % scenario["pixel_format"]
+	return name
+
+def run_scenario(scenario, repeats):
+
+	"""
+	Runs all kernels for a single scenario and returns a list of results
+	"""
+
+	width, height = scenario["resolution"]
+	camera.cvar.match_mode = scenario["match_mode"]
+	camera.cvar.size_mode = scenario["size_mode"]
+	camera.cvar.capture_pixel_format = pixel_formats[scenario["pixel_format"]]
+
+	# Spread the objects over the frame and keep them still, so that every
+	# frame is identical
+	cam = camera.CAMERA()
+	camera.synthetic_clear_blobs(cam)
+	camera.cvar.synthetic_noise = 8
+	objects = []
+	for i in range(scenario["objects"]):
+		x = width * (i + 1) / (scenario["objects"] + 1)
+		y = height / 2
+		color = colors[i % len(colors)]
+		camera.synthetic_add_blob(cam, color[0], color[1], color[2], \
+			scenario["radius"], x, y, 0, 0)
+
+		# The predicted position is in tracker coordinates, which are mirrored
+		# horizontally
+		if scenario["start"] == "on_target":
+			pre = width - x, y
+		else:
+			pre = x, height - 1
+		window = 2 * scenario["radius"] + 16, 2 * scenario["radius"] + 16
+		objects.append(color + (scenario["fuzziness"], ) + pre + window)
+
+	camera.camera_init(cam, "synthetic", width, height)
+	camera.camera_capture(cam)
+
+	results = []
+	for kernel, kernel_id in kernels:
+		runs = camera.camera_benchmark(cam, kernel_id, repeats, objects)
+		latencies = [ns / 1000.0 for ns, pixels in runs]
+		pixels = [pixels for ns, pixels in runs]
+		result = {
+			"name" : scenario_name(kernel, scenario),
+			"kernel" : kernel,
+			"p50_us" : percentile(latencies, 50),
+			"p95_us" : percentile(latencies, 95),
+			"p99_us" : percentile(latencies, 99),
+			"pixels_touched" : sum(pixels) / len(pixels)
+			}
+		result.update(scenario)
+		results.append(result)
+
+	camera.camera_close(cam)
+	return results
+
+def compare(results, fname, threshold):
+
+	"""
+	Compares results with earlier results and returns the number of
+	scenarios that became slower than the threshold allows
+	"""
+
+	old = dict([(r["name"], r) for r in json.load(open(fname))["results"]])
+	regressions = 0
+	for r in results:
+		if r["name"] not in old:
+			continue
+		ratio = r["p50_us"] / max(old[r["name"]]["p50_us"], 0.001)
+		if ratio > 1 + threshold:
+			regressions += 1
+			flag = "REGRESSION"
+		elif ratio < 1 - threshold:
+			flag = "improvement"
+		else:
+			flag = ""
+		print "%-100s %10.1f -> %10.1f us (x%.2f) %s" % (r["name"], \
+			old[r["name"]]["p50_us"], r["p50_us"], ratio, flag)
+	return regressions
+
+def main():
+
+	parser = optparse.OptionParser(usage="python -m mantra.benchmark [options]")
+	parser.add_option("--repeats", type="int", default=100, \
+		help="the number of runs for each kernel and scenario")
+	parser.add_option("--output", default=None, \
+		help="a file to write the results to as JSON")
+	parser.add_option("--compare", default=None, \
+		help="a JSON file with earlier results")
+	parser.add_option("--threshold", type="float", default=0.1, \
+		help="the relative slowdown that counts as a regression")
+	parser.add_option("--threads", type="int", default=1, \
+		help="the number of threads that process a frame")
+	options, args = parser.parse_args()
+	camera.cvar.nr_of_threads = options.threads
+
+	results = []
+	for scenario in scenarios():
+		for r in run_scenario(scenario, options.repeats):
+			print "%-100s p50 %10.1f  p95 %10.1f  p99 %10.1f us %10d px" % \
+				(r["name"], r["p50_us"], r["p95_us"], r["p99_us"], \
+				r["pixels_touched"])
+			results.append(r)
+
+	if options.output != None:
+		f = open(options.output, "w")
+		json.dump({"repeats" : options.repeats, "threads" : options.threads, \
+			"results" : results}, f, \
+			indent=1, sort_keys=True)
+		f.close()
+
+	if options.compare != None:
+		if compare(results, options.compare, options.threshold) > 0:
+			sys.exit(1)
+
+if __name__ == "__main__":
+	main()
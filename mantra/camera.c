@@ -5,286 +5,663 @@
 #include <linux/videodev2.h>
 #include <fcntl.h>
 #include <sys/mman.h>
+#include <poll.h>
 #include <sys/time.h>
+#include <sys/stat.h>
+#include <string.h>
+#include <unistd.h>
 #include <Python.h>
-
-#define MIN(a,b) ((a)>(b)?(b):(a))
-#define MAX(a,b) ((a)<(b)?(b):(a))
-
-// Determines the maximum resolution of the webcam
-#define MAX_RES_X		1280
-#define MAX_RES_Y		1024
+#include "camera.h"
 
 // How many pixels should be skipped while scanning the image for the first time
 #define SCAN_ACCURACY	4
 
-// Some constants
-#define MATCH_ABS		0
-#define MATCH_REL		1
-#define SIZE_SURFACE	0
-#define SIZE_WIDTH		1
-#define SCAN_BLOCK		0
-#define SCAN_SPIRAL		1
-
-// Some global variables
+// Some global variables, which are shared by all cameras
 short match_mode = MATCH_REL;
 short size_mode = SIZE_WIDTH;
 short scan_mode = SCAN_SPIRAL;
 int min_z = 50;
 
-// These variables are used to communicate the tracking to Etracker
-int track_x = -1;
-int track_y = -1;
-int track_z = 0;
+// How an object is found if it is not at its predicted position. In
+// ACQUIRE_PYRAMID mode, only every acquire_step-th pixel in both directions is
+// checked first, and the hits are confirmed at full resolution
+short acquire_mode = ACQUIRE_SPIRAL;
+int acquire_step = 8;
+
+// The nr of buffers that is requested from v4l2. The nr that the driver
+// actually provided is kept by the camera. More buffers allow the driver to
+// keep capturing while a frame takes longer to process.
+int nr_of_buffers = 4;
 
-// This array holds information about matching pixels in the image
-short match[MAX_RES_X][MAX_RES_Y];
+// In CAPTURE_INPLACE mode, frames are processed directly in the buffer that
+// was dequeued, which is only given back to the driver when the frame is
+// released. In CAPTURE_COPY mode, every frame is copied to a private buffer.
+short capture_mode = CAPTURE_INPLACE;
 
-// Holds information tracking of an object
-typedef struct {
-	short keep_scanning;
-	double x;
-	double y;
-	int count;
-} SCAN;
+// How long to wait for the driver to provide a frame
+#define V4L2_TIMEOUT_MS		100
 
-// A v4l2 buffers
-struct buffer {
-	void *start;
-	size_t length;
-};
+// The pixel format that is requested. The format that is actually used is
+// kept by the camera
+short capture_pixel_format = PIXEL_AUTO;
 
-// The nr of buffers available to v4l2
-const int NR_OF_BUFFERS = 2;
+CAMERA *camera_new(void)
+{
+
+	/**
+	Creates a camera context, which is used by camera_init() to open a
+	device. Returns NULL if there is not enough memory
+	**/
 
-int camera_fd;
-struct buffer *buffers;
-unsigned char *frame;
-int bytesperpx;
-struct v4l2_format format;
-unsigned int r, g, b;
+	CAMERA *cam = calloc(1, sizeof(CAMERA));
 
-void camera_open(char *device)
+	if (cam == NULL) {
+		return NULL;
+	}
+	cam->fd = -1;
+	cam->pixel_format = PIXEL_RGB24;
+	cam->current_slot = -1;
+	cam->match_right = -1;
+	cam->match_bottom = -1;
+	cam->component_window.right = -1;
+	cam->component_window.bottom = -1;
+	cam->track_x = -1;
+	cam->track_y = -1;
+	capture_init(cam);
+	return cam;
+}
+
+void camera_delete(CAMERA *cam)
 {
-	extern int camera_fd;
 
-	camera_fd = v4l2_open(device, O_RDWR);
+	/**
+	Closes the camera if necessary and frees the context
+	**/
+
+	camera_close(cam);
+	color_tables_free(cam);
+	component_free(cam);
+	capture_destroy(cam);
+	free(cam);
 }
 
-void camera_set_format(int width, int height)
+void camera_open(CAMERA *cam, char *device)
 {
-	extern struct v4l2_format format;
-	extern unsigned char *frame;	
-	extern int camera_fd;
-	extern int bytesperpx;
-	
-	format.type = V4L2_BUF_TYPE_VIDEO_CAPTURE;
-	format.fmt.pix.width = width;
-	format.fmt.pix.height = height;
-	format.fmt.pix.pixelformat = V4L2_PIX_FMT_RGB24;
-	format.fmt.pix.field = V4L2_FIELD_INTERLACED;
+	cam->fd = v4l2_open(device, O_RDWR);
+}
 
-	if(v4l2_ioctl(camera_fd, VIDIOC_S_FMT, &format)) {
-	  printf("Error in VIDIOC_S_FMT\n");
+unsigned int camera_fourcc(short fmt)
+{
+	switch (fmt) {
+		case PIXEL_YUYV:
+			return V4L2_PIX_FMT_YUYV;
+		case PIXEL_YUV420:
+			return V4L2_PIX_FMT_YUV420;
 	}
+	return V4L2_PIX_FMT_RGB24;
+}
+
+short camera_native_format(CAMERA *cam)
+{
+
+	/**
+	Picks the pixel format that requires the least work before tracking. YUYV
+	and RGB24 are used if the camera delivers them without conversion.
+	Otherwise YUV420 is used, because libv4l2 can decode compressed formats,
+	such as MJPEG, to YUV420 without converting the colors
+	**/
 
-	frame = malloc(format.fmt.pix.sizeimage);
-	bytesperpx = format.fmt.pix.bytesperline / format.fmt.pix.width;
+	struct v4l2_fmtdesc desc;
+	short rgb24 = 0;
+	short yuv420 = 0;
+
+	memset(&desc, 0, sizeof(desc));
+	desc.type = V4L2_BUF_TYPE_VIDEO_CAPTURE;
+	for (desc.index = 0; v4l2_ioctl(cam->fd, VIDIOC_ENUM_FMT, &desc) == 0; desc.index++) {
+		if (desc.pixelformat == V4L2_PIX_FMT_YUV420) {
+			yuv420 = 1;
+		}
+		if (desc.flags & V4L2_FMT_FLAG_EMULATED) {
+			continue;
+		}
+		if (desc.pixelformat == V4L2_PIX_FMT_YUYV) {
+			return PIXEL_YUYV;
+		}
+		if (desc.pixelformat == V4L2_PIX_FMT_RGB24) {
+			rgb24 = 1;
+		}
+	}
+	if (yuv420 && !rgb24) {
+		return PIXEL_YUV420;
+	}
+	return PIXEL_RGB24;
 }
 
-int camera_get_width(void)
+void camera_set_format(CAMERA *cam, int width, int height)
 {
-	extern struct v4l2_format format;
+	extern short capture_pixel_format;
 
-	return format.fmt.pix.width;
+	short fmt = capture_pixel_format;
+
+	if (fmt == PIXEL_AUTO) {
+		fmt = camera_native_format(cam);
+	}
+	
+	cam->format.type = V4L2_BUF_TYPE_VIDEO_CAPTURE;
+	cam->format.fmt.pix.width = width;
+	cam->format.fmt.pix.height = height;
+	cam->format.fmt.pix.pixelformat = camera_fourcc(fmt);
+	cam->format.fmt.pix.field = V4L2_FIELD_INTERLACED;
+
+	// Fall back to RGB24 if the format is not available
+	if (v4l2_ioctl(cam->fd, VIDIOC_S_FMT, &cam->format) || cam->format.fmt.pix.pixelformat != camera_fourcc(fmt)) {
+		fmt = PIXEL_RGB24;
+		cam->format.fmt.pix.width = width;
+		cam->format.fmt.pix.height = height;
+		cam->format.fmt.pix.pixelformat = V4L2_PIX_FMT_RGB24;
+		cam->format.fmt.pix.field = V4L2_FIELD_INTERLACED;
+		if(v4l2_ioctl(cam->fd, VIDIOC_S_FMT, &cam->format)) {
+		  printf("Error in VIDIOC_S_FMT\n");
+		}
+	}
+
+	cam->pixel_format = fmt;
+	switch (fmt) {
+		case PIXEL_YUYV:
+			cam->bytesperpx = 2;
+			break;
+		case PIXEL_YUV420:
+			cam->bytesperpx = 1;
+			break;
+		default:
+			cam->bytesperpx = cam->format.fmt.pix.bytesperline / cam->format.fmt.pix.width;
+	}
 }
 
-int camera_get_height(void)
+int camera_get_width(CAMERA *cam)
 {
-	extern struct v4l2_format format;
+	return cam->format.fmt.pix.width;
+}
 
-	return format.fmt.pix.height;
+int camera_get_height(CAMERA *cam)
+{
+	return cam->format.fmt.pix.height;
 }
 
-void camera_init_buffers(void)
+void camera_init_buffers(CAMERA *cam)
 {
-	extern struct buffer *buffers;	
 	struct v4l2_requestbuffers reqbuf;
-	extern int camera_fd;
+	extern int nr_of_buffers;
 	int i;
 	
-	reqbuf.count = NR_OF_BUFFERS;
+	memset(&reqbuf, 0, sizeof(reqbuf));
+	reqbuf.count = MAX(2, nr_of_buffers);
 	reqbuf.type = V4L2_BUF_TYPE_VIDEO_CAPTURE;
 	reqbuf.memory = V4L2_MEMORY_MMAP;
-	if (v4l2_ioctl(camera_fd, VIDIOC_REQBUFS, &reqbuf)) {
+	if (v4l2_ioctl(cam->fd, VIDIOC_REQBUFS, &reqbuf)) {
 		printf("Error in VIDIOC_REQBUFS\n");
 	};
+
+	// The driver may provide a different number of buffers than requested
+	cam->nr_of_buffers_allocated = reqbuf.count;
 		
-	buffers = malloc(reqbuf.count * sizeof(struct buffer));
+	cam->buffers = malloc(reqbuf.count * sizeof(BUFFER));
 
-	for (i = 0; i < NR_OF_BUFFERS; i++) {
+	for (i = 0; i < cam->nr_of_buffers_allocated; i++) {
 		struct v4l2_buffer buffer;
+		memset(&buffer, 0, sizeof(buffer));
 		buffer.index = i;
 		buffer.type = V4L2_BUF_TYPE_VIDEO_CAPTURE;
 		buffer.memory = V4L2_MEMORY_MMAP;
 
-		if (v4l2_ioctl(camera_fd, VIDIOC_QUERYBUF, &buffer)) {
+		if (v4l2_ioctl(cam->fd, VIDIOC_QUERYBUF, &buffer)) {
 			printf("Error in VIDIOC_QUERYBUF\n");
 		}
 
-		buffers[i].length = buffer.length;
-		buffers[i].start = v4l2_mmap(NULL, buffer.length,
+		cam->buffers[i].length = buffer.length;
+		cam->buffers[i].start = v4l2_mmap(NULL, buffer.length,
 			PROT_READ | PROT_WRITE, MAP_SHARED,
-			camera_fd, buffer.m.offset);    
+			cam->fd, buffer.m.offset);    
 	}
 
-	for (i = 0; i < NR_OF_BUFFERS; i++) {
+	for (i = 0; i < cam->nr_of_buffers_allocated; i++) {
 		struct v4l2_buffer buffer;
+		memset(&buffer, 0, sizeof(buffer));
 		buffer.index = i;
 		buffer.type = V4L2_BUF_TYPE_VIDEO_CAPTURE;
 		buffer.memory = V4L2_MEMORY_MMAP;
 		
-		if (v4l2_ioctl(camera_fd, VIDIOC_QBUF, &buffer)) {
+		if (v4l2_ioctl(cam->fd, VIDIOC_QBUF, &buffer)) {
 			printf("Error in VIDIOC_QBUF\n");
 		}
 	}
 }
 
-void camera_free_buffers(void)
+void camera_free_buffers(CAMERA *cam)
 {
-	extern struct buffer *buffers;
 	int i;
 
-	for(i = 0; i < NR_OF_BUFFERS; i++) {
-		v4l2_munmap(buffers[i].start, buffers[i].length);
+	for(i = 0; i < cam->nr_of_buffers_allocated; i++) {
+		v4l2_munmap(cam->buffers[i].start, cam->buffers[i].length);
 	}
+	free(cam->buffers);
+	cam->nr_of_buffers_allocated = 0;
 }
 
-void camera_start(void)
+void camera_start(CAMERA *cam)
 {
-	extern int camera_fd;	
 	enum v4l2_buf_type type;
 	
 	type = V4L2_BUF_TYPE_VIDEO_CAPTURE;
-	if (v4l2_ioctl(camera_fd, VIDIOC_STREAMON, &type)) {
+	if (v4l2_ioctl(cam->fd, VIDIOC_STREAMON, &type)) {
 		printf("Error in VIDIOC_STREAMON\n");
 	}		
 
 	sleep(1);
 }
 
-void camera_init(char *device, int width, int height)
+void camera_set_rgb_format(CAMERA *cam, int width, int height)
 {
-	camera_open(device);
-	camera_set_format(width, height);
-	camera_init_buffers();
-	camera_start();
+
+	/**
+	Sets an RGB24 format for sources that are not backed by a device
+	**/
+
+	camera_set_pixel_format(cam, width, height, PIXEL_RGB24);
 }
 
-void camera_close(void)
+void camera_set_pixel_format(CAMERA *cam, int width, int height, short fmt)
 {
-	extern int camera_fd;
 
-	camera_free_buffers();
-	v4l2_close(camera_fd);
+	/**
+	Sets a format for sources that are not backed by a device. The YUV
+	formats require an even width and height
+	**/
+
+	width = MAX(1, width);
+	height = MAX(1, height);
+
+	memset(&cam->format, 0, sizeof(cam->format));
+	cam->format.type = V4L2_BUF_TYPE_VIDEO_CAPTURE;
+	cam->format.fmt.pix.pixelformat = camera_fourcc(fmt);
+	cam->format.fmt.pix.field = V4L2_FIELD_NONE;
+
+	switch (fmt) {
+		case PIXEL_YUYV:
+			width = MAX(2, width & ~1);
+			cam->format.fmt.pix.bytesperline = width * 2;
+			cam->format.fmt.pix.sizeimage = width * height * 2;
+			cam->bytesperpx = 2;
+			break;
+		case PIXEL_YUV420:
+			width = MAX(2, width & ~1);
+			height = MAX(2, height & ~1);
+			cam->format.fmt.pix.bytesperline = width;
+			cam->format.fmt.pix.sizeimage = width * height * 3 / 2;
+			cam->bytesperpx = 1;
+			break;
+		default:
+			fmt = PIXEL_RGB24;
+			cam->format.fmt.pix.bytesperline = width * 3;
+			cam->format.fmt.pix.sizeimage = width * height * 3;
+			cam->bytesperpx = 3;
+	}
+
+	cam->format.fmt.pix.width = width;
+	cam->format.fmt.pix.height = height;
+	cam->pixel_format = fmt;
 }
 
-PyObject *camera_to_string(void)
+void v4l2_source_init(CAMERA *cam, char *device, int width, int height)
 {
-	extern unsigned char *frame;
-	extern struct v4l2_format format;
-	
-	PyObject *result = PyString_FromStringAndSize(frame, format.fmt.pix.sizeimage);	
-	return result;
+	camera_open(cam, device);
+	camera_set_format(cam, width, height);
+	camera_init_buffers(cam);
+	camera_start(cam);
 }
 
-void camera_capture(void)
+short v4l2_source_grab(CAMERA *cam, FRAME_SLOT *slot)
 {
+
+	/**
+	Dequeues the next frame from the driver. The wait is limited, so that the
+	capture thread can be stopped even if the camera doesn't deliver frames
+	**/
+
 	struct v4l2_buffer buffer;
-	extern unsigned char *frame;
-	extern struct v4l2_format format;
+	struct pollfd pfd;
+	extern short capture_mode;
+
+	pfd.fd = cam->fd;
+	pfd.events = POLLIN;
+	pfd.revents = 0;
+	if (poll(&pfd, 1, V4L2_TIMEOUT_MS) <= 0) {
+		return 0;
+	}
 	
+	memset(&buffer, 0, sizeof(buffer));
 	buffer.type = V4L2_BUF_TYPE_VIDEO_CAPTURE;
 	buffer.memory = V4L2_MEMORY_MMAP;
 
-	if (v4l2_ioctl(camera_fd, VIDIOC_DQBUF, &buffer)) {
+	if (v4l2_ioctl(cam->fd, VIDIOC_DQBUF, &buffer)) {
 		printf("Error in VIDIOC_DQBUF\n");
+		return 0;
+	}
+
+	slot->timestamp = buffer.timestamp.tv_sec + buffer.timestamp.tv_usec / 1000000.0;
+	slot->sequence = buffer.sequence;
+
+	if (capture_mode == CAPTURE_INPLACE) {
+		slot->data = cam->buffers[buffer.index].start;
+		slot->index = buffer.index;
+		return 1;
 	}
 	
-	memcpy(frame, buffers[buffer.index].start, format.fmt.pix.sizeimage);	
+	memcpy(slot->own, cam->buffers[buffer.index].start, cam->format.fmt.pix.sizeimage);	
+	slot->data = slot->own;
+	slot->index = -1;
 
-	if (v4l2_ioctl(camera_fd, VIDIOC_QBUF, &buffer)) {
+	if (v4l2_ioctl(cam->fd, VIDIOC_QBUF, &buffer)) {
 		printf("Error in VIDIOC_QBUF\n");
 	}
+	return 1;
 }
 
-void camera_get_px(int x, int y)
+void v4l2_source_release(CAMERA *cam, FRAME_SLOT *slot)
 {
-	extern unsigned char *frame;
-	extern int bytesperpx;
-	extern struct v4l2_format format;
-	extern unsigned int r, g, b;
 
-	r = frame[x * bytesperpx + y * format.fmt.pix.bytesperline];	
-	g = frame[x * bytesperpx + y * format.fmt.pix.bytesperline + 1];
-	b = frame[x * bytesperpx + y * format.fmt.pix.bytesperline + 2];
+	/**
+	Gives a buffer that was processed in place back to the driver
+	**/
+
+	struct v4l2_buffer buffer;
+
+	if (slot->index == -1) {
+		return;
+	}
+
+	memset(&buffer, 0, sizeof(buffer));
+	buffer.type = V4L2_BUF_TYPE_VIDEO_CAPTURE;
+	buffer.memory = V4L2_MEMORY_MMAP;
+	buffer.index = slot->index;
+	if (v4l2_ioctl(cam->fd, VIDIOC_QBUF, &buffer)) {
+		printf("Error in VIDIOC_QBUF\n");
+	}
+	slot->index = -1;
 }
 
-void camera_put_px(int x, int y)
+void v4l2_source_close(CAMERA *cam)
 {
-	extern unsigned char *frame;
-	extern int bytesperpx;
-	extern struct v4l2_format format;
-	extern unsigned int r, g, b;
+	camera_free_buffers(cam);
+	v4l2_close(cam->fd);
+	cam->fd = -1;
+}
+
+FRAME_SOURCE v4l2_source = {v4l2_source_init, v4l2_source_grab, v4l2_source_release, v4l2_source_close};
 
-	frame[x * bytesperpx + y * format.fmt.pix.bytesperline] = r;
-	frame[x * bytesperpx + y * format.fmt.pix.bytesperline + 1] = g;
-	frame[x * bytesperpx + y * format.fmt.pix.bytesperline + 2] = b;
+short camera_source_type(char *device)
+{
+
+	/**
+	Determines which source corresponds to a device. The special device
+	"synthetic" generates frames, a regular file is replayed and everything
+	else is treated as a V4L2 device
+	**/
+
+	struct stat st;
+
+	if (strcmp(device, "synthetic") == 0) {
+		return SOURCE_SYNTHETIC;
+	}
+	if (stat(device, &st) == 0 && S_ISREG(st.st_mode)) {
+		return SOURCE_FILE;
+	}
+	return SOURCE_V4L2;
 }
 
-void camera_save_frame(char *fname)
+void camera_init(CAMERA *cam, char *device, int width, int height)
+{
+
+	/**
+	Opens a device for a camera and starts capturing. A camera that is
+	already open is closed first
+	**/
+
+	camera_close(cam);
+	cam->source_mode = camera_source_type(device);
+	switch (cam->source_mode) {
+		case SOURCE_SYNTHETIC:
+			cam->source = &synthetic_source;
+			break;
+		case SOURCE_FILE:
+			cam->source = &file_source;
+			break;
+		default:
+			cam->source = &v4l2_source;
+	}
+	cam->source->init(cam, device, width, height);
+	capture_start(cam);
+	match_alloc(cam);
+	background_reset(cam);
+}
+
+void camera_close(CAMERA *cam)
+{
+
+	/**
+	Stops capturing and releases the device and everything that was sized to
+	its resolution. The camera can be initialized again afterwards
+	**/
+
+	if (cam->source == NULL) {
+		return;
+	}
+
+	capture_stop(cam);
+	cam->source->close(cam);
+	cam->source = NULL;
+	match_free(cam);
+	background_free(cam);
+
+	free(cam->display);
+	cam->display = NULL;
+	cam->display_size = 0;
+}
+
+unsigned char *camera_rgb_frame(CAMERA *cam)
+{
+
+	/**
+	Returns the frame as RGB24 without padding, so always width * height * 3
+	bytes. RGB24 frames of which the rows aren't padded are returned as is,
+	padded RGB24 frames are copied row by row and other formats are converted
+	into the display buffer
+	**/
+
+	int width = cam->format.fmt.pix.width;
+	int height = cam->format.fmt.pix.height;
+	int bpl = cam->format.fmt.pix.bytesperline;
+	size_t size = width * height * 3;
+	unsigned int rgb;
+	unsigned char *px;
+	int x, y;
+
+	if (cam->frame == NULL || (cam->pixel_format == PIXEL_RGB24 && bpl == width * 3)) {
+		return cam->frame;
+	}
+
+	if (cam->display_size != size) {
+		free(cam->display);
+		cam->display = malloc(size);
+		cam->display_size = size;
+	}
+
+	if (cam->pixel_format == PIXEL_RGB24) {
+		for (y = 0; y < height; y++) {
+			memcpy(cam->display + y * width * 3, cam->frame + y * bpl, width * 3);
+		}
+		return cam->display;
+	}
+
+	px = cam->display;
+	for (y = 0; y < height; y++) {
+		for (x = 0; x < width; x++) {
+			rgb = frame_rgb(cam, cam->frame, x, y);
+			px[0] = rgb >> 16;
+			px[1] = (rgb >> 8) & 255;
+			px[2] = rgb & 255;
+			px += 3;
+		}
+	}
+	return cam->display;
+}
+
+PyObject *camera_to_string(CAMERA *cam)
+{
+	PyObject *result = PyString_FromStringAndSize(camera_rgb_frame(cam), cam->format.fmt.pix.width * cam->format.fmt.pix.height * 3);	
+	return result;
+}
+
+PyObject *camera_display_buffer(CAMERA *cam)
+{
+
+	/**
+	Returns a read-only buffer with the frame as RGB24, which is what the
+	monitor shows. For RGB24 frames, the buffer refers directly to the frame,
+	as with camera_frame_buffer(), unless the rows of the frame are padded.
+	Padded frames and other formats are converted, so this should
+	only be called when the frame is actually shown. The buffer is valid
+	until the next call to camera_display_buffer() or camera_capture()
+	**/
+
+	unsigned char *rgb;
+
+	Py_BEGIN_ALLOW_THREADS
+	rgb = camera_rgb_frame(cam);
+	Py_END_ALLOW_THREADS
+
+	if (rgb == NULL) {
+		PyErr_SetString(PyExc_RuntimeError, "the camera has not been initialized");
+		return NULL;
+	}
+	return PyBuffer_FromMemory(rgb, cam->format.fmt.pix.width * cam->format.fmt.pix.height * 3);
+}
+
+PyObject *camera_frame_buffer(CAMERA *cam, int writable)
+{
+
+	/**
+	Returns a buffer that refers directly to the frame, so that NumPy, pygame
+	and Qt can use the frame without copying it. The frame is in the format
+	given by pixel_format, see camera_display_buffer() for an RGB24 version
+	that can always be displayed. The buffer shows the
+	contents of the frame at the time it is used, so every camera_capture()
+	replaces what it refers to. The buffer must not be used anymore after
+	camera_close(), because the frame is freed at that point. If writable is
+	non-zero, the frame can be modified through the buffer. In CAPTURE_INPLACE
+	mode, the frame is a driver buffer that is handed back to the driver by
+	the next camera_capture(), so the buffer is only valid until then and
+	needs to be obtained again for every frame
+	**/
+
+	if (cam->frame == NULL) {
+		PyErr_SetString(PyExc_RuntimeError, "the camera has not been initialized");
+		return NULL;
+	}
+	if (writable) {
+		return PyBuffer_FromReadWriteMemory(cam->frame, cam->format.fmt.pix.sizeimage);
+	}
+	return PyBuffer_FromMemory(cam->frame, cam->format.fmt.pix.sizeimage);
+}
+
+void camera_capture(CAMERA *cam)
+{
+
+	/**
+	Captures the next frame. The GIL is released while waiting for the frame,
+	so that other Python threads keep running. If background_model is set,
+	the frame is compared with the background
+	**/
+
+	extern short background_model;
+
+	Py_BEGIN_ALLOW_THREADS
+	capture_next(cam);
+	if (background_model) {
+		background_update(cam);
+	}
+	Py_END_ALLOW_THREADS
+}
+
+void camera_get_px(CAMERA *cam, int x, int y)
+{
+	unsigned int rgb = frame_rgb(cam, cam->frame, x, y);
+
+	cam->r = rgb >> 16;
+	cam->g = (rgb >> 8) & 255;
+	cam->b = rgb & 255;
+}
+
+void camera_put_px(CAMERA *cam, int x, int y)
+{
+	frame_put_rgb(cam, cam->frame, x, y, (cam->r << 16) | (cam->g << 8) | cam->b);
+}
+
+void camera_save_frame(CAMERA *cam, char *fname)
 {
-	extern unsigned char *frame;
-	extern struct v4l2_format format;
-	
 	FILE *fp = fopen(fname, "w");
-	fwrite(frame, format.fmt.pix.sizeimage, 1, fp);		
+	fwrite(camera_rgb_frame(cam), cam->format.fmt.pix.width * cam->format.fmt.pix.height * 3, 1, fp);		
 	fclose(fp);
 }
 
-void camera_set_control(int id, int value)
+void camera_append_frame(CAMERA *cam, char *fname)
+{
+
+	/**
+	Appends the current frame to a file, so that a session can be recorded and
+	replayed later on by passing the file as camera device. Frames are always
+	stored as RGB24
+	**/
+
+	FILE *fp = fopen(fname, "a");
+	if (fp == NULL) {
+		printf("Failed to open %s\n", fname);
+		return;
+	}
+	fwrite(camera_rgb_frame(cam), cam->format.fmt.pix.width * cam->format.fmt.pix.height * 3, 1, fp);
+	fclose(fp);
+}
+
+void camera_set_control(CAMERA *cam, int id, int value)
 {
 	struct v4l2_control control;
-	extern int camera_fd;
 
 	memset (&control, 0, sizeof (control));
 	control.id = id;
 	control.value = value;
 	
-	v4l2_ioctl(camera_fd, VIDIOC_S_CTRL, &control);
+	v4l2_ioctl(cam->fd, VIDIOC_S_CTRL, &control);
 }
 
-int camera_get_control(int id)
+int camera_get_control(CAMERA *cam, int id)
 {
 	struct v4l2_control control;
-	extern int camera_fd;
 
 	memset (&control, 0, sizeof (control));
 	control.id = id;
-	v4l2_ioctl(camera_fd, VIDIOC_G_CTRL, &control);
+	v4l2_ioctl(cam->fd, VIDIOC_G_CTRL, &control);
 
 	return control.value;
 }
 
-int camera_control_available(int id)
+int camera_control_available(CAMERA *cam, int id)
 {
-	extern int camera_fd;
 	struct v4l2_queryctrl queryctrl;
 
 	memset (&queryctrl, 0, sizeof (queryctrl));
 	queryctrl.id = id;
 	
-	if (0 == v4l2_ioctl(camera_fd, VIDIOC_QUERYCTRL, &queryctrl)) {
+	if (0 == v4l2_ioctl(cam->fd, VIDIOC_QUERYCTRL, &queryctrl)) {
 		if (!(queryctrl.flags & V4L2_CTRL_FLAG_DISABLED)) {
 			return 1;
 		}
@@ -292,18 +669,70 @@ int camera_control_available(int id)
 	return 0;
 }
 
-short match_at(int x, int y)
+short match_at(CAMERA *cam, int x, int y)
 {
 
 	/**
 	Returns the match at the specified coordinates
 	**/	
 
-	extern short match[][MAX_RES_Y];	
-	return match[x][y];
+	if (cam->match == NULL || cam->match_stamp == 0) {
+		return 0;
+	}
+	if (cam->match[y * cam->match_width + x] == cam->match_stamp) {
+		return 1;
+	}
+	if (cam->match[y * cam->match_width + x] == cam->match_stamp + 1) {
+		return -1;
+	}
+	return 0;
 	
 }
 
+void match_alloc(CAMERA *cam)
+{
+
+	/**
+	Allocates the match and label arrays for the current resolution
+	**/
+
+	size_t size = (size_t) cam->format.fmt.pix.width * cam->format.fmt.pix.height;
+
+	match_free(cam);
+	cam->match = calloc(size, 1);
+	cam->labels = calloc(size, 1);
+	cam->match_width = cam->format.fmt.pix.width;
+	cam->match_stamp = 0;
+}
+
+void match_free(CAMERA *cam)
+{
+	free(cam->match);
+	free(cam->labels);
+	cam->match = NULL;
+	cam->labels = NULL;
+	cam->match_width = 0;
+}
+
+void match_invalidate(CAMERA *cam)
+{
+
+	/**
+	Invalidates the match array in O(1) by advancing the stamp
+	**/
+
+	if (cam->match_stamp >= 0xfd) {
+		memset(cam->match, 0, (size_t) cam->format.fmt.pix.width * cam->format.fmt.pix.height);
+		cam->match_stamp = 0;
+	}
+	cam->match_stamp += 2;
+
+	cam->match_left = 0;
+	cam->match_right = -1;
+	cam->match_top = 0;
+	cam->match_bottom = -1;
+}
+
 int color_match(int a, int b, int c, int d, int e, int f, int fuzziness)
 {
 
@@ -331,72 +760,202 @@ int color_match(int a, int b, int c, int d, int e, int f, int fuzziness)
 	return 0;
 }
 
-short matching_pixel(int *x, int *y, int *color_r, int *color_g, unsigned int *color_b, int *fuzziness)
+COLOR_TABLE *color_table(CAMERA *cam, int color_r, int color_g, int color_b, int fuzziness)
 {
+
 	/**
-	Determines whether a pixel at a specified coordinates matches the color
+	Returns the color table for a color, fuzziness, the current match mode and
+	the pixel format of the camera. Tables are built only once for every
+	camera and kept until they have been the least recently used of
+	MAX_COLOR_TABLES tables, so the tables of all objects that are tracked
+	together are kept
 	**/
 
 	extern short match_mode;
-	extern int bytesperpx;
-	extern struct v4l2_format format;	
-	extern unsigned char *frame;
-	
-	long offset = (*x) * bytesperpx + (*y) * format.fmt.pix.bytesperline;
-	
-	int r = frame[offset];
-	int g = frame[offset + 1];
-	int b = frame[offset + 2];
-	
+
+	COLOR_TABLE *table = &cam->color_tables[0];
+	int i;
+
+	for (i = 0; i < MAX_COLOR_TABLES; i++) {
+		COLOR_TABLE *t = &cam->color_tables[i];
+		if (t->bits != NULL && t->color_r == color_r && t->color_g == color_g
+			&& t->color_b == color_b && t->fuzziness == fuzziness
+			&& t->match_mode == match_mode && t->pixel_format == cam->pixel_format) {
+			t->last_used = ++cam->color_table_clock;
+			return t;
+		}
+		if (t->last_used < table->last_used) {
+			table = t;
+		}
+	}
+
+	color_table_build(cam, table, color_r, color_g, color_b, fuzziness);
+	table->last_used = ++cam->color_table_clock;
+	return table;
+}
+
+void color_table_build(CAMERA *cam, COLOR_TABLE *table, int color_r, int color_g, int color_b, int fuzziness)
+{
+
+	/**
+	Fills a color table with the result of the color comparison for every
+	possible triple. For the YUV formats, every YUV triple is converted to RGB
+	first, so that matching in YUV gives the same result as matching the
+	converted frame
+	**/
+
+	extern short match_mode;
+
+	int r, g, b, d, avg, i, j, k;
+	int cr = color_r;
+	int cg = color_g;
+	int cb = color_b;
+	unsigned int key, rgb;
+
+	if (table->bits == NULL) {
+		table->bits = malloc(COLOR_TABLE_SIZE);
+	}
+	memset(table->bits, 0, COLOR_TABLE_SIZE);
+
+	table->color_r = color_r;
+	table->color_g = color_g;
+	table->color_b = color_b;
+	table->fuzziness = fuzziness;
+	table->match_mode = match_mode;
+	table->pixel_format = cam->pixel_format;
+
 	if (match_mode == MATCH_REL) {
-		int avg = (r + g + b) / 3;		
-		r = r - avg;
-		g = g - avg;
-		b = b - avg;
+		avg = (cr + cg + cb) / 3;
+		cr -= avg;
+		cg -= avg;
+		cb -= avg;
 	}
 
-	return abs(r - (*color_r)) + abs(g - (*color_g)) + abs(b - (*color_b)) < (*fuzziness);
+	for (i = 0; i < 256; i++) {
+		for (j = 0; j < 256; j++) {
+			key = (i << 16) | (j << 8);
+			for (k = 0; k < 256; k++) {
+				if (cam->pixel_format == PIXEL_RGB24) {
+					r = i;
+					g = j;
+					b = k;
+				} else {
+					rgb = yuv_to_rgb(key | k);
+					r = rgb >> 16;
+					g = (rgb >> 8) & 255;
+					b = rgb & 255;
+				}
+				if (match_mode == MATCH_REL) {
+					avg = (r + g + b) / 3;
+					d = abs(r - avg - cr) + abs(g - avg - cg) + abs(b - avg - cb);
+				} else {
+					d = abs(r - cr) + abs(g - cg) + abs(b - cb);
+				}
+				if (d < fuzziness) {
+					table->bits[(key | k) >> 3] |= 1 << (k & 7);
+				}
+			}
+		}
+	}
+}
+
+void color_tables_free(CAMERA *cam)
+{
+	int i;
+
+	for (i = 0; i < MAX_COLOR_TABLES; i++) {
+		free(cam->color_tables[i].bits);
+		cam->color_tables[i].bits = NULL;
+	}
 }
 
-void highlight_color(int color_r, int color_g, int color_b, int fuzziness)
+void color_table_prepare(CAMERA *cam, int color_r, int color_g, int color_b, int fuzziness)
 {
 
 	/**
-	 * Highlights pixels matching the specified color
+	Builds the color table for an object in advance, so that the first frame
+	in which the object is tracked is not delayed
+	**/
+
+	Py_BEGIN_ALLOW_THREADS
+	color_table(cam, color_r, color_g, color_b, fuzziness);
+	Py_END_ALLOW_THREADS
+}
+
+void highlight_color(CAMERA *cam, int color_r, int color_g, int color_b, int fuzziness)
+{
+
+	/**
+	 * Highlights pixels matching the specified color. The GIL is released
+	 * while the frame is processed
 	 **/
-	
-	extern unsigned char *frame;
-	extern int bytesperpx;
-	extern struct v4l2_format format;
-	unsigned int x, y;
 
-	if (match_mode == MATCH_REL) {	
-		int avg_col = (color_r + color_g + color_b) / 3;
-		color_r = color_r - avg_col;
-		color_g = color_g - avg_col;
-		color_b = color_b - avg_col;
-	}		
-	
-	for (x = 0; x < format.fmt.pix.width; x++) {
-		for (y = 0; y < format.fmt.pix.height; y++) {
-			if (matching_pixel(&x, &y, &color_r, &color_g, &color_b, &fuzziness)) {
-				frame[x * bytesperpx + y * format.fmt.pix.bytesperline + 1] = 255;
+	Py_BEGIN_ALLOW_THREADS
+	highlight_color_kernel(cam, color_r, color_g, color_b, fuzziness);
+	Py_END_ALLOW_THREADS
+}
+
+void highlight_color_tile(CAMERA *cam, int tile, int nr_of_tiles, void *arg)
+{
+
+	/**
+	 * Highlights a band of rows, given the color table as argument
+	 **/
+
+	COLOR_TABLE *table = arg;
+	int width = cam->format.fmt.pix.width;
+	int height = cam->format.fmt.pix.height;
+	int top = tile * height / nr_of_tiles;
+	int bottom = (tile + 1) * height / nr_of_tiles;
+	int x, y;
+	unsigned char *px;
+
+	if (cam->pixel_format != PIXEL_RGB24) {
+		for (y = top; y < bottom; y++) {
+			for (x = 0; x < width; x++) {
+				highlight_pixel(cam, x, y, table_bit(table, frame_key(cam, cam->frame, x, y)));
+			}
+		}
+		return;
+	}
+
+	for (y = top; y < bottom; y++) {
+		px = cam->frame + y * cam->format.fmt.pix.bytesperline;
+		for (x = 0; x < width; x++) {
+			if (table_match(table, px)) {
+				px[1] = 255;
 			} else {
-				frame[x * bytesperpx + y * format.fmt.pix.bytesperline] = 255;
+				px[0] = 255;
 			}
+			px += cam->bytesperpx;
 		}
 	}
 }
 
-void find_object(int *color_r, int *color_g, int *color_b, int *fuzziness, int *ex, int *ey)
+void highlight_color_kernel(CAMERA *cam, int color_r, int color_g, int color_b, int fuzziness)
 {
 
-	extern struct v4l2_format format;
+	/**
+	 * Does the work for highlight_color() and does not touch any Python
+	 * objects, so it can run without the GIL. The frame is split into bands
+	 * of rows, which are processed by nr_of_threads threads
+	 **/
+
+	COLOR_TABLE *table = color_table(cam, color_r, color_g, color_b, fuzziness);
+
+	workers_run(cam, highlight_color_tile, workers_tiles(cam->format.fmt.pix.height), table);
+	cam->pixels_touched += cam->format.fmt.pix.width * cam->format.fmt.pix.height;
+}
 
-	int width = format.fmt.pix.width;
-	int height = format.fmt.pix.height;
+void find_object(CAMERA *cam, COLOR_TABLE *table, int *ex, int *ey, WINDOW *window)
+{
 
-	int max_r = MAX(MAX((*ex), width - (*ex)), MAX((*ey), height - (*ey)));	
+	/**
+	Searches for a matching pixel in rings around (ex, ey), without leaving
+	the window. With motion_acquire, pixels that didn't change are skipped
+	**/
+
+	int max_r = window_radius(window, *ex, *ey);	
 	
 	int x, y, i;
 		
@@ -409,8 +968,8 @@ void find_object(int *color_r, int *color_g, int *color_b, int *fuzziness, int *
 			x = (*ex) + i;
 			y = (*ey) -r;
 			
-			if (x >= 0 && x < width && y >= 0 && y < height) {
-				if (matching_pixel(&x, &y, color_r, color_g, color_b, fuzziness)) {
+			if (in_window(window, x, y) && motion_allows(cam, x, y)) {
+				if (matching_pixel(cam, table, x, y)) {
 					(*ex) = x;
 					(*ey) = y;
 					return;
@@ -421,8 +980,8 @@ void find_object(int *color_r, int *color_g, int *color_b, int *fuzziness, int *
 			x = (*ex) + r;
 			y = (*ey) + i;
 
-			if (x >= 0 && x < width && y >= 0 && y < height) {
-				if (matching_pixel(&x, &y, color_r, color_g, color_b, fuzziness)) {
+			if (in_window(window, x, y) && motion_allows(cam, x, y)) {
+				if (matching_pixel(cam, table, x, y)) {
 					(*ex) = x;
 					(*ey) = y;
 					return;
@@ -433,8 +992,8 @@ void find_object(int *color_r, int *color_g, int *color_b, int *fuzziness, int *
 			x = (*ex) - i;
 			y = (*ey) + r;
 			
-			if (x >= 0 && x < width && y >= 0 && y < height) {
-				if (matching_pixel(&x, &y, color_r, color_g, color_b, fuzziness)) {
+			if (in_window(window, x, y) && motion_allows(cam, x, y)) {
+				if (matching_pixel(cam, table, x, y)) {
 					(*ex) = x;
 					(*ey) = y;
 					return;
@@ -445,8 +1004,8 @@ void find_object(int *color_r, int *color_g, int *color_b, int *fuzziness, int *
 			x = (*ex) - r;
 			y = (*ey) - i;
 			
-			if (x >= 0 && x < width && y >= 0 && y < height) {
-				if (matching_pixel(&x, &y, color_r, color_g, color_b, fuzziness)) {
+			if (in_window(window, x, y) && motion_allows(cam, x, y)) {
+				if (matching_pixel(cam, table, x, y)) {
 					(*ex) = x;
 					(*ey) = y;
 					return;
@@ -464,22 +1023,96 @@ void find_object(int *color_r, int *color_g, int *color_b, int *fuzziness, int *
 
 }
 
-SCAN spiral_scan(int ex, int ey, int *color_r, int *color_g, int *color_b, int *fuzziness)
+int block_matches(CAMERA *cam, COLOR_TABLE *table, int cx, int cy, int size, WINDOW *window)
+{
+
+	/**
+	Returns the number of matching pixels in a block around (cx, cy)
+	**/
+
+	int left = MAX(window->left, cx - size / 2);
+	int right = MIN(window->right, cx + size / 2 - 1);
+	int top = MAX(window->top, cy - size / 2);
+	int bottom = MIN(window->bottom, cy + size / 2 - 1);
+	int x, y, n = 0;
+
+	for (y = top; y <= bottom; y++) {
+		for (x = left; x <= right; x++) {
+			n += matching_pixel(cam, table, x, y);
+		}
+	}
+	return n;
+}
+
+void find_object_pyramid(CAMERA *cam, COLOR_TABLE *table, int *ex, int *ey, WINDOW *window)
+{
+
+	/**
+	Searches for a matching pixel in a coarse grid over the window, so that
+	only a fixed fraction of the pixels is checked, no matter how far away the
+	object is. A grid point only counts if the block around it contains
+	enough matching pixels at full resolution, so that stray pixels are
+	ignored. Of these, the grid point closest to (ex, ey) is chosen. With
+	motion_acquire, grid points that didn't change are skipped
+	**/
+
+	extern int acquire_step;
+
+	int step = MAX(2, acquire_step);
+	int min_hits = MAX(1, step * step / 8);
+	int x, y, best_x = -1, best_y = -1;
+	long d, best_d = -1;
+
+	for (y = window->top + step / 2; y <= window->bottom; y += step) {
+		for (x = window->left + step / 2; x <= window->right; x += step) {
+			if (!motion_allows(cam, x, y) || !matching_pixel(cam, table, x, y)) {
+				continue;
+			}
+			d = (long) (x - *ex) * (x - *ex) + (long) (y - *ey) * (y - *ey);
+			if (best_d >= 0 && d >= best_d) {
+				continue;
+			}
+			if (block_matches(cam, table, x, y, step, window) >= min_hits) {
+				best_x = x;
+				best_y = y;
+				best_d = d;
+			}
+		}
+	}
+
+	(*ex) = best_x;
+	(*ey) = best_y;
+}
+
+void acquire_object(CAMERA *cam, COLOR_TABLE *table, int *ex, int *ey, WINDOW *window)
+{
+
+	/**
+	Finds an object that is not at its predicted position, using the
+	strategy that is selected by acquire_mode
+	**/
+
+	extern short acquire_mode;
+
+	if (acquire_mode == ACQUIRE_PYRAMID) {
+		find_object_pyramid(cam, table, ex, ey, window);
+	} else {
+		find_object(cam, table, ex, ey, window);
+	}
+}
+
+SCAN spiral_scan(CAMERA *cam, int ex, int ey, COLOR_TABLE *table, WINDOW *window)
 {
 
 	/**
-	Scans the image in a spiral fashion until the target object is found
+	Scans the image in a spiral fashion until the target object is found.
+	Only pixels inside the window are scanned
 	**/
 
 	extern int min_z;	
-	extern short match[][MAX_RES_Y];
 	extern short size_mode;
-	extern struct v4l2_format format;
 
-	int width = format.fmt.pix.width;
-	int height = format.fmt.pix.height;	
-
-	short hit;
+	short hit = 1;
 	int sx = 0;
 	int sy = 0;
 	int x;
@@ -495,10 +1128,10 @@ SCAN spiral_scan(int ex, int ey, int *color_r, int *color_g, int *color_b, int *
 	
 	SCAN result;		
 		
-	if (matching_pixel(&ex, &ey, color_r, color_g, color_b, fuzziness)) { z++; }
+	if (in_window(window, ex, ey) && matching_pixel(cam, table, ex, ey)) { z++; }
 		
 	if (z == 0) {
-		find_object(color_r, color_g, color_b, fuzziness, &ex, &ey);
+		acquire_object(cam, table, &ex, &ey, window);
 	
 		if (ex == -1) {
 			result.x = -1;
@@ -508,7 +1141,7 @@ SCAN spiral_scan(int ex, int ey, int *color_r, int *color_g, int *color_b, int *
 		}
 	}
 
-	int max_r = MAX(MAX(ex, width - ex), MAX(ey, height - ey));	
+	int max_r = window_radius(window, ex, ey);	
 		
 	while ((hit || z < min_z) && r < max_r) {
 	
@@ -520,16 +1153,16 @@ SCAN spiral_scan(int ex, int ey, int *color_r, int *color_g, int *color_b, int *
 			x = ex + i;
 			y = ey -r;
 			
-			if (x >= 0 && x < width && y >= 0 && y < height) {
-				if (matching_pixel(&x, &y, color_r, color_g, color_b, fuzziness)) {
+			if (in_window(window, x, y)) {
+				if (matching_pixel(cam, table, x, y)) {
 					z++;
 					hit = 1;
 					sx += x;
 					sy += y;					
-					match[x][y] = 1;
+					cam->match[y * cam->match_width + x] = cam->match_stamp;
 					top = y;
 				} else {			
-					match[x][y] = -1;
+					cam->match[y * cam->match_width + x] = cam->match_stamp + 1;
 				}
 			}
 	
@@ -537,16 +1170,16 @@ SCAN spiral_scan(int ex, int ey, int *color_r, int *color_g, int *color_b, int *
 			x = ex + r;
 			y = ey + i;
 
-			if (x >= 0 && x < width && y >= 0 && y < height) {
-				if (matching_pixel(&x, &y, color_r, color_g, color_b, fuzziness)) {
+			if (in_window(window, x, y)) {
+				if (matching_pixel(cam, table, x, y)) {
 					z++;
 					hit = 1;
 					sx += x;
 					sy += y;					
-					match[x][y] = 1;
+					cam->match[y * cam->match_width + x] = cam->match_stamp;
 					right = x;
 				} else {			
-					match[x][y] = -1;
+					cam->match[y * cam->match_width + x] = cam->match_stamp + 1;
 				}
 			}
 					
@@ -554,16 +1187,16 @@ SCAN spiral_scan(int ex, int ey, int *color_r, int *color_g, int *color_b, int *
 			x = ex - i;
 			y = ey + r;
 			
-			if (x >= 0 && x < width && y >= 0 && y < height) {
-				if (matching_pixel(&x, &y, color_r, color_g, color_b, fuzziness)) {
+			if (in_window(window, x, y)) {
+				if (matching_pixel(cam, table, x, y)) {
 					z++;
 					hit = 1;
 					sx += x;
 					sy += y;
-					match[x][y] = 1;
+					cam->match[y * cam->match_width + x] = cam->match_stamp;
 					bottom = y;
 				} else {			
-					match[x][y] = -1;
+					cam->match[y * cam->match_width + x] = cam->match_stamp + 1;
 				}
 			}
 
@@ -571,16 +1204,16 @@ SCAN spiral_scan(int ex, int ey, int *color_r, int *color_g, int *color_b, int *
 			x = ex - r;
 			y = ey - i;
 			
-			if (x >= 0 && x < width && y >= 0 && y < height) {
-				if (matching_pixel(&x, &y, color_r, color_g, color_b, fuzziness)) {
+			if (in_window(window, x, y)) {
+				if (matching_pixel(cam, table, x, y)) {
 					z++;
 					hit = 1;
 					sx += x;
 					sy += y;
-					match[x][y] = 1;
+					cam->match[y * cam->match_width + x] = cam->match_stamp;
 					left = x;
 				} else {			
-					match[x][y] = -1;
+					cam->match[y * cam->match_width + x] = cam->match_stamp + 1;
 				}
 			}
 
@@ -588,6 +1221,12 @@ SCAN spiral_scan(int ex, int ey, int *color_r, int *color_g, int *color_b, int *
 				
 		r++;
 	}
+
+	// Remember which part of the match array has been scanned
+	cam->match_left = MAX(window->left, ex - r + 1);
+	cam->match_right = MIN(window->right, ex + r - 1);
+	cam->match_top = MAX(window->top, ey - r + 1);
+	cam->match_bottom = MIN(window->bottom, ey + r - 1);
 	
 	if (z >= min_z) {
 		result.x = sx / z;
@@ -608,63 +1247,562 @@ SCAN spiral_scan(int ex, int ey, int *color_r, int *color_g, int *color_b, int *
 	return result;
 }
 
-void track_object(int color_r, int color_g, int color_b, int fuzziness, int pre_x, int pre_y, int highlight)
+WINDOW frame_window(CAMERA *cam)
+{
+
+	/**
+	Returns a window that covers the entire frame
+	**/
+
+	WINDOW window;
+
+	window.left = 0;
+	window.top = 0;
+	window.right = cam->format.fmt.pix.width - 1;
+	window.bottom = cam->format.fmt.pix.height - 1;
+	return window;
+}
+
+void track_object(CAMERA *cam, int color_r, int color_g, int color_b, int fuzziness, int pre_x, int pre_y, int highlight)
+{
+
+	/**
+	Scans for an object. The GIL is released during the scan, so that the
+	communication threads and the GUI can run concurrently with tracking.
+	The tracking state belongs to the camera, so different cameras can be
+	tracked by different threads, but only one thread should track with a
+	single camera at a time
+	**/
+
+	Py_BEGIN_ALLOW_THREADS
+	track_object_kernel(cam, color_r, color_g, color_b, fuzziness, pre_x, pre_y, 0, 0, highlight);
+	Py_END_ALLOW_THREADS
+}
+
+void track_object_window(CAMERA *cam, int color_r, int color_g, int color_b, int fuzziness, int pre_x, int pre_y, int half_w, int half_h, int highlight)
+{
+
+	/**
+	Scans for an object, but only within half_w and half_h pixels of the
+	predicted position. Only if the object is not found there, the entire
+	frame is searched, in which case track_fallback is set
+	**/
+
+	Py_BEGIN_ALLOW_THREADS
+	track_object_kernel(cam, color_r, color_g, color_b, fuzziness, pre_x, pre_y, MAX(1, half_w), MAX(1, half_h), highlight);
+	Py_END_ALLOW_THREADS
+}
+
+int track_object_slice(CAMERA *cam, int color_r, int color_g, int color_b, int fuzziness, int pre_x, int pre_y, int half_w, int half_h, int cursor, int budget, int highlight)
+{
+
+	/**
+	Searches for a lost object, first around the predicted position and then,
+	checking only about budget pixels per call, in the rest of the frame, so
+	that the search is spread over several frames. Returns the position in
+	the search at which the next call should continue. See
+	track_object_slice_kernel()
+	**/
+
+	Py_BEGIN_ALLOW_THREADS
+	cursor = track_object_slice_kernel(cam, color_r, color_g, color_b, fuzziness, pre_x, pre_y, half_w, half_h, cursor, budget, highlight);
+	Py_END_ALLOW_THREADS
+	return cursor;
+}
+
+PyObject *track_objects(CAMERA *cam, PyObject *objects, int highlight)
+{
+
+	/**
+	Tracks all objects in the current frame with a single call. Objects is a
+	sequence of (r, g, b, fuzziness, pre_x, pre_y[, half_w, half_h[, budget,
+	cursor]]) tuples. If budget is positive, the object is searched for as
+	with track_object_slice(), in which case the window is optional,
+	otherwise, if half_w and half_h are positive, as with
+	track_object_window(), and otherwise as with track_object().
+	Returns a tuple with an (x, y, z, fallback, cursor) tuple for every
+	object, where cursor is the position at which a slice search should
+	continue, or -1 if the object was not searched for in slices
+	**/
+
+	TRACK_OBJECT o[MAX_TRACK_OBJECTS];
+
+	int nr_of_objects, i;
+	PyObject *item, *result;
+
+	if (!PySequence_Check(objects)) {
+		PyErr_SetString(PyExc_TypeError, "objects should be a sequence");
+		return NULL;
+	}
+
+	nr_of_objects = PySequence_Size(objects);
+	if (nr_of_objects > MAX_TRACK_OBJECTS) {
+		PyErr_SetString(PyExc_ValueError, "too many objects");
+		return NULL;
+	}
+
+	for (i = 0; i < nr_of_objects; i++) {
+		o[i].half_w = 0;
+		o[i].half_h = 0;
+		o[i].budget = 0;
+		o[i].cursor = -1;
+		item = PySequence_GetItem(objects, i);
+		if (item == NULL || !PyArg_ParseTuple(item, "iiiiii|iiii", &o[i].color_r, &o[i].color_g,
+			&o[i].color_b, &o[i].fuzziness, &o[i].pre_x, &o[i].pre_y, &o[i].half_w, &o[i].half_h,
+			&o[i].budget, &o[i].cursor)) {
+			Py_XDECREF(item);
+			return NULL;
+		}
+		Py_DECREF(item);
+	}
+
+	// The objects have been parsed, so the GIL is not needed for tracking
+	Py_BEGIN_ALLOW_THREADS
+	for (i = 0; i < nr_of_objects; i++) {
+		if (o[i].budget > 0) {
+			o[i].cursor = track_object_slice_kernel(cam, o[i].color_r, o[i].color_g, o[i].color_b,
+				o[i].fuzziness, o[i].pre_x, o[i].pre_y, MAX(0, o[i].half_w), MAX(0, o[i].half_h),
+				o[i].cursor, o[i].budget, highlight);
+		} else {
+			track_object_kernel(cam, o[i].color_r, o[i].color_g, o[i].color_b, o[i].fuzziness,
+				o[i].pre_x, o[i].pre_y, MAX(0, o[i].half_w), MAX(0, o[i].half_h), highlight);
+			o[i].cursor = -1;
+		}
+		o[i].x = cam->track_x;
+		o[i].y = cam->track_y;
+		o[i].z = cam->track_z;
+		o[i].fallback = cam->track_fallback;
+	}
+	Py_END_ALLOW_THREADS
+
+	result = PyTuple_New(nr_of_objects);
+	for (i = 0; i < nr_of_objects; i++) {
+		PyTuple_SET_ITEM(result, i, Py_BuildValue("(iiiii)", o[i].x, o[i].y, o[i].z,
+			o[i].fallback, o[i].cursor));
+	}
+
+	return result;
+}
+
+int track_object_slice_kernel(CAMERA *cam, int color_r, int color_g, int color_b, int fuzziness, int pre_x, int pre_y, int half_w, int half_h, int cursor, int budget, int highlight)
+{
+
+	/**
+	First looks for the object around the predicted position: in the window
+	of half_w by half_h pixels, as with track_object_window() but without
+	falling back to the entire frame, or, without a window, only if the
+	predicted pixel matches. If the object is not there, the coarse grid of
+	find_object_pyramid() is walked in raster order, starting at grid point
+	cursor, or at the row of the predicted position if cursor is negative,
+	until more than budget pixels have been touched. Of the grid points that
+	are confirmed, the one closest to the predicted position is tracked with
+	scan_window(), so that the scan mode is respected, in a window of the
+	same size around it, or in the entire frame without a window. Returns
+	the grid point at which the next call should continue. If the object
+	wasn't found, track_z is 0
+	**/
+
+	extern short scan_mode;
+	extern int acquire_step;
+
+	int width = cam->format.fmt.pix.width;
+	int height = cam->format.fmt.pix.height;
+	int step = MAX(2, acquire_step);
+	int min_hits = MAX(1, step * step / 8);
+	int columns = (width - 1 - step / 2) / step + 1;
+	int rows = (height - 1 - step / 2) / step + 1;
+	int n = columns * rows;
+	int ex = MAX(0, MIN(width - pre_x, width - 1));
+	int ey = MAX(0, MIN(pre_y, height - 1));
+	int i, k, x, y, best = -1;
+	long d, best_d = -1;
+	unsigned long start;
+
+	WINDOW window = frame_window(cam);
+	WINDOW roi;
+	COLOR_TABLE *table = color_table(cam, color_r, color_g, color_b, fuzziness);
+	SCAN result;
+
+	cam->track_fallback = 0;
+	result.count = 0;
+	match_invalidate(cam);
+
+	if (half_w > 0 && half_h > 0) {
+		roi.left = MAX(window.left, ex - half_w);
+		roi.right = MIN(window.right, ex + half_w);
+		roi.top = MAX(window.top, ey - half_h);
+		roi.bottom = MIN(window.bottom, ey + half_h);
+		result = scan_window(cam, ex, ey, table, &roi);
+	} else if (matching_pixel(cam, table, ex, ey)) {
+		result = scan_window(cam, ex, ey, table, &window);
+	}
+
+	if (result.count == 0) {
+
+		if (cursor < 0) {
+			cursor = MIN(rows - 1, ey / step) * columns;
+		}
+		cursor %= n;
+
+		start = cam->pixels_touched;
+		for (k = 0; k < n && cam->pixels_touched - start < budget; k++) {
+			i = (cursor + k) % n;
+			x = step / 2 + (i % columns) * step;
+			y = step / 2 + (i / columns) * step;
+			if (!motion_allows(cam, x, y) || !matching_pixel(cam, table, x, y)) {
+				continue;
+			}
+			d = (long) (x - ex) * (x - ex) + (long) (y - ey) * (y - ey);
+			if (best_d >= 0 && d >= best_d) {
+				continue;
+			}
+			if (block_matches(cam, table, x, y, step, &window) >= min_hits) {
+				best = i;
+				best_d = d;
+			}
+		}
+		cursor = (cursor + k) % n;
+
+		if (best >= 0) {
+			x = step / 2 + (best % columns) * step;
+			y = step / 2 + (best / columns) * step;
+			if (half_w > 0 && half_h > 0) {
+				roi.left = MAX(window.left, x - half_w);
+				roi.right = MIN(window.right, x + half_w);
+				roi.top = MAX(window.top, y - half_h);
+				roi.bottom = MIN(window.bottom, y + half_h);
+			} else {
+				roi = window;
+			}
+			match_invalidate(cam);
+			result = scan_window(cam, x, y, table, &roi);
+			cursor = best;
+		}
+	}
+
+	if (result.count == 0) {
+		cam->track_x = width;
+		cam->track_y = 0;
+		cam->track_z = 0;
+		return cursor;
+	}
+
+	if (highlight && scan_mode == SCAN_COMPONENTS) {
+		component_highlight(cam);
+	} else if (highlight) {
+		track_highlight(cam);
+	}
+
+	cam->track_x = MAX(0, MIN(width - result.x, width));
+	cam->track_y = MAX(0, MIN(result.y, height));
+	cam->track_z = result.count;
+	return cursor;
+}
+
+void track_highlight_tile(CAMERA *cam, int tile, int nr_of_tiles, void *arg)
+{
+
+	/**
+	Highlights a band of rows of the region that was scanned last. Each row
+	is walked left to right, so the match array and the frame are both read
+	contiguously
+	**/
+
+	int rows = cam->match_bottom - cam->match_top + 1;
+	int top = cam->match_top + tile * rows / nr_of_tiles;
+	int bottom = cam->match_top + (tile + 1) * rows / nr_of_tiles;
+	int left = cam->match_left;
+	int right = cam->match_right;
+	unsigned char stamp = cam->match_stamp;
+	unsigned char *row, *px;
+	int x, y;
+
+	for (y = top; y < bottom; y++) {
+		row = cam->match + y * cam->match_width;
+		if (cam->pixel_format != PIXEL_RGB24) {
+			for (x = left; x <= right; x++) {
+				if (row[x] == stamp || row[x] == stamp + 1) {
+					highlight_pixel(cam, x, y, row[x] == stamp);
+				}
+			}
+			continue;
+		}
+		px = cam->frame + y * cam->format.fmt.pix.bytesperline + left * cam->bytesperpx;
+		for (x = left; x <= right; x++, px += cam->bytesperpx) {
+			if (row[x] == stamp) {
+				px[1] = 255;
+			} else if (row[x] == stamp + 1) {
+				px[0] = 255;
+			}
+		}
+	}
+}
+
+void track_highlight(CAMERA *cam)
 {
 
 	/**
-	Scans for an object
+	Highlights the region of the match array that was scanned last
+	**/
+
+	workers_run(cam, track_highlight_tile, workers_tiles(cam->match_bottom - cam->match_top + 1), NULL);
+}
+
+SCAN scan_window(CAMERA *cam, int ex, int ey, COLOR_TABLE *table, WINDOW *window)
+{
+
+	/**
+	Scans the window for the object that is closest to (ex, ey), using
+	connected components in SCAN_COMPONENTS mode and a spiral otherwise
+	**/
+
+	extern short scan_mode;
+
+	if (scan_mode == SCAN_COMPONENTS) {
+		return component_scan(cam, ex, ey, table, window);
+	}
+	return spiral_scan(cam, ex, ey, table, window);
+}
+
+void track_object_kernel(CAMERA *cam, int color_r, int color_g, int color_b, int fuzziness, int pre_x, int pre_y, int half_w, int half_h, int highlight)
+{
+
+	/**
+	Does the work for track_object() and track_object_window() and does not
+	touch any Python objects, so it can run without the GIL. If half_w and
+	half_h are 0, the entire frame is scanned
 	**/
 
-	extern short match[][MAX_RES_Y];
 	extern short scan_mode;	
-	extern short match_mode;
-	extern int track_x;
-	extern int track_y;	
-	extern int track_z;	
-	extern struct v4l2_format format;
-	extern int bytesperpx;
-	extern unsigned char *frame;		
-
-	int width = format.fmt.pix.width;
-	int height = format.fmt.pix.height;		
-	
-	int x, y, d, r, g, b;
-	double avg_x, avg_y, avg_z;
-	
-	if (match_mode == MATCH_REL) {	
-		int avg_col = (color_r + color_g + color_b) / 3;
-		color_r = color_r - avg_col;
-		color_g = color_g - avg_col;
-		color_b = color_b - avg_col;
-	}	
+
+	int width = cam->format.fmt.pix.width;
+	int height = cam->format.fmt.pix.height;		
 	
-	avg_x = 0;
-	avg_y = 0;
-	avg_z = 0;
+	COLOR_TABLE *table = color_table(cam, color_r, color_g, color_b, fuzziness);
 	
 	int ex = MAX(0, MIN(width - pre_x, width));
 	int ey = MAX(0, MIN(pre_y, height));
 	
-	memset(match, 0, MAX_RES_X * MAX_RES_Y * sizeof(short));	
+	WINDOW window = frame_window(cam);
+	SCAN result;
+
+	match_invalidate(cam);
+	cam->track_fallback = 0;
+
+	if (half_w > 0 && half_h > 0) {
+		WINDOW roi;
+		roi.left = MAX(window.left, ex - half_w);
+		roi.right = MIN(window.right, ex + half_w);
+		roi.top = MAX(window.top, ey - half_h);
+		roi.bottom = MIN(window.bottom, ey + half_h);
+		result = scan_window(cam, ex, ey, table, &roi);
+
+		// Fall back to the entire frame if the object is not in the window
+		if (result.count == 0) {
+			cam->track_fallback = 1;
+			match_invalidate(cam);
+			result = scan_window(cam, ex, ey, table, &window);
+		}
+	} else {
+		result = scan_window(cam, ex, ey, table, &window);
+	}
+
+	// Only the scanned region can contain pixels with the current stamp. The
+	// components are highlighted from their labels
+	if (highlight && scan_mode == SCAN_COMPONENTS) {
+		component_highlight(cam);
+	} else if (highlight) {
+		track_highlight(cam);
+	}
+	
+	cam->track_x = MAX(0, MIN(width - result.x, width));
+	cam->track_y = MAX(0, MIN(result.y, height));
+	cam->track_z = result.count;
 	
-	SCAN result = spiral_scan(ex, ey, &color_r, &color_g, &color_b, &fuzziness);
+}
+
+short label_at(CAMERA *cam, int x, int y)
+{
+
+	/**
+	Returns the label at the specified coordinates
+	**/
+
+	return cam->labels[y * cam->format.fmt.pix.width + x];
+}
+
+void label_scan_tile(CAMERA *cam, int tile, int nr_of_tiles, void *arg)
+{
 
-	if (highlight) {
-		long offset;
+	/**
+	Labels a band of rows and collects the sums for this band only
+	**/
+
+	LABEL_JOB *job = arg;
+	LABEL_SUMS *sums = job->sums[tile];
+	short rgb24 = cam->pixel_format == PIXEL_RGB24;
+	unsigned int key;
+	int width = cam->format.fmt.pix.width;
+	int height = cam->format.fmt.pix.height;
+	int bpl = cam->format.fmt.pix.bytesperline;
+	int top = tile * height / nr_of_tiles;
+	int bottom = (tile + 1) * height / nr_of_tiles;
+	int i, x, y;
+	unsigned char *px;
+
+	for (i = 0; i <= job->nr_of_objects; i++) {
+		sums[i].sx = 0;
+		sums[i].sy = 0;
+		sums[i].count = 0;
+		sums[i].left = width;
+		sums[i].right = -1;
+		sums[i].top = height;
+		sums[i].bottom = -1;
+	}
+
+	for (y = top; y < bottom; y++) {
+		px = cam->frame + y * bpl;
 		for (x = 0; x < width; x++) {
-			for (y = 0; y < height; y++) {
-				offset = x * bytesperpx + y * format.fmt.pix.bytesperline;
-				if (match[x][y] == 1) {
-					frame[offset + 1] = 255;
-				} else if (match[x][y] == -1) {
-					frame[offset] = 255;
+			unsigned char label = 0;
+			key = rgb24 ? (px[0] << 16) | (px[1] << 8) | px[2] : frame_key(cam, cam->frame, x, y);
+			for (i = 0; i < job->nr_of_objects; i++) {
+				if (table_bit(job->tables[i], key)) {
+					label = i + 1;
+					break;
+				}
+			}
+			cam->labels[y * width + x] = label;
+			if (label) {
+				LABEL_SUMS *s = &sums[label];
+				s->sx += x;
+				s->sy += y;
+				s->count++;
+				s->left = MIN(s->left, x);
+				s->right = MAX(s->right, x);
+				s->top = MIN(s->top, y);
+				s->bottom = MAX(s->bottom, y);
+
+				// Only matching pixels are highlighted, because otherwise the
+				// entire frame would be marked as scanned
+				if (job->highlight && rgb24) {
+					px[1] = 255;
+				} else if (job->highlight) {
+					highlight_pixel(cam, x, y, 1);
 				}
 			}
+			px += cam->bytesperpx;
 		}
 	}
-	
-	track_x = MAX(0, MIN(width - result.x, width));
-	track_y = MAX(0, MIN(result.y, height));
-	track_z = result.count;
-	
+}
+
+void label_scan(CAMERA *cam, COLOR_TABLE **tables, int nr_of_objects, int highlight, LABEL_SUMS *sums)
+{
+
+	/**
+	Classifies every pixel once against all tables and assigns it to the
+	first table that it matches. The sums for table i are collected in
+	sums[i + 1], while sums[0] is used for unlabeled pixels. The frame is
+	split into bands of rows, which are labeled by nr_of_threads threads, and
+	the sums of the bands are merged afterwards
+	**/
+
+	int width = cam->format.fmt.pix.width;
+	int height = cam->format.fmt.pix.height;
+	int nr_of_tiles = workers_tiles(height);
+	int i, tile;
+	LABEL_JOB job;
+
+	job.tables = tables;
+	job.nr_of_objects = nr_of_objects;
+	job.highlight = highlight;
+	workers_run(cam, label_scan_tile, nr_of_tiles, &job);
+
+	for (i = 0; i <= nr_of_objects; i++) {
+		sums[i] = job.sums[0][i];
+		for (tile = 1; tile < nr_of_tiles; tile++) {
+			LABEL_SUMS *s = &job.sums[tile][i];
+			sums[i].sx += s->sx;
+			sums[i].sy += s->sy;
+			sums[i].count += s->count;
+			sums[i].left = MIN(sums[i].left, s->left);
+			sums[i].right = MAX(sums[i].right, s->right);
+			sums[i].top = MIN(sums[i].top, s->top);
+			sums[i].bottom = MAX(sums[i].bottom, s->bottom);
+		}
+	}
+	cam->pixels_touched += width * height;
+}
+
+PyObject *label_objects(CAMERA *cam, PyObject *objects, int highlight)
+{
+
+	/**
+	Tracks all objects, which is a list of (r, g, b, fuzziness) tuples, in a
+	single pass over the frame, after which the position and size of every
+	object follow from the labeled pixels. Returns a list with an (x, y, z)
+	tuple for every object, which correspond to track_x, track_y and track_z
+	of track_object()
+	**/
+
+	extern short size_mode;
+	extern int min_z;
+
+	int width = cam->format.fmt.pix.width;
+	int height = cam->format.fmt.pix.height;
+
+	COLOR_TABLE *tables[MAX_LABEL_OBJECTS];
+	LABEL_SUMS sums[MAX_LABEL_OBJECTS + 1];
+	int nr_of_objects, i, z;
+	int color_r[MAX_LABEL_OBJECTS], color_g[MAX_LABEL_OBJECTS];
+	int color_b[MAX_LABEL_OBJECTS], fuzziness[MAX_LABEL_OBJECTS];
+	PyObject *item, *result;
+
+	if (!PySequence_Check(objects)) {
+		PyErr_SetString(PyExc_TypeError, "objects should be a sequence");
+		return NULL;
+	}
+
+	nr_of_objects = PySequence_Size(objects);
+	if (nr_of_objects > MAX_LABEL_OBJECTS) {
+		PyErr_SetString(PyExc_ValueError, "too many objects");
+		return NULL;
+	}
+
+	for (i = 0; i < nr_of_objects; i++) {
+		item = PySequence_GetItem(objects, i);
+		if (item == NULL || !PyArg_ParseTuple(item, "iiii", &color_r[i], &color_g[i], &color_b[i], &fuzziness[i])) {
+			Py_XDECREF(item);
+			return NULL;
+		}
+		Py_DECREF(item);
+	}
+
+	// The objects have been parsed, so the GIL is not needed for the scan.
+	// There are at least as many color tables as objects, so looking up a
+	// table never evicts the table of an earlier object
+	Py_BEGIN_ALLOW_THREADS
+	for (i = 0; i < nr_of_objects; i++) {
+		tables[i] = color_table(cam, color_r[i], color_g[i], color_b[i], fuzziness[i]);
+	}
+	label_scan(cam, tables, nr_of_objects, highlight, sums);
+	Py_END_ALLOW_THREADS
+
+	result = PyList_New(nr_of_objects);
+	for (i = 0; i < nr_of_objects; i++) {
+		LABEL_SUMS *s = &sums[i + 1];
+		if (s->count == 0 || s->count < min_z) {
+			item = Py_BuildValue("(iii)", width, 0, 0);
+		} else {
+			if (size_mode == SIZE_SURFACE) {
+				z = s->count;
+			} else {
+				z = (s->right - s->left) + (s->bottom - s->top);
+			}
+			item = Py_BuildValue("(iii)", MAX(0, MIN(width - (int) (s->sx / s->count), width)),
+				MAX(0, MIN((int) (s->sy / s->count), height)), z);
+		}
+		PyList_SET_ITEM(result, i, item);
+	}
+
+	return result;
 }
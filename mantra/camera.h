@@ -0,0 +1,623 @@
+#ifndef CAMERA_H
+#define CAMERA_H
+
+#include <stdio.h>
+#include <pthread.h>
+#include <linux/videodev2.h>
+#include <Python.h>
+
+#define MIN(a,b) ((a)>(b)?(b):(a))
+#define MAX(a,b) ((a)<(b)?(b):(a))
+
+// Some constants
+#define MATCH_ABS		0
+#define MATCH_REL		1
+#define SIZE_SURFACE	0
+
+// Newer C libraries define SIZE_WIDTH in stdint.h as the width of size_t,
+// which isn't used here
+#ifdef SIZE_WIDTH
+#undef SIZE_WIDTH
+#endif
+#define SIZE_WIDTH		1
+#define SCAN_BLOCK		0
+#define SCAN_SPIRAL		1
+#define SCAN_LABEL		2
+#define SCAN_WINDOW		3
+#define SCAN_COMPONENTS	4
+
+// How objects are found if they are not at the predicted position
+#define ACQUIRE_SPIRAL	0
+#define ACQUIRE_PYRAMID	1
+
+// The size of the blocks of the background model
+#define BACKGROUND_BLOCK	8
+
+// The maximum number of objects that can be labeled in a single pass
+#define MAX_LABEL_OBJECTS	16
+
+// The maximum number of objects that can be passed to track_objects()
+#define MAX_TRACK_OBJECTS	16
+
+// The sources from which frames can be obtained
+#define SOURCE_V4L2			0
+#define SOURCE_SYNTHETIC	1
+#define SOURCE_FILE			2
+
+// The kernels that can be benchmarked
+#define BENCH_TRACK_OBJECT		0
+#define BENCH_SPIRAL_SCAN		1
+#define BENCH_FIND_OBJECT		2
+#define BENCH_MATCHING_PIXEL	3
+#define BENCH_HIGHLIGHT_COLOR	4
+#define BENCH_LABEL_SCAN		5
+#define BENCH_TRACK_WINDOW		6
+#define BENCH_COMPONENT_SCAN	7
+#define BENCH_FIND_PYRAMID		8
+#define BENCH_TRACK_SLICE		9
+#define BENCH_TRACK_HIGHLIGHT	10
+
+// The pixel formats in which frames can be captured. With PIXEL_AUTO, the
+// format that the camera delivers natively is used if possible
+#define PIXEL_AUTO		-1
+#define PIXEL_RGB24		0
+#define PIXEL_YUYV		1
+#define PIXEL_YUV420	2
+
+// How frames are obtained from the v4l2 buffers
+#define CAPTURE_COPY		0
+#define CAPTURE_INPLACE		1
+
+// Holds information tracking of an object
+typedef struct {
+	short keep_scanning;
+	double x;
+	double y;
+	int count;
+} SCAN;
+
+// A region of the frame, with inclusive bounds
+typedef struct {
+	int left;
+	int top;
+	int right;
+	int bottom;
+} WINDOW;
+
+// A connected component of matching pixels
+typedef struct {
+	int area;
+	long sx;
+	long sy;
+	int left;
+	int top;
+	int right;
+	int bottom;
+} COMPONENT;
+
+// The partial sums that are collected for every label
+typedef struct {
+	long sx;
+	long sy;
+	int count;
+	int left;
+	int right;
+	int top;
+	int bottom;
+} LABEL_SUMS;
+
+// An object as passed to track_objects(), and the result of tracking it
+typedef struct {
+	int color_r;
+	int color_g;
+	int color_b;
+	int fuzziness;
+	int pre_x;
+	int pre_y;
+	int half_w;
+	int half_h;
+	int budget;
+	int cursor;
+	int x;
+	int y;
+	int z;
+	int fallback;
+} TRACK_OBJECT;
+
+// The number of color tables that are kept and the size of a single table,
+// which holds one bit for every RGB triple. Every object that is passed to
+// track_objects() needs its own table, otherwise the tables are rebuilt for
+// every frame
+#define MAX_COLOR_TABLES	MAX_TRACK_OBJECTS
+#define COLOR_TABLE_SIZE	(1 << 21)
+
+// label_objects() holds the tables of all objects during a single pass, so
+// none of them should be evicted while the others are looked up
+#if MAX_COLOR_TABLES < MAX_LABEL_OBJECTS
+#error "MAX_COLOR_TABLES should be at least MAX_LABEL_OBJECTS"
+#endif
+
+// A precomputed classification of all colors for a color, fuzziness, match
+// mode and pixel format, so that matching a pixel is a single lookup. For the
+// YUV formats, the table is indexed by YUV triples
+typedef struct {
+	int color_r;
+	int color_g;
+	int color_b;
+	int fuzziness;
+	short match_mode;
+	short pixel_format;
+	unsigned int last_used;
+	unsigned char *bits;
+} COLOR_TABLE;
+
+// How the capture thread hands frames to the tracker when the tracker cannot
+// keep up: either every frame is processed, or older frames are dropped so
+// that the tracker always gets the newest frame
+#define CAPTURE_EVERY		0
+#define CAPTURE_NEWEST		1
+
+// The maximum number of frames that the capture thread can queue
+#define MAX_CAPTURE_QUEUE	8
+
+// A slot is being filled, waiting in the queue or being processed, so the
+// queue needs two slots more than it can hold
+#define MAX_CAPTURE_SLOTS	(MAX_CAPTURE_QUEUE + 2)
+
+// A captured frame. The data either points to the own buffer of the slot or,
+// when a v4l2 frame is processed in place, to the driver buffer with the
+// given index, which is held until the slot is released
+typedef struct {
+	unsigned char *data;
+	unsigned char *own;
+	int index;
+	double timestamp;
+	unsigned int sequence;
+} FRAME_SLOT;
+
+typedef struct camera CAMERA;
+
+// A frame source provides the frames that are used for tracking. The init
+// function negotiates the format, grab puts a new image in a slot (returning
+// 0 if no frame was available), release gives a slot back to the source and
+// close releases everything that init acquired.
+typedef struct {
+	void (*init)(CAMERA *cam, char *device, int width, int height);
+	short (*grab)(CAMERA *cam, FRAME_SLOT *slot);
+	void (*release)(CAMERA *cam, FRAME_SLOT *slot);
+	void (*close)(CAMERA *cam);
+} FRAME_SOURCE;
+
+extern FRAME_SOURCE v4l2_source;
+extern FRAME_SOURCE synthetic_source;
+extern FRAME_SOURCE file_source;
+
+// The maximum number of tiles in which a frame is split
+#define MAX_TILES		128
+
+// A job that processes one of nr_of_tiles tiles of a frame
+typedef void (*TILE_JOB)(CAMERA *cam, int tile, int nr_of_tiles, void *arg);
+
+// The tables and the per-tile sums for a label scan
+typedef struct {
+	COLOR_TABLE **tables;
+	int nr_of_objects;
+	int highlight;
+	LABEL_SUMS sums[MAX_TILES][MAX_LABEL_OBJECTS + 1];
+} LABEL_JOB;
+
+// A v4l2 buffer
+typedef struct {
+	void *start;
+	size_t length;
+} BUFFER;
+
+// The maximum number of blobs drawn by the synthetic source
+#define MAX_BLOBS		16
+
+// A colored disc that moves across the synthetic frame
+typedef struct {
+	int r;
+	int g;
+	int b;
+	int radius;
+	double x;
+	double y;
+	double vx;
+	double vy;
+	double drawn_x;
+	double drawn_y;
+} BLOB;
+
+// Everything that belongs to a single camera: the source and its buffers,
+// the capture thread, the current frame, the arrays that are used while
+// tracking and the results of the last scan. Every function that works on a
+// camera takes its context, so that several cameras can be used at once, each
+// from its own thread. The settings (match_mode, scan_mode, etc.) are shared
+// by all cameras
+struct camera {
+
+	// The source that is used to obtain frames and its state
+	short source_mode;
+	FRAME_SOURCE *source;
+	int fd;
+	BUFFER *buffers;
+	int nr_of_buffers_allocated;
+	BLOB blobs[MAX_BLOBS];
+	int nr_of_blobs;
+	int synthetic_frame_nr;
+	FILE *replay_fp;
+	int replay_frame_nr;
+
+	// The negotiated format and the current frame, and the frame converted to
+	// RGB24 for frames in other formats
+	struct v4l2_format format;
+	short pixel_format;
+	int bytesperpx;
+	unsigned char *frame;
+	unsigned char *display;
+	size_t display_size;
+
+	// The frame slots, the queue of captured frames (slot numbers, oldest
+	// first) and the capture thread
+	FRAME_SLOT slots[MAX_CAPTURE_SLOTS];
+	short slot_busy[MAX_CAPTURE_SLOTS];
+	int nr_of_slots;
+	int current_slot;
+	int queue[MAX_CAPTURE_SLOTS];
+	int queue_head;
+	int queue_length;
+	int queue_limit;
+	pthread_t capture_thread;
+	pthread_mutex_t capture_lock;
+	pthread_cond_t frame_queued;
+	pthread_cond_t frame_taken;
+	short capture_running;
+
+	// The timestamp (in seconds) and the sequence number of the current frame
+	// and the number of frames that were dropped because the tracker was too
+	// slow
+	double frame_timestamp;
+	unsigned int frame_sequence;
+	unsigned long frames_dropped;
+
+	// The match array holds information about matching pixels in the image,
+	// row by row like the frame (pixel x, y is at y * match_width + x).
+	// Rather than clearing it for every object, each scan uses a new stamp: a
+	// pixel matched if it holds match_stamp, did not match if it holds
+	// match_stamp + 1 and has not been scanned otherwise. The array is only
+	// cleared when the stamp wraps around. In SCAN_LABEL mode, the label
+	// array holds for every pixel (also row by row) the number of the first
+	// object that it matched (starting at 1), or 0 if it didn't match any
+	// object. Both are allocated for the resolution of the camera. The bounds
+	// are those of the region that has been scanned with the current stamp
+	unsigned char *match;
+	unsigned char match_stamp;
+	int match_width;
+	unsigned char *labels;
+	int match_left;
+	int match_right;
+	int match_top;
+	int match_bottom;
+
+	// The buffers of the connected component labeling and the components that
+	// were found in component_window by the last scan
+	int *component_labels;
+	int *component_parent;
+	int component_capacity;
+	WINDOW component_window;
+	COMPONENT *components;
+	int nr_of_components;
+	int components_allocated;
+
+	// The background model, the blocks that changed in the current frame and
+	// the mask that is used for the search
+	unsigned short *background;
+	unsigned char *background_changed;
+	unsigned char *background_mask;
+	int background_columns;
+	int background_rows;
+	int background_frames;
+	short background_ready;
+
+	// The color tables that have been built so far
+	COLOR_TABLE color_tables[MAX_COLOR_TABLES];
+	unsigned int color_table_clock;
+
+	// The result of the last scan, which is mirrored horizontally, whether
+	// track_object_window() had to search the entire frame, and the number of
+	// pixels that have been compared to a color
+	int track_x;
+	int track_y;
+	int track_z;
+	short track_fallback;
+	unsigned long pixels_touched;
+
+	// The pixel that was read by camera_get_px()
+	unsigned int r, g, b;
+};
+
+CAMERA *camera_new(void);
+void camera_delete(CAMERA *cam);
+
+int workers_tiles(int size);
+void workers_run(CAMERA *cam, TILE_JOB job, int nr_of_tiles, void *arg);
+
+void camera_set_rgb_format(CAMERA *cam, int width, int height);
+void camera_set_pixel_format(CAMERA *cam, int width, int height, short fmt);
+unsigned char *camera_rgb_frame(CAMERA *cam);
+PyObject *camera_display_buffer(CAMERA *cam);
+
+double capture_clock(void);
+void capture_init(CAMERA *cam);
+void capture_destroy(CAMERA *cam);
+void capture_start(CAMERA *cam);
+void capture_next(CAMERA *cam);
+void capture_stop(CAMERA *cam);
+double camera_frame_age(CAMERA *cam);
+
+void background_reset(CAMERA *cam);
+void background_free(CAMERA *cam);
+void background_update(CAMERA *cam);
+short background_mask_at(CAMERA *cam, int x, int y);
+
+void camera_init(CAMERA *cam, char *device, int width, int height);
+void camera_close(CAMERA *cam);
+void camera_capture(CAMERA *cam);
+void camera_get_px(CAMERA *cam, int x, int y);
+void camera_put_px(CAMERA *cam, int x, int y);
+void camera_save_frame(CAMERA *cam, char *fname);
+void camera_append_frame(CAMERA *cam, char *fname);
+PyObject *camera_to_string(CAMERA *cam);
+PyObject *camera_frame_buffer(CAMERA *cam, int writable);
+int camera_get_control(CAMERA *cam, int id);
+void camera_set_control(CAMERA *cam, int id, int value);
+int camera_control_available(CAMERA *cam, int id);
+int camera_get_width(CAMERA *cam);
+int camera_get_height(CAMERA *cam);
+short match_at(CAMERA *cam, int x, int y);
+void match_alloc(CAMERA *cam);
+void match_free(CAMERA *cam);
+void match_invalidate(CAMERA *cam);
+int color_match(int a, int b, int c, int d, int e, int f, int fuzziness);
+void highlight_color(CAMERA *cam, int color_r, int color_g, int color_b, int fuzziness);
+void highlight_color_kernel(CAMERA *cam, int color_r, int color_g, int color_b, int fuzziness);
+void track_object(CAMERA *cam, int color_r, int color_g, int color_b, int fuzziness, int pre_x, int pre_y, int highlight);
+void track_object_window(CAMERA *cam, int color_r, int color_g, int color_b, int fuzziness, int pre_x, int pre_y, int half_w, int half_h, int highlight);
+void track_object_kernel(CAMERA *cam, int color_r, int color_g, int color_b, int fuzziness, int pre_x, int pre_y, int half_w, int half_h, int highlight);
+int track_object_slice(CAMERA *cam, int color_r, int color_g, int color_b, int fuzziness, int pre_x, int pre_y, int half_w, int half_h, int cursor, int budget, int highlight);
+int track_object_slice_kernel(CAMERA *cam, int color_r, int color_g, int color_b, int fuzziness, int pre_x, int pre_y, int half_w, int half_h, int cursor, int budget, int highlight);
+void track_highlight(CAMERA *cam);
+WINDOW frame_window(CAMERA *cam);
+COLOR_TABLE *color_table(CAMERA *cam, int color_r, int color_g, int color_b, int fuzziness);
+void color_table_build(CAMERA *cam, COLOR_TABLE *table, int color_r, int color_g, int color_b, int fuzziness);
+void color_table_prepare(CAMERA *cam, int color_r, int color_g, int color_b, int fuzziness);
+void color_tables_free(CAMERA *cam);
+void find_object(CAMERA *cam, COLOR_TABLE *table, int *ex, int *ey, WINDOW *window);
+void find_object_pyramid(CAMERA *cam, COLOR_TABLE *table, int *ex, int *ey, WINDOW *window);
+int block_matches(CAMERA *cam, COLOR_TABLE *table, int cx, int cy, int size, WINDOW *window);
+void acquire_object(CAMERA *cam, COLOR_TABLE *table, int *ex, int *ey, WINDOW *window);
+SCAN spiral_scan(CAMERA *cam, int ex, int ey, COLOR_TABLE *table, WINDOW *window);
+SCAN component_scan(CAMERA *cam, int ex, int ey, COLOR_TABLE *table, WINDOW *window);
+SCAN scan_window(CAMERA *cam, int ex, int ey, COLOR_TABLE *table, WINDOW *window);
+void component_find_all(CAMERA *cam, COLOR_TABLE *table, WINDOW *window);
+void component_highlight(CAMERA *cam);
+void component_free(CAMERA *cam);
+PyObject *object_components(CAMERA *cam, int color_r, int color_g, int color_b, int fuzziness, int highlight);
+short label_at(CAMERA *cam, int x, int y);
+void label_scan(CAMERA *cam, COLOR_TABLE **tables, int nr_of_objects, int highlight, LABEL_SUMS *sums);
+PyObject *label_objects(CAMERA *cam, PyObject *objects, int highlight);
+PyObject *track_objects(CAMERA *cam, PyObject *objects, int highlight);
+
+PyObject *camera_benchmark(CAMERA *cam, int kernel, int n, PyObject *objects);
+
+static inline int clip_byte(int v)
+{
+	return v < 0 ? 0 : (v > 255 ? 255 : v);
+}
+
+static inline unsigned int yuv_to_rgb(unsigned int yuv)
+{
+
+	/**
+	Converts a packed YUV triple to a packed RGB triple (BT.601, limited
+	range, which is what webcams deliver)
+	**/
+
+	int c = (int) (yuv >> 16) - 16;
+	int d = (int) ((yuv >> 8) & 255) - 128;
+	int e = (int) (yuv & 255) - 128;
+
+	return (clip_byte((298 * c + 409 * e + 128) >> 8) << 16)
+		| (clip_byte((298 * c - 100 * d - 208 * e + 128) >> 8) << 8)
+		| clip_byte((298 * c + 516 * d + 128) >> 8);
+}
+
+static inline unsigned int rgb_to_yuv(unsigned int rgb)
+{
+
+	/**
+	Converts a packed RGB triple to a packed YUV triple
+	**/
+
+	int r = rgb >> 16;
+	int g = (rgb >> 8) & 255;
+	int b = rgb & 255;
+
+	return (clip_byte(((66 * r + 129 * g + 25 * b + 128) >> 8) + 16) << 16)
+		| (clip_byte(((-38 * r - 74 * g + 112 * b + 128) >> 8) + 128) << 8)
+		| clip_byte(((112 * r - 94 * g - 18 * b + 128) >> 8) + 128);
+}
+
+static inline unsigned int frame_key(CAMERA *cam, unsigned char *data, int x, int y)
+{
+
+	/**
+	Returns the pixel at the specified coordinates as a packed triple, which
+	is RGB for RGB24 frames and YUV otherwise
+	**/
+
+	int bpl = cam->format.fmt.pix.bytesperline;
+	unsigned char *px, *u, *v;
+
+	switch (cam->pixel_format) {
+		case PIXEL_YUYV:
+			px = data + y * bpl + (x & ~1) * 2;
+			return (px[(x & 1) * 2] << 16) | (px[1] << 8) | px[3];
+		case PIXEL_YUV420:
+			u = data + bpl * cam->format.fmt.pix.height;
+			v = u + (bpl / 2) * (cam->format.fmt.pix.height / 2);
+			px = data + y * bpl + x;
+			return (px[0] << 16) | (u[(y / 2) * (bpl / 2) + x / 2] << 8) | v[(y / 2) * (bpl / 2) + x / 2];
+		default:
+			px = data + x * cam->bytesperpx + y * bpl;
+			return (px[0] << 16) | (px[1] << 8) | px[2];
+	}
+}
+
+static inline int frame_luma(CAMERA *cam, unsigned char *data, int x, int y)
+{
+
+	/**
+	Returns the brightness of a pixel
+	**/
+
+	unsigned int key = frame_key(cam, data, x, y);
+
+	if (cam->pixel_format != PIXEL_RGB24) {
+		return key >> 16;
+	}
+	return (77 * (key >> 16) + 150 * ((key >> 8) & 0xff) + 29 * (key & 0xff)) >> 8;
+}
+
+static inline void frame_put_key(CAMERA *cam, unsigned char *data, int x, int y, unsigned int key)
+{
+
+	/**
+	Writes a packed triple in the format of the frame. For the YUV formats,
+	the chroma is shared with the neighbouring pixels
+	**/
+
+	int bpl = cam->format.fmt.pix.bytesperline;
+	unsigned char *px, *u, *v;
+
+	switch (cam->pixel_format) {
+		case PIXEL_YUYV:
+			px = data + y * bpl + (x & ~1) * 2;
+			px[(x & 1) * 2] = key >> 16;
+			px[1] = (key >> 8) & 255;
+			px[3] = key & 255;
+			break;
+		case PIXEL_YUV420:
+			u = data + bpl * cam->format.fmt.pix.height;
+			v = u + (bpl / 2) * (cam->format.fmt.pix.height / 2);
+			data[y * bpl + x] = key >> 16;
+			u[(y / 2) * (bpl / 2) + x / 2] = (key >> 8) & 255;
+			v[(y / 2) * (bpl / 2) + x / 2] = key & 255;
+			break;
+		default:
+			px = data + x * cam->bytesperpx + y * bpl;
+			px[0] = key >> 16;
+			px[1] = (key >> 8) & 255;
+			px[2] = key & 255;
+	}
+}
+
+static inline unsigned int frame_rgb(CAMERA *cam, unsigned char *data, int x, int y)
+{
+	unsigned int key = frame_key(cam, data, x, y);
+	return cam->pixel_format == PIXEL_RGB24 ? key : yuv_to_rgb(key);
+}
+
+static inline void frame_put_rgb(CAMERA *cam, unsigned char *data, int x, int y, unsigned int rgb)
+{
+	frame_put_key(cam, data, x, y, cam->pixel_format == PIXEL_RGB24 ? rgb : rgb_to_yuv(rgb));
+}
+
+static inline void highlight_pixel(CAMERA *cam, int x, int y, short matched)
+{
+
+	/**
+	Marks a pixel as matching or not matching. RGB24 pixels are made green
+	or red. For the YUV formats only the luma of the pixel itself is changed,
+	because the chroma is shared with pixels that may not have been matched
+	yet: matching pixels are made white and other pixels are darkened
+	**/
+
+	unsigned char *luma;
+
+	if (cam->pixel_format == PIXEL_RGB24) {
+		frame_put_rgb(cam, cam->frame, x, y, frame_rgb(cam, cam->frame, x, y) | (matched ? 0x00ff00 : 0xff0000));
+		return;
+	}
+
+	luma = cam->frame + y * cam->format.fmt.pix.bytesperline + (cam->pixel_format == PIXEL_YUYV ? x * 2 : x);
+	*luma = matched ? 255 : *luma / 2;
+}
+
+static inline short in_window(WINDOW *window, int x, int y)
+{
+	return x >= window->left && x <= window->right && y >= window->top && y <= window->bottom;
+}
+
+static inline short motion_allows(CAMERA *cam, int x, int y)
+{
+
+	/**
+	Returns whether the search for an object may consider a pixel, which is
+	always the case unless motion_acquire is set and the background model is
+	ready
+	**/
+
+	extern short motion_acquire;
+
+	if (!motion_acquire || !cam->background_ready) {
+		return 1;
+	}
+	return cam->background_mask[(y / BACKGROUND_BLOCK) * cam->background_columns + x / BACKGROUND_BLOCK];
+}
+
+static inline int window_radius(WINDOW *window, int x, int y)
+{
+
+	/**
+	Returns the radius of the smallest ring around (x, y) that lies entirely
+	outside of the window
+	**/
+
+	return MAX(MAX(x - window->left, window->right + 1 - x), MAX(y - window->top, window->bottom + 1 - y));
+}
+
+static inline short table_bit(COLOR_TABLE *table, unsigned int key)
+{
+	return (table->bits[key >> 3] >> (key & 7)) & 1;
+}
+
+static inline short table_match(COLOR_TABLE *table, unsigned char *px)
+{
+
+	/**
+	Determines whether the RGB triple at px matches the table. Unlike
+	matching_pixel(), this doesn't update pixels_touched, so it can be used
+	by several threads at once. Only for RGB24 frames
+	**/
+
+	return table_bit(table, (px[0] << 16) | (px[1] << 8) | px[2]);
+}
+
+static inline short matching_pixel(CAMERA *cam, COLOR_TABLE *table, int x, int y)
+{
+
+	/**
+	Determines whether a pixel at a specified coordinates matches the color
+	**/
+
+	cam->pixels_touched++;
+	return table_bit(table, frame_key(cam, cam->frame, x, y));
+}
+
+int synthetic_add_blob(CAMERA *cam, int r, int g, int b, int radius, int x, int y, int vx, int vy);
+void synthetic_clear_blobs(CAMERA *cam);
+PyObject *synthetic_blob_position(CAMERA *cam, int i);
+
+#endif
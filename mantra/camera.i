@@ -1,44 +1,151 @@
 %module camera
 
+#define BENCH_TRACK_OBJECT		0
+#define BENCH_SPIRAL_SCAN		1
+#define BENCH_FIND_OBJECT		2
+#define BENCH_MATCHING_PIXEL	3
+#define BENCH_HIGHLIGHT_COLOR	4
+#define BENCH_LABEL_SCAN		5
+#define BENCH_TRACK_WINDOW		6
+#define BENCH_COMPONENT_SCAN	7
+#define BENCH_FIND_PYRAMID		8
+#define BENCH_TRACK_SLICE		9
+#define BENCH_TRACK_HIGHLIGHT	10
+
+%constant int SIZE_SURFACE = SIZE_SURFACE;
+%constant int SIZE_WIDTH = SIZE_WIDTH;
+
+#define SCAN_BLOCK		0
+#define SCAN_SPIRAL		1
+#define SCAN_LABEL		2
+#define SCAN_WINDOW		3
+#define SCAN_COMPONENTS	4
+
+#define ACQUIRE_SPIRAL	0
+#define ACQUIRE_PYRAMID	1
+
+#define PIXEL_AUTO		-1
+#define PIXEL_RGB24		0
+#define PIXEL_YUYV		1
+#define PIXEL_YUV420	2
+
+#define CAPTURE_COPY		0
+#define CAPTURE_INPLACE		1
+
+#define CAPTURE_EVERY		0
+#define CAPTURE_NEWEST		1
 
 %newobject camera;
 
 %{
-	extern unsigned int r, g, b;
+	#include "camera.h"
 
 	extern short match_mode;
 	extern short scan_mode;
+	extern short acquire_mode;
+	extern int acquire_step;
 	extern short size_mode;
 	extern int min_z;
-	extern int track_x;
-	extern int track_y;
-	extern int track_z;
+	extern int synthetic_r, synthetic_g, synthetic_b;
+	extern int synthetic_noise;
+	extern int synthetic_frames;
+	extern short capture_mode;
+	extern int nr_of_buffers;
+	extern short capture_threaded;
+	extern short capture_policy;
+	extern int capture_queue_size;
+	extern int nr_of_threads;
+	extern short capture_pixel_format;
+	extern short background_model;
+	extern int background_warmup;
+	extern int background_threshold;
+	extern short motion_acquire;
 %}
 
-extern unsigned int r, g, b;
-
 extern short match_mode;
 extern short scan_mode;
+extern short acquire_mode;
+extern int acquire_step;
 extern short size_mode;
 extern int min_z;
-extern int track_x;
-extern int track_y;
-extern int track_z;
-
-void camera_init(char *device, int width, int height);
-void camera_close(void);
-void camera_capture(void);
-void camera_get_px(short x, short y);
-void camera_put_px(short x, short y);
-void camera_save_frame(char *fname);
-PyObject *camera_to_string(void);
-int camera_get_control(int id);
-void camera_set_control(int id, int value);
-int camera_control_available(int id);
-int camera_get_width(void);
-int camera_get_height(void);
-
-extern short match_at(int x, int y);
+extern int synthetic_r, synthetic_g, synthetic_b;
+extern int synthetic_noise;
+extern int synthetic_frames;
+extern short capture_mode;
+extern int nr_of_buffers;
+extern short capture_threaded;
+extern short capture_policy;
+extern int capture_queue_size;
+extern int nr_of_threads;
+extern short capture_pixel_format;
+extern short background_model;
+extern int background_warmup;
+extern int background_threshold;
+extern short motion_acquire;
+
+// A camera context, which owns a device, its capture thread and the state of
+// the tracking. Only the results can be read from Python
+%immutable;
+typedef struct camera {
+	short source_mode;
+	int nr_of_buffers_allocated;
+	short pixel_format;
+	double frame_timestamp;
+	unsigned int frame_sequence;
+	unsigned long frames_dropped;
+	int background_frames;
+	short background_ready;
+	int track_x;
+	int track_y;
+	int track_z;
+	short track_fallback;
+	unsigned long pixels_touched;
+	unsigned int r, g, b;
+} CAMERA;
+%mutable;
+
+%extend camera {
+	camera() {
+		return camera_new();
+	}
+	~camera() {
+		camera_delete($self);
+	}
+}
+
+void camera_init(CAMERA *cam, char *device, int width, int height);
+void camera_close(CAMERA *cam);
+void camera_capture(CAMERA *cam);
+void camera_get_px(CAMERA *cam, short x, short y);
+void camera_put_px(CAMERA *cam, short x, short y);
+void camera_save_frame(CAMERA *cam, char *fname);
+void camera_append_frame(CAMERA *cam, char *fname);
+PyObject *camera_to_string(CAMERA *cam);
+PyObject *camera_frame_buffer(CAMERA *cam, int writable);
+PyObject *camera_display_buffer(CAMERA *cam);
+int camera_get_control(CAMERA *cam, int id);
+void camera_set_control(CAMERA *cam, int id, int value);
+int camera_control_available(CAMERA *cam, int id);
+int camera_get_width(CAMERA *cam);
+int camera_get_height(CAMERA *cam);
+double camera_frame_age(CAMERA *cam);
+void background_reset(CAMERA *cam);
+short background_mask_at(CAMERA *cam, int x, int y);
+
+extern short match_at(CAMERA *cam, int x, int y);
 extern int color_match(int a, int b, int c, int d, int e, int f, int fuzziness);
-void highlight_color(int color_r, int color_g, int color_b, int fuzziness);
-extern void track_object(int color_r, int color_g, int color_b, int fuzziness, int pre_x, int pre_y, int highlight);
+void highlight_color(CAMERA *cam, int color_r, int color_g, int color_b, int fuzziness);
+extern void track_object(CAMERA *cam, int color_r, int color_g, int color_b, int fuzziness, int pre_x, int pre_y, int highlight);
+extern void track_object_window(CAMERA *cam, int color_r, int color_g, int color_b, int fuzziness, int pre_x, int pre_y, int half_w, int half_h, int highlight);
+extern int track_object_slice(CAMERA *cam, int color_r, int color_g, int color_b, int fuzziness, int pre_x, int pre_y, int half_w, int half_h, int cursor, int budget, int highlight);
+extern void color_table_prepare(CAMERA *cam, int color_r, int color_g, int color_b, int fuzziness);
+extern short label_at(CAMERA *cam, int x, int y);
+extern PyObject *label_objects(CAMERA *cam, PyObject *objects, int highlight);
+extern PyObject *track_objects(CAMERA *cam, PyObject *objects, int highlight);
+extern PyObject *object_components(CAMERA *cam, int color_r, int color_g, int color_b, int fuzziness, int highlight);
+
+extern int synthetic_add_blob(CAMERA *cam, int r, int g, int b, int radius, int x, int y, int vx, int vy);
+extern void synthetic_clear_blobs(CAMERA *cam);
+extern PyObject *synthetic_blob_position(CAMERA *cam, int i);
+
+extern PyObject *camera_benchmark(CAMERA *cam, int kernel, int n, PyObject *objects);
@@ -1,137 +1,220 @@
 # This file was automatically generated by SWIG (http://www.swig.org).
-# Version 2.0.4
+# Version 4.0.2
 #
 # Do not make changes to this file unless you know what you are doing--modify
 # the SWIG interface file instead.
 
+from sys import version_info as _swig_python_version_info
+if _swig_python_version_info < (2, 7, 0):
+    raise RuntimeError("Python 2.7 or later required")
 
-
-from sys import version_info
-if version_info >= (2,6,0):
-    def swig_import_helper():
-        from os.path import dirname
-        import imp
-        fp = None
-        try:
-            fp, pathname, description = imp.find_module('_camera', [dirname(__file__)])
-        except ImportError:
-            import _camera
-            return _camera
-        if fp is not None:
-            try:
-                _mod = imp.load_module('_camera', fp, pathname, description)
-            finally:
-                fp.close()
-            return _mod
-    _camera = swig_import_helper()
-    del swig_import_helper
+# Import the low-level C/C++ module
+if __package__ or "." in __name__:
+    from . import _camera
 else:
     import _camera
-del version_info
+
 try:
-    _swig_property = property
-except NameError:
-    pass # Python < 2.2 doesn't have 'property'.
-def _swig_setattr_nondynamic(self,class_type,name,value,static=1):
-    if (name == "thisown"): return self.this.own(value)
-    if (name == "this"):
-        if type(value).__name__ == 'SwigPyObject':
-            self.__dict__[name] = value
-            return
-    method = class_type.__swig_setmethods__.get(name,None)
-    if method: return method(self,value)
-    if (not static):
-        self.__dict__[name] = value
-    else:
-        raise AttributeError("You cannot add attributes to %s" % self)
-
-def _swig_setattr(self,class_type,name,value):
-    return _swig_setattr_nondynamic(self,class_type,name,value,0)
-
-def _swig_getattr(self,class_type,name):
-    if (name == "thisown"): return self.this.own()
-    method = class_type.__swig_getmethods__.get(name,None)
-    if method: return method(self)
-    raise AttributeError(name)
+    import builtins as __builtin__
+except ImportError:
+    import __builtin__
 
 def _swig_repr(self):
-    try: strthis = "proxy of " + self.this.__repr__()
-    except: strthis = ""
+    try:
+        strthis = "proxy of " + self.this.__repr__()
+    except __builtin__.Exception:
+        strthis = ""
     return "<%s.%s; %s >" % (self.__class__.__module__, self.__class__.__name__, strthis,)
 
-try:
-    _object = object
-    _newclass = 1
-except AttributeError:
-    class _object : pass
-    _newclass = 0
 
+def _swig_setattr_nondynamic_instance_variable(set):
+    def set_instance_attr(self, name, value):
+        if name == "thisown":
+            self.this.own(value)
+        elif name == "this":
+            set(self, name, value)
+        elif hasattr(self, name) and isinstance(getattr(type(self), name), property):
+            set(self, name, value)
+        else:
+            raise AttributeError("You cannot add instance attributes to %s" % self)
+    return set_instance_attr
+
+
+def _swig_setattr_nondynamic_class_variable(set):
+    def set_class_attr(cls, name, value):
+        if hasattr(cls, name) and not isinstance(getattr(cls, name), property):
+            set(cls, name, value)
+        else:
+            raise AttributeError("You cannot add class attributes to %s" % cls)
+    return set_class_attr
+
+
+def _swig_add_metaclass(metaclass):
+    """Class decorator for adding a metaclass to a SWIG wrapped class - a slimmed down version of six.add_metaclass"""
+    def wrapper(cls):
+        return metaclass(cls.__name__, cls.__bases__, cls.__dict__.copy())
+    return wrapper
+
+
+class _SwigNonDynamicMeta(type):
+    """Meta class to enforce nondynamic attributes (no new attributes) for a class"""
+    __setattr__ = _swig_setattr_nondynamic_class_variable(type.__setattr__)
+
+
+BENCH_TRACK_OBJECT = _camera.BENCH_TRACK_OBJECT
+BENCH_SPIRAL_SCAN = _camera.BENCH_SPIRAL_SCAN
+BENCH_FIND_OBJECT = _camera.BENCH_FIND_OBJECT
+BENCH_MATCHING_PIXEL = _camera.BENCH_MATCHING_PIXEL
+BENCH_HIGHLIGHT_COLOR = _camera.BENCH_HIGHLIGHT_COLOR
+BENCH_LABEL_SCAN = _camera.BENCH_LABEL_SCAN
+BENCH_TRACK_WINDOW = _camera.BENCH_TRACK_WINDOW
+BENCH_COMPONENT_SCAN = _camera.BENCH_COMPONENT_SCAN
+BENCH_FIND_PYRAMID = _camera.BENCH_FIND_PYRAMID
+BENCH_TRACK_SLICE = _camera.BENCH_TRACK_SLICE
+BENCH_TRACK_HIGHLIGHT = _camera.BENCH_TRACK_HIGHLIGHT
+SIZE_SURFACE = _camera.SIZE_SURFACE
+SIZE_WIDTH = _camera.SIZE_WIDTH
+SCAN_BLOCK = _camera.SCAN_BLOCK
+SCAN_SPIRAL = _camera.SCAN_SPIRAL
+SCAN_LABEL = _camera.SCAN_LABEL
+SCAN_WINDOW = _camera.SCAN_WINDOW
+SCAN_COMPONENTS = _camera.SCAN_COMPONENTS
+ACQUIRE_SPIRAL = _camera.ACQUIRE_SPIRAL
+ACQUIRE_PYRAMID = _camera.ACQUIRE_PYRAMID
+PIXEL_AUTO = _camera.PIXEL_AUTO
+PIXEL_RGB24 = _camera.PIXEL_RGB24
+PIXEL_YUYV = _camera.PIXEL_YUYV
+PIXEL_YUV420 = _camera.PIXEL_YUV420
+CAPTURE_COPY = _camera.CAPTURE_COPY
+CAPTURE_INPLACE = _camera.CAPTURE_INPLACE
+CAPTURE_EVERY = _camera.CAPTURE_EVERY
+CAPTURE_NEWEST = _camera.CAPTURE_NEWEST
+class CAMERA(object):
+    thisown = property(lambda x: x.this.own(), lambda x, v: x.this.own(v), doc="The membership flag")
+    __repr__ = _swig_repr
+    source_mode = property(_camera.CAMERA_source_mode_get)
+    nr_of_buffers_allocated = property(_camera.CAMERA_nr_of_buffers_allocated_get)
+    pixel_format = property(_camera.CAMERA_pixel_format_get)
+    frame_timestamp = property(_camera.CAMERA_frame_timestamp_get)
+    frame_sequence = property(_camera.CAMERA_frame_sequence_get)
+    frames_dropped = property(_camera.CAMERA_frames_dropped_get)
+    background_frames = property(_camera.CAMERA_background_frames_get)
+    background_ready = property(_camera.CAMERA_background_ready_get)
+    track_x = property(_camera.CAMERA_track_x_get)
+    track_y = property(_camera.CAMERA_track_y_get)
+    track_z = property(_camera.CAMERA_track_z_get)
+    track_fallback = property(_camera.CAMERA_track_fallback_get)
+    pixels_touched = property(_camera.CAMERA_pixels_touched_get)
+    r = property(_camera.CAMERA_r_get)
+    g = property(_camera.CAMERA_g_get)
+    b = property(_camera.CAMERA_b_get)
+
+    def __init__(self):
+        _camera.CAMERA_swiginit(self, _camera.new_CAMERA())
+    __swig_destroy__ = _camera.delete_CAMERA
+
+# Register CAMERA in _camera:
+_camera.CAMERA_swigregister(CAMERA)
+cvar = _camera.cvar
 
 
-def camera_init(*args):
-  return _camera.camera_init(*args)
-camera_init = _camera.camera_init
+def camera_init(cam, device, width, height):
+    return _camera.camera_init(cam, device, width, height)
 
-def camera_close():
-  return _camera.camera_close()
-camera_close = _camera.camera_close
+def camera_close(cam):
+    return _camera.camera_close(cam)
 
-def camera_capture():
-  return _camera.camera_capture()
-camera_capture = _camera.camera_capture
+def camera_capture(cam):
+    return _camera.camera_capture(cam)
 
-def camera_get_px(*args):
-  return _camera.camera_get_px(*args)
-camera_get_px = _camera.camera_get_px
+def camera_get_px(cam, x, y):
+    return _camera.camera_get_px(cam, x, y)
 
-def camera_put_px(*args):
-  return _camera.camera_put_px(*args)
-camera_put_px = _camera.camera_put_px
+def camera_put_px(cam, x, y):
+    return _camera.camera_put_px(cam, x, y)
 
-def camera_save_frame(*args):
-  return _camera.camera_save_frame(*args)
-camera_save_frame = _camera.camera_save_frame
+def camera_save_frame(cam, fname):
+    return _camera.camera_save_frame(cam, fname)
 
-def camera_to_string():
-  return _camera.camera_to_string()
-camera_to_string = _camera.camera_to_string
+def camera_append_frame(cam, fname):
+    return _camera.camera_append_frame(cam, fname)
 
-def camera_get_control(*args):
-  return _camera.camera_get_control(*args)
-camera_get_control = _camera.camera_get_control
+def camera_to_string(cam):
+    return _camera.camera_to_string(cam)
 
-def camera_set_control(*args):
-  return _camera.camera_set_control(*args)
-camera_set_control = _camera.camera_set_control
+def camera_frame_buffer(cam, writable):
+    return _camera.camera_frame_buffer(cam, writable)
 
-def camera_control_available(*args):
-  return _camera.camera_control_available(*args)
-camera_control_available = _camera.camera_control_available
+def camera_display_buffer(cam):
+    return _camera.camera_display_buffer(cam)
 
-def camera_get_width():
-  return _camera.camera_get_width()
-camera_get_width = _camera.camera_get_width
+def camera_get_control(cam, id):
+    return _camera.camera_get_control(cam, id)
 
-def camera_get_height():
-  return _camera.camera_get_height()
-camera_get_height = _camera.camera_get_height
+def camera_set_control(cam, id, value):
+    return _camera.camera_set_control(cam, id, value)
 
-def match_at(*args):
-  return _camera.match_at(*args)
-match_at = _camera.match_at
+def camera_control_available(cam, id):
+    return _camera.camera_control_available(cam, id)
 
-def color_match(*args):
-  return _camera.color_match(*args)
-color_match = _camera.color_match
+def camera_get_width(cam):
+    return _camera.camera_get_width(cam)
 
-def highlight_color(*args):
-  return _camera.highlight_color(*args)
-highlight_color = _camera.highlight_color
+def camera_get_height(cam):
+    return _camera.camera_get_height(cam)
 
-def track_object(*args):
-  return _camera.track_object(*args)
-track_object = _camera.track_object
-# This file is compatible with both classic and new-style classes.
+def camera_frame_age(cam):
+    return _camera.camera_frame_age(cam)
+
+def background_reset(cam):
+    return _camera.background_reset(cam)
+
+def background_mask_at(cam, x, y):
+    return _camera.background_mask_at(cam, x, y)
+
+def match_at(cam, x, y):
+    return _camera.match_at(cam, x, y)
+
+def color_match(a, b, c, d, e, f, fuzziness):
+    return _camera.color_match(a, b, c, d, e, f, fuzziness)
+
+def highlight_color(cam, color_r, color_g, color_b, fuzziness):
+    return _camera.highlight_color(cam, color_r, color_g, color_b, fuzziness)
+
+def track_object(cam, color_r, color_g, color_b, fuzziness, pre_x, pre_y, highlight):
+    return _camera.track_object(cam, color_r, color_g, color_b, fuzziness, pre_x, pre_y, highlight)
+
+def track_object_window(cam, color_r, color_g, color_b, fuzziness, pre_x, pre_y, half_w, half_h, highlight):
+    return _camera.track_object_window(cam, color_r, color_g, color_b, fuzziness, pre_x, pre_y, half_w, half_h, highlight)
+
+def track_object_slice(cam, color_r, color_g, color_b, fuzziness, pre_x, pre_y, half_w, half_h, cursor, budget, highlight):
+    return _camera.track_object_slice(cam, color_r, color_g, color_b, fuzziness, pre_x, pre_y, half_w, half_h, cursor, budget, highlight)
+
+def color_table_prepare(cam, color_r, color_g, color_b, fuzziness):
+    return _camera.color_table_prepare(cam, color_r, color_g, color_b, fuzziness)
+
+def label_at(cam, x, y):
+    return _camera.label_at(cam, x, y)
+
+def label_objects(cam, objects, highlight):
+    return _camera.label_objects(cam, objects, highlight)
+
+def track_objects(cam, objects, highlight):
+    return _camera.track_objects(cam, objects, highlight)
+
+def object_components(cam, color_r, color_g, color_b, fuzziness, highlight):
+    return _camera.object_components(cam, color_r, color_g, color_b, fuzziness, highlight)
+
+def synthetic_add_blob(cam, r, g, b, radius, x, y, vx, vy):
+    return _camera.synthetic_add_blob(cam, r, g, b, radius, x, y, vx, vy)
+
+def synthetic_clear_blobs(cam):
+    return _camera.synthetic_clear_blobs(cam)
+
+def synthetic_blob_position(cam, i):
+    return _camera.synthetic_blob_position(cam, i)
+
+def camera_benchmark(cam, kernel, n, objects):
+    return _camera.camera_benchmark(cam, kernel, n, objects)
 
-cvar = _camera.cvar
 
@@ -0,0 +1,285 @@
+#include <stdlib.h>
+#include <stdio.h>
+#include <string.h>
+#include <time.h>
+#include <errno.h>
+#include <unistd.h>
+#include <pthread.h>
+#include "camera.h"
+
+// How long camera_capture() waits for a frame before giving up
+#define CAPTURE_TIMEOUT_S	2
+#define CAPTURE_RETRIES		20
+
+// If capture_threaded is set when a camera is initialized, frames are
+// captured by a separate thread for that camera, which puts them in a queue
+// of at most capture_queue_size frames
+short capture_threaded = 0;
+short capture_policy = CAPTURE_NEWEST;
+int capture_queue_size = 2;
+
+double capture_clock(void)
+{
+
+	/**
+	Returns the monotonic time in seconds, which is the clock that is also
+	used for the v4l2 buffer timestamps
+	**/
+
+	struct timespec t;
+
+	clock_gettime(CLOCK_MONOTONIC, &t);
+	return t.tv_sec + t.tv_nsec / 1000000000.0;
+}
+
+double camera_frame_age(CAMERA *cam)
+{
+
+	/**
+	Returns the time in seconds since the current frame was captured
+	**/
+
+	return capture_clock() - cam->frame_timestamp;
+}
+
+void capture_init(CAMERA *cam)
+{
+
+	/**
+	Initializes the synchronization of the capture thread of a new camera
+	**/
+
+	pthread_mutex_init(&cam->capture_lock, NULL);
+	pthread_cond_init(&cam->frame_queued, NULL);
+	pthread_cond_init(&cam->frame_taken, NULL);
+}
+
+void capture_destroy(CAMERA *cam)
+{
+	pthread_mutex_destroy(&cam->capture_lock);
+	pthread_cond_destroy(&cam->frame_queued);
+	pthread_cond_destroy(&cam->frame_taken);
+}
+
+int capture_free_slot(CAMERA *cam)
+{
+	int i;
+
+	for (i = 0; i < cam->nr_of_slots; i++) {
+		if (!cam->slot_busy[i]) {
+			return i;
+		}
+	}
+	return -1;
+}
+
+void capture_use_slot(CAMERA *cam, int i)
+{
+
+	/**
+	Makes a slot the current frame and releases the previous one
+	**/
+
+	if (cam->current_slot != -1) {
+		cam->source->release(cam, &cam->slots[cam->current_slot]);
+		cam->slot_busy[cam->current_slot] = 0;
+	}
+	cam->current_slot = i;
+	cam->frame = cam->slots[i].data;
+	cam->frame_timestamp = cam->slots[i].timestamp;
+	cam->frame_sequence = cam->slots[i].sequence;
+}
+
+void capture_drop_oldest(CAMERA *cam)
+{
+
+	/**
+	Gives the oldest queued frame back to the source without processing it.
+	The capture lock should be held
+	**/
+
+	int i = cam->queue[cam->queue_head];
+
+	cam->queue_head = (cam->queue_head + 1) % MAX_CAPTURE_SLOTS;
+	cam->queue_length--;
+	cam->source->release(cam, &cam->slots[i]);
+	cam->slot_busy[i] = 0;
+	cam->frames_dropped++;
+}
+
+void *capture_loop(void *arg)
+{
+
+	/**
+	Grabs frames as soon as the source has them and queues them for the
+	tracker. If the queue is full, the capture thread either waits for the
+	tracker (CAPTURE_EVERY) or drops the oldest frame once a new frame has
+	been grabbed (CAPTURE_NEWEST). A slot is kept free for the new frame, so
+	the queue stays full while the thread waits for the source
+	**/
+
+	extern short capture_policy;
+	CAMERA *cam = arg;
+	int i;
+
+	pthread_mutex_lock(&cam->capture_lock);
+	while (cam->capture_running) {
+
+		if (cam->queue_length >= cam->queue_limit && capture_policy == CAPTURE_EVERY) {
+			pthread_cond_wait(&cam->frame_taken, &cam->capture_lock);
+			continue;
+		}
+
+		i = capture_free_slot(cam);
+		cam->slot_busy[i] = 1;
+		pthread_mutex_unlock(&cam->capture_lock);
+
+		if (!cam->source->grab(cam, &cam->slots[i])) {
+			// Sources that fail right away shouldn't keep the thread spinning
+			if (cam->source != &v4l2_source) {
+				usleep(10000);
+			}
+			pthread_mutex_lock(&cam->capture_lock);
+			cam->slot_busy[i] = 0;
+			continue;
+		}
+
+		pthread_mutex_lock(&cam->capture_lock);
+		if (cam->queue_length >= cam->queue_limit) {
+			capture_drop_oldest(cam);
+		}
+		cam->queue[(cam->queue_head + cam->queue_length) % MAX_CAPTURE_SLOTS] = i;
+		cam->queue_length++;
+		pthread_cond_signal(&cam->frame_queued);
+	}
+	pthread_mutex_unlock(&cam->capture_lock);
+	return NULL;
+}
+
+void capture_start(CAMERA *cam)
+{
+
+	/**
+	Allocates the frame slots and starts the capture thread if threaded
+	capture is enabled. Before the first capture, the frame is black
+	**/
+
+	extern short capture_threaded, capture_mode;
+	extern int capture_queue_size;
+	int i;
+
+	cam->queue_limit = MAX(1, MIN(capture_queue_size, MAX_CAPTURE_QUEUE));
+
+	// When frames are processed in place, the driver must keep at least one
+	// buffer to capture into
+	if (cam->source_mode == SOURCE_V4L2 && capture_mode == CAPTURE_INPLACE) {
+		cam->queue_limit = MAX(1, MIN(cam->queue_limit, cam->nr_of_buffers_allocated - 2));
+	}
+
+	cam->nr_of_slots = capture_threaded ? cam->queue_limit + 2 : 2;
+	for (i = 0; i < cam->nr_of_slots; i++) {
+		cam->slots[i].own = calloc(cam->format.fmt.pix.sizeimage, 1);
+		cam->slots[i].data = cam->slots[i].own;
+		cam->slots[i].index = -1;
+		cam->slots[i].timestamp = 0;
+		cam->slots[i].sequence = 0;
+		cam->slot_busy[i] = 0;
+	}
+
+	cam->current_slot = -1;
+	cam->frame = cam->slots[0].own;
+	cam->queue_head = 0;
+	cam->queue_length = 0;
+	cam->frames_dropped = 0;
+
+	if (capture_threaded) {
+		cam->capture_running = 1;
+		if (pthread_create(&cam->capture_thread, NULL, capture_loop, cam)) {
+			printf("Failed to start the capture thread\n");
+			cam->capture_running = 0;
+		}
+	}
+}
+
+void capture_next(CAMERA *cam)
+{
+
+	/**
+	Makes the next frame the current frame. With a capture thread, this is the
+	oldest queued frame (CAPTURE_EVERY) or the newest queued frame, in which
+	case the older frames are dropped (CAPTURE_NEWEST). Without a capture
+	thread, a new frame is grabbed right away. If no frame becomes available,
+	the current frame is kept
+	**/
+
+	extern short capture_policy;
+	struct timespec deadline;
+	int i, tries;
+
+	if (!cam->capture_running) {
+		i = capture_free_slot(cam);
+		for (tries = 0; tries < CAPTURE_RETRIES; tries++) {
+			if (cam->source->grab(cam, &cam->slots[i])) {
+				cam->slot_busy[i] = 1;
+				capture_use_slot(cam, i);
+				return;
+			}
+		}
+		printf("Timeout while capturing\n");
+		return;
+	}
+
+	clock_gettime(CLOCK_REALTIME, &deadline);
+	deadline.tv_sec += CAPTURE_TIMEOUT_S;
+
+	pthread_mutex_lock(&cam->capture_lock);
+	while (cam->queue_length == 0) {
+		if (pthread_cond_timedwait(&cam->frame_queued, &cam->capture_lock, &deadline) == ETIMEDOUT) {
+			pthread_mutex_unlock(&cam->capture_lock);
+			printf("Timeout while capturing\n");
+			return;
+		}
+	}
+	if (capture_policy == CAPTURE_NEWEST) {
+		while (cam->queue_length > 1) {
+			capture_drop_oldest(cam);
+		}
+	}
+	i = cam->queue[cam->queue_head];
+	cam->queue_head = (cam->queue_head + 1) % MAX_CAPTURE_SLOTS;
+	cam->queue_length--;
+	capture_use_slot(cam, i);
+	pthread_cond_signal(&cam->frame_taken);
+	pthread_mutex_unlock(&cam->capture_lock);
+}
+
+void capture_stop(CAMERA *cam)
+{
+
+	/**
+	Stops the capture thread, gives all frames back to the source and frees
+	the slots
+	**/
+
+	int i;
+
+	if (cam->capture_running) {
+		pthread_mutex_lock(&cam->capture_lock);
+		cam->capture_running = 0;
+		pthread_cond_signal(&cam->frame_taken);
+		pthread_mutex_unlock(&cam->capture_lock);
+		pthread_join(cam->capture_thread, NULL);
+	}
+
+	for (i = 0; i < cam->nr_of_slots; i++) {
+		if (cam->slot_busy[i]) {
+			cam->source->release(cam, &cam->slots[i]);
+			cam->slot_busy[i] = 0;
+		}
+		free(cam->slots[i].own);
+		cam->slots[i].own = NULL;
+	}
+	cam->nr_of_slots = 0;
+	cam->current_slot = -1;
+	cam->frame = NULL;
+}
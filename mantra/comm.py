@@ -0,0 +1,516 @@
+"""
+This file is part of Mantra.
+
+Mantra is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Mantra is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Mantra.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import os
+import errno
+import fcntl
+import select
+import socket
+import struct
+import time
+import traceback
+import Queue
+
+# In the binary format, samples are sent as fixed-size records: the object
+# nr, whether the object is moving (-1 if there is no such object), whether
+# the sample was streamed (1) or requested (0), the sample nr, the time at
+# which the frame was captured (in seconds), the position (x, y, z), the
+# velocity and the acceleration
+SAMPLE_RECORD = struct.Struct("<HbBIdfffff")
+
+# The largest object nr that fits in a sample record
+MAX_OBJECT_NR = 0xFFFF
+
+# Records are sent in packets of at most MAX_PACKET_RECORDS records, each
+# starting with "MS" and the number of records
+PACKET_HEADER = struct.Struct("<2sH")
+MAX_PACKET_RECORDS = 32
+
+# The samples of several objects from the same frame are sent in a single
+# packet, which starts with "MF", the number of records and the sequence
+# number of the frame
+FRAME_HEADER = struct.Struct("<2sHI")
+
+# A TCP client that doesn't keep up with the data that is sent to it, for
+# example because it has subscribed to samples but doesn't read them, is
+# disconnected once this many bytes are waiting to be sent
+MAX_WRITE_BUFFER = 1 << 20
+
+# A UDP session is forgotten if no requests have arrived for this many
+# seconds, unless the client waits for a sample or a movement. Subscribers
+# keep their session alive by sending ALIVE
+UDP_TIMEOUT = 60
+
+class comm_session:
+
+	"""
+	Holds the state of a single client. A TCP session lasts as long as the
+	connection. UDP clients have no connection, so every address from which
+	requests arrive gets its own session, which lasts until the client says
+	BYE or has been idle for UDP_TIMEOUT seconds.
+	"""
+
+	def __init__(self, server, addr, conn=None):
+
+		"""
+		Initializes a session
+
+		Arguments:
+		server -- the comm_server that serves the client
+		addr -- the address of the client
+
+		Keyword arguments:
+		conn -- the connected socket for TCP, or None for UDP (default=None)
+		"""
+
+		self.server = server
+		self.addr = addr
+		self.conn = conn
+		self.rbuf = ""
+		self.wbuf = ""
+		self.closed = False
+		self.last_active = time.time()
+
+		# Per object, the sample number of the last sample that was sent to
+		# the client, the last frame of which a snapshot was sent, the SAMP
+		# and MSAMP requests that are waiting for a new sample as ("SAMP",
+		# object) or ("MSAMP", objects) tuples and, per object, whether the
+		# client waits for the start (SMOV) or end (EMOV) of a movement
+		self.last_samples = {}
+		self.last_frame = 0
+		self.samp_waiting = []
+		self.comm_wait = {}
+
+		# The objects of which every sample is sent to the client, each with
+		# an [every, count] list, so that only every nth sample is sent
+		self.subscriptions = {}
+
+		# Whether samples are sent in the binary format, and the records that
+		# haven't been sent yet
+		self.binary = False
+		self.records = []
+
+	def send(self, s):
+
+		"""
+		Sends a message to the client. This never blocks, because TCP messages
+		are buffered until the connection can take them. This should only be
+		called from the thread that runs the server.
+
+		Arguments:
+		s -- the message
+		"""
+
+		# Records that were queued earlier go first, so that the order of the
+		# replies is kept
+		if len(self.records) > 0:
+			self.flush()
+		self.write(s)
+
+	def send_sample(self, sample, streamed=False):
+
+		"""
+		Sends a sample in the format of the session. Binary records are
+		queued, so that all samples that become available at the same time go
+		out in a single packet
+
+		Arguments:
+		sample -- an (object nr, sample nr, timestamp, moving, (x, y, z),
+				  velocity, acceleration) tuple
+
+		Keyword arguments:
+		streamed -- indicates whether the sample is part of a stream
+					(default=False)
+		"""
+
+		i, sample_nr, timestamp, moving, pos, v, a = sample
+		if self.binary:
+			self.records.append(SAMPLE_RECORD.pack(i, moving, streamed, \
+				sample_nr, timestamp, pos[0], pos[1], pos[2], v, a))
+		elif streamed:
+			self.send("STREAM %d %d %s %s %s\n" % ((i, moving) + tuple(pos)))
+		else:
+			self.send("%d %s %s %s\n" % ((moving, ) + tuple(pos)))
+
+	def send_frame(self, sequence, samples):
+
+		"""
+		Sends the samples of several objects from the same frame as a single
+		reply, in the format of the session
+
+		Arguments:
+		sequence -- the sequence number of the frame
+		samples -- a list of samples, as passed to send_sample()
+		"""
+
+		if not self.binary:
+			s = "%d" % sequence
+			for i, sample_nr, timestamp, moving, pos, v, a in samples:
+				s += " %d %s %s %s" % ((moving, ) + tuple(pos))
+			self.send(s + "\n")
+			return
+
+		records = [SAMPLE_RECORD.pack(i, moving, False, sample_nr, timestamp, \
+			pos[0], pos[1], pos[2], v, a) for i, sample_nr, timestamp, moving, \
+			pos, v, a in samples]
+		self.send(FRAME_HEADER.pack("MF", len(records), sequence) + \
+			"".join(records))
+
+	def flush(self):
+
+		"""
+		Sends the queued records
+		"""
+
+		records = self.records
+		self.records = []
+		for j in range(0, len(records), MAX_PACKET_RECORDS):
+			packet = records[j:j + MAX_PACKET_RECORDS]
+			self.write(PACKET_HEADER.pack("MS", len(packet)) + "".join(packet))
+
+	def write(self, s):
+
+		"""
+		Sends raw data to the client
+		"""
+
+		if self.closed:
+			return
+		if self.conn == None:
+			try:
+				self.server.sock.sendto(s, self.addr)
+			except socket.error:
+				print "comm_session.write(): failed to send to %s:%s" % self.addr
+		elif len(self.wbuf) + len(s) > MAX_WRITE_BUFFER:
+			print "comm_session.write(): %s:%s doesn't keep up, disconnecting" % self.addr
+			self.close()
+		else:
+			self.wbuf += s
+
+	def idle(self, t):
+
+		"""
+		Indicates whether a UDP session has been idle for too long. Sessions
+		that wait for a sample or a movement are never idle, because the wait
+		ends by itself
+
+		Arguments:
+		t -- the current time
+		"""
+
+		return self.conn == None and t - self.last_active > UDP_TIMEOUT and \
+			len(self.samp_waiting) == 0 and len(self.comm_wait) == 0
+
+	def close(self):
+
+		"""
+		Ends the session. The server forgets the session and, for TCP, closes
+		the connection.
+		"""
+
+		self.closed = True
+
+class comm_server:
+
+	"""
+	Serves any number of TCP or UDP clients from a single thread, with
+	select() as event loop. Every line that a client sends is passed to
+	handler.comm_process(session, line), which replies through the session.
+	Other threads never touch the sockets. Instead, they wake the loop, after
+	which handler.comm_update(session) is called for every session, or they
+	ask the loop to call a function for them.
+	"""
+
+	def __init__(self, handler, host, port, protocol="tcp"):
+
+		"""
+		Creates the server and binds it to the first available port, starting
+		from the preferred port
+
+		Arguments:
+		handler -- the object that handles the requests
+		host -- the host to bind to
+		port -- the preferred port
+
+		Keyword arguments:
+		protocol -- "tcp" or "udp" (default="tcp")
+		"""
+
+		self.handler = handler
+		self.host = host
+		self.port = port
+		self.protocol = protocol
+		self.sessions = {}
+		self.calls = Queue.Queue()
+
+		# Writing to this pipe wakes the loop
+		self.wake_r, self.wake_w = os.pipe()
+		for fd in self.wake_r, self.wake_w:
+			fcntl.fcntl(fd, fcntl.F_SETFL, fcntl.fcntl(fd, fcntl.F_GETFL) | os.O_NONBLOCK)
+
+		self.bind()
+
+	def bind(self):
+
+		"""
+		Binds to a socket, incrementing the port until binding succeeds
+		"""
+
+		if self.protocol == "udp":
+			socktype = socket.SOCK_DGRAM
+		else:
+			socktype = socket.SOCK_STREAM
+
+		while True:
+			self.sock = socket.socket(socket.AF_INET, socktype)
+			if socktype == socket.SOCK_STREAM:
+				self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+			try:
+				self.sock.bind( (self.host, self.port) )
+				break
+			except socket.error:
+				print "Unable to bind to port", self.port
+				self.sock.close()
+				self.port += 1
+
+		print "Listening on port", self.port
+		if socktype == socket.SOCK_STREAM:
+			self.sock.listen(socket.SOMAXCONN)
+		self.sock.setblocking(0)
+
+	def wake(self):
+
+		"""
+		Wakes the loop. This can be called from any thread and never blocks
+		"""
+
+		try:
+			os.write(self.wake_w, "x")
+		except OSError:
+			# The pipe is full, so the loop will wake anyway
+			pass
+
+	def call(self, func, *args):
+
+		"""
+		Lets the loop call a function, so that it can use the sessions. This
+		can be called from any thread
+
+		Arguments:
+		func -- the function
+		*args -- the arguments for the function
+		"""
+
+		self.calls.put( (func, args) )
+		self.wake()
+
+	def run(self):
+
+		"""
+		Runs the loop forever. This function is spawned as a thread
+		"""
+
+		print "comm_server.run(): communicating using %s" % self.protocol.upper()
+
+		while True:
+
+			# Only ask for writability if there is something to write
+			rlist = [self.sock, self.wake_r]
+			wlist = []
+			for session in self.sessions.values():
+				if session.conn != None:
+					rlist.append(session.conn)
+					if session.wbuf != "":
+						wlist.append(session.conn)
+
+			# UDP sessions are checked for idleness every second
+			if self.protocol == "udp":
+				timeout = 1
+			else:
+				timeout = None
+
+			try:
+				readable, writable, exceptional = select.select(rlist, wlist, [], timeout)
+			except select.error, e:
+				if e[0] == errno.EINTR:
+					continue
+				raise
+
+			if self.wake_r in readable:
+				self.handle_wake()
+
+			if self.sock in readable:
+				if self.protocol == "udp":
+					self.handle_datagrams()
+				else:
+					self.handle_accept()
+
+			for conn in readable:
+				if conn in self.sessions:
+					self.handle_read(self.sessions[conn])
+
+			for conn in writable:
+				if conn in self.sessions:
+					self.handle_write(self.sessions[conn])
+
+			for session in self.sessions.values():
+				if len(session.records) > 0:
+					session.flush()
+
+			self.remove_closed()
+
+	def handle_wake(self):
+
+		"""
+		Calls the functions that were passed to call() and lets the handler
+		update every session
+		"""
+
+		try:
+			while os.read(self.wake_r, 4096) != "":
+				pass
+		except OSError:
+			pass
+
+		while True:
+			try:
+				func, args = self.calls.get_nowait()
+			except Queue.Empty:
+				break
+			self.safe_call(func, *args)
+
+		for session in self.sessions.values():
+			self.safe_call(self.handler.comm_update, session)
+
+	def handle_accept(self):
+
+		"""
+		Accepts a new TCP connection
+		"""
+
+		try:
+			conn, addr = self.sock.accept()
+		except socket.error:
+			return
+		conn.setblocking(0)
+		self.sessions[conn] = comm_session(self, addr, conn)
+		print "comm_server.handle_accept(): connected by %s:%s" % addr
+
+	def handle_datagrams(self):
+
+		"""
+		Processes all datagrams that have arrived. Every address has its own
+		session
+		"""
+
+		while True:
+			try:
+				s, addr = self.sock.recvfrom(4096)
+			except socket.error:
+				return
+			if addr not in self.sessions:
+				self.sessions[addr] = comm_session(self, addr)
+			self.sessions[addr].last_active = time.time()
+			self.process(self.sessions[addr], s)
+
+	def handle_read(self, session):
+
+		"""
+		Reads from a TCP connection and processes all complete lines
+		"""
+
+		try:
+			rcv = session.conn.recv(4096)
+		except socket.error, e:
+			if e[0] in (errno.EAGAIN, errno.EINTR):
+				return
+			rcv = ""
+
+		if rcv == "":
+			print "comm_server.handle_read(): connection closed by %s:%s" % session.addr
+			session.close()
+			return
+
+		session.rbuf += rcv
+		if "\n" in session.rbuf:
+			s, session.rbuf = session.rbuf.rsplit("\n", 1)
+			self.process(session, s)
+
+	def handle_write(self, session):
+
+		"""
+		Sends as much of the buffered output of a TCP session as possible
+		"""
+
+		try:
+			sent = session.conn.send(session.wbuf)
+		except socket.error, e:
+			if e[0] in (errno.EAGAIN, errno.EINTR):
+				return
+			print "comm_server.handle_write(): connection lost to %s:%s" % session.addr
+			session.close()
+			return
+		session.wbuf = session.wbuf[sent:]
+
+	def process(self, session, s):
+
+		"""
+		Passes the lines of a request to the handler, one by one
+
+		Arguments:
+		session -- the session of the client
+		s -- one or more lines
+		"""
+
+		for line in s.split("\n"):
+			if session.closed:
+				return
+			if line.strip() == "":
+				continue
+			if self.safe_call(self.handler.comm_process, session, line) == False:
+				print "comm_server.process(): session with %s:%s ended" % session.addr
+				session.close()
+
+	def safe_call(self, func, *args):
+
+		"""
+		Calls a function, so that a malformed request of one client doesn't
+		stop the server for all clients
+		"""
+
+		try:
+			return func(*args)
+		except Exception:
+			print "comm_server.safe_call(): failed to handle a request"
+			traceback.print_exc()
+
+	def remove_closed(self):
+
+		"""
+		Forgets the sessions that have been closed and the UDP sessions that
+		have been idle for too long
+		"""
+
+		t = time.time()
+		for key, session in self.sessions.items():
+			if not session.closed and session.idle(t):
+				print "comm_server.remove_closed(): session with %s:%s timed out" % session.addr
+				session.close()
+			if session.closed:
+				if session.conn != None:
+					session.conn.close()
+				del self.sessions[key]
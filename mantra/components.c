@@ -0,0 +1,336 @@
+#include <stdlib.h>
+#include <stdio.h>
+#include "camera.h"
+
+short component_reserve(CAMERA *cam, int pixels)
+{
+
+	/**
+	Makes sure that the label buffers can hold a window of the given number of
+	pixels. The buffers grow with the largest window that has been scanned.
+	Returns 0 if memory could not be allocated
+	**/
+
+	int *labels, *parent;
+
+	if (pixels <= cam->component_capacity) {
+		return 1;
+	}
+	labels = realloc(cam->component_labels, pixels * sizeof(int));
+	if (labels == NULL) {
+		return 0;
+	}
+	cam->component_labels = labels;
+	parent = realloc(cam->component_parent, (pixels + 1) * sizeof(int));
+	if (parent == NULL) {
+		return 0;
+	}
+	cam->component_parent = parent;
+	cam->component_capacity = pixels;
+	return 1;
+}
+
+void component_free(CAMERA *cam)
+{
+	free(cam->component_labels);
+	free(cam->component_parent);
+	free(cam->components);
+	cam->component_labels = NULL;
+	cam->component_parent = NULL;
+	cam->components = NULL;
+	cam->component_capacity = 0;
+	cam->nr_of_components = 0;
+	cam->components_allocated = 0;
+}
+
+static inline int component_find(int *parent, int l)
+{
+	while (parent[l] != l) {
+		parent[l] = parent[parent[l]];
+		l = parent[l];
+	}
+	return l;
+}
+
+static inline int component_union(int *parent, int a, int b)
+{
+
+	/**
+	Merges the trees of two labels and returns the new root. The root is
+	always the lowest label, so that a parent never has a higher label than
+	its children
+	**/
+
+	a = component_find(parent, a);
+	b = component_find(parent, b);
+	if (a < b) {
+		parent[b] = a;
+		return a;
+	}
+	parent[a] = b;
+	return b;
+}
+
+int component_label(CAMERA *cam, COLOR_TABLE *table, WINDOW *window)
+{
+
+	/**
+	Labels the matching pixels of the window in a single pass in raster
+	order, and resolves the provisional labels to consecutive component
+	numbers (starting at 1). Pixels are connected to their eight neighbours.
+	Returns the number of components
+	**/
+
+	int ww = window->right - window->left + 1;
+	int wh = window->bottom - window->top + 1;
+	int *labels = cam->component_labels;
+	int *parent = cam->component_parent;
+	int *row, *above;
+	int x, y, i, l, n, count;
+
+	n = 0;
+	for (y = window->top; y <= window->bottom; y++) {
+		row = labels + (y - window->top) * ww;
+		above = row - ww;
+		for (x = window->left, i = 0; x <= window->right; x++, i++) {
+
+			if (!matching_pixel(cam, table, x, y)) {
+				row[i] = 0;
+				continue;
+			}
+
+			// Connect the pixel to the neighbours that have been labeled already
+			l = i > 0 ? row[i - 1] : 0;
+			if (y > window->top) {
+				if (i > 0 && above[i - 1]) {
+					l = l ? component_union(parent, l, above[i - 1]) : above[i - 1];
+				}
+				if (above[i]) {
+					l = l ? component_union(parent, l, above[i]) : above[i];
+				}
+				if (i < ww - 1 && above[i + 1]) {
+					l = l ? component_union(parent, l, above[i + 1]) : above[i + 1];
+				}
+			}
+			if (!l) {
+				l = ++n;
+				parent[l] = l;
+			}
+			row[i] = l;
+		}
+	}
+
+	// Because parents have lower labels than their children, the roots can be
+	// numbered in a single sweep
+	count = 0;
+	for (l = 1; l <= n; l++) {
+		parent[l] = parent[l] == l ? ++count : parent[parent[l]];
+	}
+
+	for (i = 0; i < ww * wh; i++) {
+		if (labels[i]) {
+			labels[i] = parent[labels[i]];
+		}
+	}
+	return count;
+}
+
+void component_measure(CAMERA *cam, WINDOW *window, int count)
+{
+
+	/**
+	Collects the area, the centroid and the bounding box of every component
+	from the resolved labels
+	**/
+
+	int ww = window->right - window->left + 1;
+	int x, y, i;
+	int *row;
+	COMPONENT *components, *c;
+
+	if (count > cam->components_allocated) {
+		c = realloc(cam->components, count * sizeof(COMPONENT));
+		if (c == NULL) {
+			cam->nr_of_components = 0;
+			return;
+		}
+		cam->components = c;
+		cam->components_allocated = count;
+	}
+	components = cam->components;
+
+	for (i = 0; i < count; i++) {
+		components[i].area = 0;
+		components[i].sx = 0;
+		components[i].sy = 0;
+		components[i].left = window->right;
+		components[i].right = window->left;
+		components[i].top = window->bottom;
+		components[i].bottom = window->top;
+	}
+
+	for (y = window->top; y <= window->bottom; y++) {
+		row = cam->component_labels + (y - window->top) * ww;
+		for (x = window->left; x <= window->right; x++, row++) {
+			if (!*row) {
+				continue;
+			}
+			c = &components[*row - 1];
+			c->area++;
+			c->sx += x;
+			c->sy += y;
+			c->left = MIN(c->left, x);
+			c->right = MAX(c->right, x);
+			c->top = MIN(c->top, y);
+			c->bottom = MAX(c->bottom, y);
+		}
+	}
+	cam->nr_of_components = count;
+}
+
+void component_find_all(CAMERA *cam, COLOR_TABLE *table, WINDOW *window)
+{
+
+	/**
+	Finds all connected components of matching pixels in the window. The
+	labels are kept in a buffer of the size of the window instead of in the
+	match array, because the match array holds stamps rather than labels and
+	spans the entire frame, whereas the rows of a small window are adjacent
+	in the buffer
+	**/
+
+	int ww = window->right - window->left + 1;
+	int wh = window->bottom - window->top + 1;
+
+	cam->nr_of_components = 0;
+	cam->component_window.right = -1;
+	if (ww <= 0 || wh <= 0) {
+		return;
+	}
+	if (!component_reserve(cam, ww * wh)) {
+		printf("Failed to allocate the component buffers\n");
+		return;
+	}
+	component_measure(cam, window, component_label(cam, table, window));
+	cam->component_window = *window;
+}
+
+void component_highlight(CAMERA *cam)
+{
+
+	/**
+	Highlights the pixels that belong to a component in the window that was
+	labeled last
+	**/
+
+	WINDOW *w = &cam->component_window;
+	int *row = cam->component_labels;
+	int x, y;
+
+	for (y = w->top; y <= w->bottom; y++) {
+		for (x = w->left; x <= w->right; x++, row++) {
+			if (!*row) {
+				continue;
+			}
+			if (cam->pixel_format == PIXEL_RGB24) {
+				cam->frame[x * cam->bytesperpx + y * cam->format.fmt.pix.bytesperline + 1] = 255;
+			} else {
+				highlight_pixel(cam, x, y, 1);
+			}
+		}
+	}
+}
+
+SCAN component_scan(CAMERA *cam, int ex, int ey, COLOR_TABLE *table, WINDOW *window)
+{
+
+	/**
+	An alternative to spiral_scan(), which finds all connected components in
+	the window and picks the one with a centroid closest to (ex, ey).
+	Components smaller than min_z are ignored, so that a second object of
+	the same color or some noise does not affect the position of the object
+	**/
+
+	extern int min_z;
+	extern short size_mode;
+
+	SCAN result;
+	COMPONENT *c, *best = NULL;
+	double dx, dy, d, best_d = 0;
+	int i;
+
+	component_find_all(cam, table, window);
+
+	for (i = 0; i < cam->nr_of_components; i++) {
+		c = &cam->components[i];
+		if (c->area < min_z) {
+			continue;
+		}
+		dx = (double) c->sx / c->area - ex;
+		dy = (double) c->sy / c->area - ey;
+		d = dx * dx + dy * dy;
+		if (best == NULL || d < best_d) {
+			best = c;
+			best_d = d;
+		}
+	}
+
+	result.keep_scanning = 0;
+	if (best == NULL) {
+		result.x = -1;
+		result.y = -1;
+		result.count = 0;
+		return result;
+	}
+
+	result.x = best->sx / best->area;
+	result.y = best->sy / best->area;
+	if (size_mode == SIZE_SURFACE) {
+		result.count = best->area;
+	} else {
+		result.count = (best->right - best->left) + (best->bottom - best->top);
+	}
+	return result;
+}
+
+PyObject *object_components(CAMERA *cam, int color_r, int color_g, int color_b, int fuzziness, int highlight)
+{
+
+	/**
+	Finds all connected components of the color in the entire frame. Returns
+	a list with an (x, y, area, left, top, right, bottom) tuple for every
+	component of at least min_z pixels, in the coordinates of track_object()
+	**/
+
+	extern int min_z;
+
+	int width = cam->format.fmt.pix.width;
+	WINDOW window = frame_window(cam);
+	COLOR_TABLE *table;
+	COMPONENT *c;
+	PyObject *result, *item;
+	int i;
+
+	Py_BEGIN_ALLOW_THREADS
+	table = color_table(cam, color_r, color_g, color_b, fuzziness);
+	component_find_all(cam, table, &window);
+	if (highlight) {
+		component_highlight(cam);
+	}
+	Py_END_ALLOW_THREADS
+
+	result = PyList_New(0);
+	for (i = 0; i < cam->nr_of_components; i++) {
+		c = &cam->components[i];
+		if (c->area < min_z) {
+			continue;
+		}
+
+		// The horizontal axis is mirrored, like the tracked positions
+		item = Py_BuildValue("(iiiiiii)", width - (int) (c->sx / c->area), (int) (c->sy / c->area),
+			c->area, width - c->right, c->top, width - c->left, c->bottom);
+		PyList_Append(result, item);
+		Py_DECREF(item);
+	}
+	return result;
+}
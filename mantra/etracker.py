@@ -20,14 +20,13 @@ import calibrate
 from pygame.locals import *
 import datetime
 import math
-import socket
 import thread
 import os
 import sys
 import pickle
 from PIL import Image
 from PIL import ImageDraw
-from mantra import camera, v4l2_cid
+from mantra import camera, v4l2_cid, comm
 
 class etracker:
 
@@ -42,13 +41,14 @@ class etracker:
 		Initialize the tracker
 		"""					
 		
-		devices = self.available_camera_devices()
-		
-		if len(devices) == 0:
-			print "No video devices (/dev/videoX) have been found!"
-			quit(1)
-		
+		# The camera device can also be "synthetic" or a file containing
+		# recorded frames, in which case no video device is required
 		if camera_dev == None:
+			devices = self.available_camera_devices()
+			if len(devices) == 0:
+				print "No video devices (/dev/videoX) have been found!"
+				print "Use 'synthetic' or a recording as camera device to track without a camera"
+				quit(1)
 			self.camera_dev = devices[0]
 		else:			
 			self.camera_dev = camera_dev
@@ -58,9 +58,12 @@ class etracker:
 		if resolution == None:
 			resolution = 320, 240
 		
-		camera.camera_init(self.camera_dev, resolution[0], resolution[1])
+		# The camera context owns the device and the tracking state, so that
+		# every tracker can use its own camera
+		self.cam = camera.CAMERA()
+		camera.camera_init(self.cam, self.camera_dev, resolution[0], resolution[1])
 
-		self.resolution = camera.camera_get_width(), camera.camera_get_height()
+		self.resolution = camera.camera_get_width(self.cam), camera.camera_get_height(self.cam)
 
 		# These paths work at least on Ubuntu 9.10, but there is
 		# probably a more clever way to find fonts. Anyway, if no
@@ -77,6 +80,7 @@ class etracker:
 		self.port = 40007
 		self.fname = "recording.tsv"
 		self.comm_thread = None
+		self.server = None
 		self.control_mouse = False
 		self.log = None
 		self.log_samples = True
@@ -85,6 +89,17 @@ class etracker:
 		self.monitor_webcam = False
 		self.monitor_tracking = True
 		self.predict = True
+		# In SCAN_WINDOW and SCAN_COMPONENTS mode, the window extends window_scale standard
+		# deviations of the prediction error plus window_margin pixels beyond
+		# the object. window_alpha is the weight of the newest prediction error
+		self.window_scale = 3
+		self.window_margin = 8
+		self.window_alpha = 0.2
+		# Lost objects that are not around their prediction are searched for
+		# in slices of at most recovery_budget pixels per frame, so that the
+		# other objects are still tracked at the full rate. With 0, the entire
+		# frame is searched every frame
+		self.recovery_budget = 4096
 		self.smov_threshold = 20
 		self.emov_threshold = 5
 		self.v3d = False
@@ -95,7 +110,10 @@ class etracker:
 		self.line_spacing = 3
 		self.comm_protocol = "tcp"
 		self.sample_nr = 0
-		self.last_comm_sample = -1
+		# The number of the last snapshot of all objects, the sequence number
+		# of its frame and the samples
+		self.comm_frame = 0, 0, []
+		self.comm_streaming = False
 		self.target_t_res = 40
 		self.debug = "--debug" in sys.argv
 
@@ -110,40 +128,180 @@ class etracker:
 		Performs a graceful shutdown
 		"""
 		
-		camera.camera_close()
+		camera.camera_close(self.cam)
 
-	def bind_socket(self, protocol):
+	def comm_start(self):
 
 		"""
-		Binds to a socket using a specified protocol
+		Starts the communication server, which serves all clients from a
+		single thread, so that any number of clients can be connected at the
+		same time
 		"""
 
-		self.sock = socket.socket(socket.AF_INET, protocol)
-		bound = False
-		while not bound:
-			try:
-				self.sock.bind( (self.host, self.port) )
-				print "Listening on port", self.port
-				bound = True
-			except:
-				print "Unable to bind to port", self.port
-				self.port += 1
+		self.server = comm.comm_server(self, self.host, self.port, self.comm_protocol.lower())
+		self.port = self.server.port
+		self.comm_thread = thread.start_new_thread(self.server.run, ())
 
-	def comm_send(self, s):
+	def comm_publish(self, o):
 
 		"""
-		Sends a single message
+		Makes the new sample of an object available to the clients, right
+		after it has been tracked. This is called by the tracking loop and
+		never blocks
 		"""
-		
-		if self.comm_protocol == "tcp":
-			self.conn.send(s)
+
+		o.comm_sample_nr = self.sample_nr
+		o.comm_timestamp = self.cam.frame_timestamp
+		if self.server == None:
+			return
+
+		# Streamed samples are passed on as they are, because the object may
+		# have been tracked again by the time that the server sends them. They
+		# are formatted by the server
+		if self.comm_streaming:
+			self.server.call(self.comm_stream, self.comm_snapshot(self.objects.index(o)))
 		else:
-			self.sock.sendto(s, self.comm_addr)				
+			self.server.wake()
+
+	def comm_publish_frame(self):
+
+		"""
+		Makes a snapshot of the samples of all objects, once all objects of
+		a frame have been tracked, so that MSAMP returns samples from a
+		single frame. This is called by the tracking loop and never blocks
+		"""
 
-	def comm_process(self, s):
+		self.comm_frame = self.comm_frame[0] + 1, self.cam.frame_sequence, \
+			[self.comm_snapshot(i) for i in range(len(self.objects))]
+		if self.server != None:
+			self.server.wake()
 
+	def comm_notify(self, o, kind, s):
+
+		"""
+		Sends a message to all clients that wait for the start (SMOV) or end
+		(EMOV) of a movement of an object. This is called by the tracking loop
+		and never blocks, because the message is sent by the server thread
 		"""
-		Handles a single request and sends a reply if necessary
+
+		if self.server != None:
+			self.server.call(self.comm_deliver, self.objects.index(o), kind, s)
+
+	def comm_deliver(self, i, kind, s):
+
+		"""
+		Delivers a message from comm_notify(). This is called by the server
+		"""
+
+		for session in self.server.sessions.values():
+			if session.comm_wait.get(i) == kind:
+				session.send(s)
+				del session.comm_wait[i]
+
+	def comm_snapshot(self, i):
+
+		"""
+		Returns the current sample of an object as an (object nr, sample nr,
+		timestamp, moving, (x, y, z), velocity, acceleration) tuple, which
+		comm_session.send_sample() sends in the format of the client
+		"""
+
+		if not 0 <= i < len(self.objects):
+			return i, 0, 0, -1, (-1, -1, -1), 0, 0
+		o = self.objects[i]
+		return i, max(0, o.comm_sample_nr), o.comm_timestamp, int(o.going), \
+			o.cpos, o.v, o.a
+
+	def comm_stream(self, sample):
+
+		"""
+		Sends a sample of an object to all clients that subscribed to the
+		object. This is called by the server
+		"""
+
+		i = sample[0]
+		streaming = False
+		for session in self.server.sessions.values():
+			if i in session.subscriptions:
+				subscription = session.subscriptions[i]
+				if subscription[1] % subscription[0] == 0:
+					session.send_sample(sample, streamed=True)
+				subscription[1] += 1
+			if session.subscriptions:
+				streaming = True
+
+		# Stop streaming once the last subscriber is gone
+		self.comm_streaming = streaming
+
+	def comm_object_nr(self, s):
+
+		"""
+		Parses an object nr from a request. Raises a ValueError if the nr
+		doesn't fit in a sample record (see comm.SAMPLE_RECORD)
+		"""
+
+		i = int(s)
+		if not 0 <= i <= comm.MAX_OBJECT_NR:
+			raise ValueError("object nr %d is out of range" % i)
+		return i
+
+	def comm_sample(self, session, i):
+
+		"""
+		Sends the current sample of an object to a client
+		"""
+
+		session.send_sample(self.comm_snapshot(i))
+
+	def comm_frame_sample(self, session, objects):
+
+		"""
+		Sends the samples of several objects from the last frame of which a
+		snapshot was made to a client
+
+		Arguments:
+		session -- the session of the client
+		objects -- a list of object nrs, or an empty list for all objects
+		"""
+
+		frame_nr, sequence, samples = self.comm_frame
+		if len(objects) == 0:
+			objects = range(len(samples))
+		session.send_frame(sequence, [samples[i] if 0 <= i < len(samples) \
+			else (i, 0, 0, -1, (-1, -1, -1), 0, 0) for i in objects])
+		session.last_frame = frame_nr
+
+	def comm_update(self, session):
+
+		"""
+		Answers the SAMP requests of a client for which a sample is available
+		that the client hasn't received yet. The requests are answered in the
+		order in which they arrived. This is called by the server whenever it
+		is woken. A request is removed before it is answered, so that a
+		request that can't be answered doesn't block the ones behind it
+		"""
+
+		while session.samp_waiting:
+			kind, arg = session.samp_waiting[0]
+			if kind == "MSAMP":
+				if self.comm_frame[0] == session.last_frame:
+					return
+				del session.samp_waiting[0]
+				self.comm_frame_sample(session, arg)
+			else:
+				if arg < len(self.objects):
+					sample_nr = self.objects[arg].comm_sample_nr
+					if sample_nr == session.last_samples.get(arg):
+						return
+					session.last_samples[arg] = sample_nr
+				del session.samp_waiting[0]
+				self.comm_sample(session, arg)
+
+	def comm_process(self, session, s):
+
+		"""
+		Handles a single request of a client and sends a reply if necessary.
+		This is called by the server. Returns False if the session should end
 		"""
 		
 		# Only handle requests while tracking
@@ -163,44 +321,83 @@ class etracker:
 					print "etracker.comm_process(): failed to write to logfile"					
 				return True
 	
-			# Returns a sample
+			# Returns a sample. If the client has already received the current
+			# sample of the object, the reply is sent as soon as the object
+			# has been tracked again (see comm_update())
 			if data[0] == "SAMP" and len(data) == 2:
+				session.samp_waiting.append( ("SAMP", self.comm_object_nr(data[1])) )
+				self.comm_update(session)
+				return True
+				
+			# Streams the samples of the listed objects, or of all objects, to
+			# the client as soon as they are produced, optionally only every
+			# nth sample: SUBSCRIBE [EVERY n] [o ...]. In the text format,
+			# samples are sent as STREAM o moving x y z
+			if data[0] == "SUBSCRIBE":
+				args = data[1:]
+				every = 1
+				if len(args) > 1 and args[0] == "EVERY":
+					every = max(1, int(args[1]))
+					args = args[2:]
+				if len(args) > 0:
+					objects = [int(i) for i in args]
+				else:
+					objects = range(len(self.objects))
+				for i in objects:
+					session.subscriptions[i] = [every, 0]
+				self.comm_streaming = True
+				return True
 
-				# Wait until a new sample is available
-				while self.sample_nr == self.last_comm_sample:
-					pygame.time.wait(5)
-					
-				i = int(data[1])
-				if i < len(self.objects):
-					o = self.objects[i]
-					self.comm_send("%d %s %s %s\n" % (o.going, o.cpos[0], o.cpos[1], o.cpos[2]))
+			# Stops streaming the listed objects, or all objects
+			if data[0] == "UNSUBSCRIBE":
+				if len(data) > 1:
+					for i in data[1:]:
+						session.subscriptions.pop(int(i), None)
 				else:
-					self.comm_send("-1 -1 -1 -1\n")
+					session.subscriptions = {}
+				return True
 
-				self.last_comm_sample = self.sample_nr
+			# Switches between the text format and the binary format for samples
+			# (see comm.SAMPLE_RECORD). The reply confirms the format, so that
+			# clients can tell whether the server supports it
+			if data[0] == "FORMAT" and len(data) == 2 and data[1] in ("TEXT", "BINARY"):
+				session.send("FORMAT %s\n" % data[1])
+				session.binary = data[1] == "BINARY"
 				return True
-				
+
+			# Returns the samples of the listed objects, or of all objects,
+			# from the same frame, preceded by the sequence number of the
+			# frame: MSAMP [o ...]. MSAMP waits for a frame that the client
+			# hasn't received yet, NBMSAMP returns right away
+			if data[0] in ("MSAMP", "NBMSAMP"):
+				objects = [self.comm_object_nr(i) for i in data[1:]]
+				if data[0] == "MSAMP":
+					session.samp_waiting.append( ("MSAMP", objects) )
+					self.comm_update(session)
+				else:
+					self.comm_frame_sample(session, objects)
+				return True
+
 			# Returns a sample, but unlike the regular "SAMP"
 			# it returns right away, without waiting for a new sample
 			if data[0] == "NBSAMP" and len(data) == 2:
-			
-				i = int(data[1])
-				if i < len(self.objects):
-					o = self.objects[i]
-					self.comm_send("%d %s %s %s\n" % (o.going, o.cpos[0], o.cpos[1], o.cpos[2]))
-				else:
-					self.comm_send("-1 -1 -1 -1\n")				
+				self.comm_sample(session, self.comm_object_nr(data[1]))
+				return True
 							
 			# Waits for the start/ end of a movement
 			if (data[0] == "SMOV" or data[0] == "EMOV") and len(data) == 2:
 				i = int(data[1])
 				if i < len(self.objects):
-					self.objects[i].comm_wait = data[0]
+					session.comm_wait[i] = data[0]
 				return True				
 					
+			# Keeps a UDP session alive without a reply (see comm.UDP_TIMEOUT)
+			if s == "ALIVE":
+				return True
+
 			# Say hi back (for communication testing purposes)
 			if s == "HI":
-				self.comm_send("HI\n")
+				session.send("HI\n")
 				return True
 
 			# The client says bye, so disconnect
@@ -256,82 +453,6 @@ class etracker:
 					
 			return True		
 
-	def comm_tcp(self):
-
-		"""
-		This function is spawned as a thread and handles communications
-		through TCP/IP. UDP is the preferred methode, but is not
-		supported by E-prime
-		"""
-
-		print "etracker.comm_tcp(): communicating using TCP"
-
-		# Create a TCP socket		
-		self.bind_socket(socket.SOCK_STREAM)		
-
-		# Loop infinitely, waiting for clients to connect
-		while True:
-
-			print "etracker.comm_tcp(): waiting for an incoming connection"
-
-			# Wait for an incoming connection
-			self.sock.listen(1)			
-			print "etracker.comm_tcp(): incoming connection ... "			
-			self.conn, self.comm_addr = self.sock.accept()
-
-			print "etracker.comm_tcp(): connected by %s:%s" % self.comm_addr
-			
-			self.comm_tcp_session()
-						
-	def comm_tcp_session(self):
-	
-		"""
-		Handles a single connection session
-		"""
-						
-		while True:
-
-			s = ""
-			while s[-1:] != "\n":
-				rcv = self.conn.recv(128)			
-				if rcv == False or rcv == "":
-					break
-				s += rcv
-
-			if not rcv or rcv == "":
-				print "etracker.comm_tcp_session(): connection closed"
-				self.conn.close()
-				return
-
-			# Split the line, just in case multiple commands were
-			# sent at once and process them
-			for _s in s.split("\n"):
-				if not self.comm_process(_s):
-					print "etracker.comm_tcp_session(): connection closed"
-					self.conn.close()
-					return						
-		
-	def comm_udp(self):
-	
-		"""
-		This function is spawned as a thread and handles communications.
-		Communication is through UDP.
-		"""
-
-		print "etracker.comm_udp(): communicating using UDP"
-
-		# Create a socket and bind it to the first available port (starting from the preferred port)
-		self.bind_socket(socket.SOCK_DGRAM)
-		
-		# Loop infinitely until the application is quit somewhere else
-		while True:
-				
-			# Wait for an incoming request
-			s, self.comm_addr = self.sock.recvfrom(128)
-			
-			# Process the request
-			self.comm_process(s)
-			
 	def available_camera_devices(self):
 		
 		"""
@@ -351,10 +472,10 @@ class etracker:
 		Attempts to change the resolution to a specific value
 		"""
 				
-		camera.camera_close()
-		camera.camera_init(camera_dev, resolution[0], resolution[1])
+		camera.camera_close(self.cam)
+		camera.camera_init(self.cam, camera_dev, resolution[0], resolution[1])
 		self.camera_dev = camera_dev		
-		self.resolution = camera.camera_get_width(), camera.camera_get_height()
+		self.resolution = camera.camera_get_width(self.cam), camera.camera_get_height(self.cam)
 		
 
 	def available_camera_options(self):
@@ -366,7 +487,7 @@ class etracker:
 		options = []
 		for option in dir(v4l2_cid):
 			val = eval("v4l2_cid.%s" % option)
-			if type(val) == int and camera.camera_control_available(val) and option[9:] not in ["BASE", "USER_BASE"]:
+			if type(val) == int and camera.camera_control_available(self.cam, val) and option[9:] not in ["BASE", "USER_BASE"]:
 				options.append(option[9:].capitalize())
 				
 		return options
@@ -377,7 +498,7 @@ class etracker:
 		Changes a camera option (contrast etc.)
 		"""
 
-		camera.camera_set_control(eval("v4l2_cid.V4L2_CID_%s" % option.upper()), value)
+		camera.camera_set_control(self.cam, eval("v4l2_cid.V4L2_CID_%s" % option.upper()), value)
 
 	def get_camera_option(self, option):
 
@@ -385,7 +506,7 @@ class etracker:
 		Retrieves a camera option (contrast etc.)
 		"""		
 
-		return camera.camera_get_control(eval("v4l2_cid.V4L2_CID_%s" % option.upper()))		
+		return camera.camera_get_control(self.cam, eval("v4l2_cid.V4L2_CID_%s" % option.upper()))		
 														
 	def create_screen(self, title):
 	
@@ -452,6 +573,12 @@ class etracker:
 		
 		self.log.write("%s\tMATCH_MODE\t%d\n" % (pygame.time.get_ticks(), camera.cvar.match_mode))						
 		self.log.write("%s\tSIZE_MODE\t%d\n" % (pygame.time.get_ticks(), camera.cvar.size_mode))
+		self.log.write("%s\tSCAN_MODE\t%d\n" % (pygame.time.get_ticks(), camera.cvar.scan_mode))
+		self.log.write("%s\tCAPTURE\t%d\t%d\t%d\n" % (pygame.time.get_ticks(), camera.cvar.capture_threaded, camera.cvar.capture_policy, camera.cvar.capture_queue_size))
+		self.log.write("%s\tTHREADS\t%d\n" % (pygame.time.get_ticks(), camera.cvar.nr_of_threads))
+		self.log.write("%s\tACQUIRE\t%d\t%d\n" % (pygame.time.get_ticks(), camera.cvar.acquire_mode, camera.cvar.acquire_step))
+		self.log.write("%s\tBACKGROUND\t%d\t%d\t%d\t%d\n" % (pygame.time.get_ticks(), camera.cvar.background_model, camera.cvar.motion_acquire, camera.cvar.background_warmup, camera.cvar.background_threshold))
+		self.log.write("%s\tPIXEL_FORMAT\t%d\n" % (pygame.time.get_ticks(), self.cam.pixel_format))
 		self.log.write("%s\tVELOCITY_3D\t%d\n" % (pygame.time.get_ticks(), self.v3d))
 		self.log.write("%s\tLOG_SAMPLES\t%d\n" % (pygame.time.get_ticks(), self.log_samples))		
 		self.log.write("%s\tCONTROL_MOUSE\t%d\n" % (pygame.time.get_ticks(), self.control_mouse))		
@@ -499,14 +626,12 @@ class etracker:
 			text = font.render("Match mode = %d <'m'>" % camera.cvar.match_mode, False, (255, 255, 255))
 			screen.blit(text, (10, 90))
 			# Capture the image
-			camera.camera_capture()
+			camera.camera_capture(self.cam)
 			# Make the matching part of the webcam image green
 			if target_color != None:
-				camera.highlight_color(target_color[0], target_color[1], target_color[2], fuzziness)
+				camera.highlight_color(self.cam, target_color[0], target_color[1], target_color[2], fuzziness)
 			# Display the image and the text
-			s = camera.camera_to_string()
-			s += ''
-			im = pygame.image.frombuffer(s, self.resolution, "RGB")
+			im = pygame.image.frombuffer(camera.camera_display_buffer(self.cam), self.resolution, "RGB")
 			screen.blit(im, (0, self.display_margin))
 									
 			# Display the webcam image			
@@ -541,8 +666,8 @@ class etracker:
 					pos = pygame.mouse.get_pos()								
 					if pos[1] >= self.display_margin:
 						if target_color == None:
-							camera.camera_get_px(pos[0], pos[1] - self.display_margin)
-							target_color = camera.cvar.r, camera.cvar.g, camera.cvar.b
+							camera.camera_get_px(self.cam, pos[0], pos[1] - self.display_margin)
+							target_color = self.cam.r, self.cam.g, self.cam.b
 						else:
 							target_color = None
 												
@@ -553,25 +678,26 @@ class etracker:
 		This function performs the actual tracking
 		"""
 									
-		# Spawn the communications thread. Since the thread remains active
+		# Start the communication server. Since the server remains active
 		# if tracking is stopped, this is done only once
 		if self.comm_thread == None:
-			if self.comm_protocol.lower() == "udp":
-				self.comm_thread = thread.start_new_thread(self.comm_udp, ())
-			else:
-				self.comm_thread = thread.start_new_thread(self.comm_tcp, ())
-		self.comm_addr = None
+			self.comm_start()
 
 		# Initialize the log
 		self.start_log()
 	
 		# Initialize the screen
 		screen, font = self.create_screen("Track objects")		
+		
+		# The match mode may have changed since the objects were defined
+		for o in self.objects:
+			o.prepare()
 						
 		# Keep tracking until tracking is set to stop
 		self.tracking = True
 		self.pause_tracking = False				
 		t = pygame.time.get_ticks()
+		frames_dropped = self.cam.frames_dropped
 		
 		while self.tracking:
 		
@@ -594,10 +720,12 @@ class etracker:
 				except:
 					print "Failed to write to logfile"					
 
-			# Delay
-			delay = self.target_t_res - pygame.time.get_ticks() + t
-			if delay > 0:				
-				pygame.time.wait(delay)
+			# Delay. With a capture thread, camera_capture() waits for the next
+			# frame, so the camera determines the pace
+			if not camera.cvar.capture_threaded:
+				delay = self.target_t_res - pygame.time.get_ticks() + t
+				if delay > 0:				
+					pygame.time.wait(delay)
 
 			# Keep track of timing									
 			t_res = pygame.time.get_ticks() - t
@@ -607,9 +735,9 @@ class etracker:
 			if self.monitor_tracking:
 				screen.fill( (0, 0, 0) )
 				pygame.draw.rect(screen, (255, 255, 255), (0, self.display_margin, self.resolution[0], self.resolution[1]), 1)
-				text = font.render("%.3d ms (%.3d fps)" % (t_res, 1000/ t_res), False, (255, 255, 255))
+				text = font.render("%.3d ms (%.3d fps)" % (t_res, 1000/ max(1, t_res)), False, (255, 255, 255))
 				screen.blit(text, (self.resolution[0] - 100, 10))				
-				text = font.render("Match mode: %d <'m'>  Size mode: %d <'i'>" % (camera.cvar.match_mode, camera.cvar.size_mode), False, (255, 255, 255))
+				text = font.render("Match mode: %d <'m'>  Size mode: %d <'i'>  Scan mode: %d <'s'>" % (camera.cvar.match_mode, camera.cvar.size_mode, camera.cvar.scan_mode), False, (255, 255, 255))
 				screen.blit(text, (10, 10))				
 				text = font.render("3D velocity: %d <'v'> Log samples: %d <'l'> Control mouse: %d <'c'>" % (self.v3d, self.log_samples, self.control_mouse), False, (255, 255, 255))
 				screen.blit(text, (10, 20))	
@@ -619,23 +747,76 @@ class etracker:
 			spacing = self.line_spacing * self.font_size
 
 			# Capture the image			
-			camera.camera_capture()
+			camera.camera_capture(self.cam)
 
 			t2 = pygame.time.get_ticks()
+
+			# Log frames that the capture thread had to drop
+			if self.cam.frames_dropped != frames_dropped:
+				try:
+					self.log.write("%s\tDROPPED\t%d\n" % (t2, self.cam.frames_dropped - frames_dropped))
+				except:
+					print "Failed to write to logfile"
+				frames_dropped = self.cam.frames_dropped
+						
+			# For RGB24 frames, the webcam image refers directly to the frame,
+			# so it always shows the highlighting of the objects that have been
+			# tracked. Other formats are converted when the image is shown
+			rgb24 = self.cam.pixel_format == camera.PIXEL_RGB24
+			if self.monitor_webcam and rgb24:
+				im = pygame.image.frombuffer(camera.camera_display_buffer(self.cam), self.resolution, "RGB")
+						
+			# In label mode, all objects are tracked in a single pass over the
+			# frame. Otherwise, all objects are tracked with a single call, so
+			# that the overhead of calling camera doesn't grow with the number
+			# of objects. In window mode, objects are searched for only around
+			# their prediction. Objects that have been lost are searched for
+			# around their prediction first and then in slices of the frame.
+			# Objects that haven't been found yet are searched for in the
+			# entire frame
+			if camera.cvar.scan_mode == camera.SCAN_LABEL:
+				positions = camera.label_objects(self.cam, [tuple(o.color) + (o.fuzziness, ) for o in self.objects], self.monitor_webcam)
+			else:
+				windowed = camera.cvar.scan_mode in (camera.SCAN_WINDOW, camera.SCAN_COMPONENTS)
+				recovering = [o.lost and o.lost_t != None and self.recovery_budget > 0 for o in self.objects]
+				requests = []
+				for i, o in enumerate(self.objects):
+					request = tuple(o.color) + (o.fuzziness, ) + o.pre[:2]
+					if windowed:
+						request += o.window
+					elif recovering[i]:
+						request += (0, 0)
+					if recovering[i]:
+						request += (self.recovery_budget, o.search_cursor)
+					requests.append(request)
+				results = camera.track_objects(self.cam, requests, self.monitor_webcam)
+
+			# If the webcam is monitored, show the image once all objects have
+			# been tracked and highlighted, so that other formats are converted
+			# only once per frame
+			if self.monitor_webcam:
+				if not rgb24:
+					im = pygame.image.frombuffer(camera.camera_display_buffer(self.cam), self.resolution, "RGB")
+				screen.blit(im, (0, self.display_margin))
 						
 			# Walk through all objects
-			for o in self.objects:					
+			for i, o in enumerate(self.objects):
 								
 				# Obtain the object position using camera
-				camera.track_object(o.color[0], o.color[1], o.color[2], o.fuzziness, o.pre[0], o.pre[1], self.monitor_webcam)
-				o.track( (camera.cvar.track_x, camera.cvar.track_y, camera.cvar.track_z), t, t_res)
+				if camera.cvar.scan_mode == camera.SCAN_LABEL:
+					o.track(positions[i], t, t_res)
+				else:
+					x, y, z, fallback, cursor = results[i]
+					if recovering[i]:
+						o.search_cursor = cursor
+					o.track( (x, y, z), t, t_res)
+					if fallback and self.log_samples:
+						try:
+							self.log.write("%s\tWINDOW_FALLBACK\t%s\n" % (t, o.name))
+						except:
+							print "Failed to write to logfile"
 				self.sample_nr += 1
-											
-				# If the webcam is monitored, overlay the image
-				
-				if self.monitor_webcam:
-					im = pygame.image.frombuffer(camera.camera_to_string(), self.resolution, "RGB")	
-					screen.blit(im, (0, self.display_margin))
+				self.comm_publish(o)
 																																
 				# If the object was detected								
 				if not o.lost:				
@@ -682,6 +863,9 @@ class etracker:
 						screen.blit(text, (100, 15 + spacing))
 							
 				spacing += int(self.line_spacing * self.font_size)
+
+			# All objects have been tracked, so their samples are consistent
+			self.comm_publish_frame()
 						
 			# Process user input
 			for event in pygame.event.get()	:
@@ -718,6 +902,8 @@ class etracker:
 					# M changes the match mode
 					if event.key == pygame.K_m:
 						camera.cvar.match_mode = 1 - camera.cvar.match_mode
+						for o in self.objects:
+							o.prepare()
 						try:
 							self.log.write("%s\tMATCH_MODE\t%d\n" % (pygame.time.get_ticks(), camera.cvar.match_mode))
 						except:
@@ -731,6 +917,23 @@ class etracker:
 						except:
 							print "Failed to write to logfile"							
 						
+					# S cycles through spiral scans, single-pass labeling, spiral
+					# scans within a window around the prediction and connected
+					# components within that window
+					if event.key == pygame.K_s:
+						if camera.cvar.scan_mode == camera.SCAN_SPIRAL:
+							camera.cvar.scan_mode = camera.SCAN_LABEL
+						elif camera.cvar.scan_mode == camera.SCAN_LABEL:
+							camera.cvar.scan_mode = camera.SCAN_WINDOW
+						elif camera.cvar.scan_mode == camera.SCAN_WINDOW:
+							camera.cvar.scan_mode = camera.SCAN_COMPONENTS
+						else:
+							camera.cvar.scan_mode = camera.SCAN_SPIRAL
+						try:
+							self.log.write("%s\tSCAN_MODE\t%d\n" % (pygame.time.get_ticks(), camera.cvar.scan_mode))
+						except:
+							print "Failed to write to logfile"							
+						
 					# V changes the velocity mode (whether or not it takes depth into account)
 					if event.key == pygame.K_v:
 						self.v3d = not self.v3d
@@ -802,12 +1005,39 @@ class tracker_object:
 		self.cpos = 320, 240, 100
 		self.pre = 320, 240, 100
 		self.going = False
+
+		# The variance of the prediction error along x and y, which determines
+		# the size of the window that is scanned in SCAN_WINDOW and
+		# SCAN_COMPONENTS mode. It starts out large, so that the first windows
+		# are generous
+		self.pre_var = 10000.0, 10000.0
+		self.window = 100, 100
+
+		# Where the search for the object continues while it is lost (-1 starts
+		# a new search) and when it was lost
+		self.search_cursor = -1
+		self.lost_t = None
 		self.start_pos = 0, 0, 0
 		self.end_pos = 0, 0, 0
-		self.comm_wait = None
+
+		# The sample number of the last sample of this object that was made
+		# available to the clients, and when its frame was captured
+		self.comm_sample_nr = -1
+		self.comm_timestamp = 0
 		
 		self.c = []
 		
+		self.prepare()
+		
+	def prepare(self):
+	
+		"""
+		Builds the color table for the current match mode in advance, so that
+		the table doesn't have to be built while tracking
+		"""
+		
+		camera.color_table_prepare(self.et.cam, self.color[0], self.color[1], self.color[2], self.fuzziness)
+		
 	def track(self, pos, t, t_res):
 	
 		"""
@@ -816,6 +1046,15 @@ class tracker_object:
 	
 		# Determine whether the object was found
 		if pos[2] > 0:
+		
+			# Log how long it took to find the object again
+			if self.lost and self.lost_t != None:
+				try:
+					self.et.log.write("%s\tREACQUIRED\t%s\t%s\n" % (t, self.name, t - self.lost_t))
+				except:
+					print "Failed to write to logfile"
+			self.lost_t = None
+			self.search_cursor = -1
 				
 			self.lost = False
 			dx = pos[0] - self.pos[0]
@@ -833,8 +1072,14 @@ class tracker_object:
 			self.v = v				
 			self.pos = pos
 			
+			# Keep track of how far off the previous prediction was
+			a = self.et.window_alpha
+			self.pre_var = (1 - a) * self.pre_var[0] + a * (pos[0] - self.pre[0]) ** 2, \
+				(1 - a) * self.pre_var[1] + a * (pos[1] - self.pre[1]) ** 2
+			
 			# Predicted position for the next sample
 			self.pre = int(pos[0] + dx), int(pos[1] + dy), int(pos[2] + dz)
+			self.update_window()
 		
 			# Get calibrated coordinates (if specified)
 			if self.calibration == None:
@@ -851,9 +1096,7 @@ class tracker_object:
 				except:
 					print "Failed to write to logfile"					
 			
-				if self.comm_wait == "SMOV":
-					self.et.comm_send("%s %s %s\n" % self.start_pos)
-					self.comm_wait = None
+				self.et.comm_notify(self, "SMOV", "%s %s %s\n" % self.start_pos)
 							
 			# Determine movement end
 			if self.v < self.et.emov_threshold and self.going:
@@ -864,11 +1107,24 @@ class tracker_object:
 				except:
 					print "Failed to write to logfile"					
 			
-				if self.comm_wait == "EMOV":
-					self.et.comm_send("%s %s %s %s %s %s\n" % (self.start_pos + self.end_pos))
-					self.comm_wait = None
+				self.et.comm_notify(self, "EMOV", "%s %s %s %s %s %s\n" % (self.start_pos + self.end_pos))
 					
 		# If the object was lost, do not update
 		else:
+			if not self.lost:
+				self.lost_t = t
 			self.lost = True
+			
+	def update_window(self):
+	
+		"""
+		Determines the half width and height of the window around the predicted
+		position, based on the size of the object and the prediction error
+		"""
+		
+		if camera.cvar.size_mode == camera.SIZE_WIDTH:
+			extent = self.pos[2] / 2
+		else:
+			extent = int(math.sqrt(self.pos[2]))
+		self.window = tuple([int(extent + self.et.window_scale * math.sqrt(var) + self.et.window_margin) for var in self.pre_var])
 	
@@ -34,6 +34,9 @@ class qtmantra(QtGui.QMainWindow):
 	
 	version = "0.42"
 	
+	# The scan modes in the order of the scan mode combobox
+	scan_modes = [camera.SCAN_SPIRAL, camera.SCAN_LABEL, camera.SCAN_WINDOW, camera.SCAN_COMPONENTS]
+	
 	def __init__(self, parent = None):
 	
 		"""
@@ -80,6 +83,7 @@ class qtmantra(QtGui.QMainWindow):
 		QtCore.QObject.connect(self.ui.spinbox_smov_threshold, QtCore.SIGNAL("valueChanged(int)"), self.option_changed)
 		QtCore.QObject.connect(self.ui.spinbox_emov_threshold, QtCore.SIGNAL("valueChanged(int)"), self.option_changed)		
 		QtCore.QObject.connect(self.ui.spinbox_min_z, QtCore.SIGNAL("valueChanged(int)"), self.option_changed)
+		QtCore.QObject.connect(self.ui.spinbox_threads, QtCore.SIGNAL("valueChanged(int)"), self.option_changed)
 		QtCore.QObject.connect(self.ui.spinbox_framerate, QtCore.SIGNAL("valueChanged(int)"), self.option_changed)
 		QtCore.QObject.connect(self.ui.checkbox_log_samples, QtCore.SIGNAL("stateChanged(int)"), self.option_changed)
 		QtCore.QObject.connect(self.ui.checkbox_v3d, QtCore.SIGNAL("stateChanged(int)"), self.option_changed)
@@ -88,6 +92,7 @@ class qtmantra(QtGui.QMainWindow):
 		QtCore.QObject.connect(self.ui.checkbox_control_mouse, QtCore.SIGNAL("stateChanged(int)"), self.option_changed)		
 		QtCore.QObject.connect(self.ui.combobox_match_mode, QtCore.SIGNAL("currentIndexChanged(int)"), self.option_changed)
 		QtCore.QObject.connect(self.ui.combobox_size_mode, QtCore.SIGNAL("currentIndexChanged(int)"), self.option_changed)
+		QtCore.QObject.connect(self.ui.combobox_scan_mode, QtCore.SIGNAL("currentIndexChanged(int)"), self.option_changed)
 		QtCore.QObject.connect(self.ui.combobox_comm_protocol, QtCore.SIGNAL("currentIndexChanged(int)"), self.option_changed)
 		QtCore.QObject.connect(self.ui.edit_host, QtCore.SIGNAL("editingFinished()"), self.option_changed)
 		QtCore.QObject.connect(self.ui.spinbox_port, QtCore.SIGNAL("valueChanged(int)"), self.option_changed)
@@ -131,7 +136,7 @@ class qtmantra(QtGui.QMainWindow):
 		"""
 
 		if self.ui.label_status.text() == "idle":
-			camera_devices = self.et.available_camera_devices()										
+			camera_devices = self.et.available_camera_devices() + ["synthetic"]
 			camera_device, accepted = QtGui.QInputDialog.getItem(self, "Choose camera", "Which camera device do you want to use?", camera_devices)		
 			if accepted:	
 				self.et.reinit_camera(str(camera_device), self.et.resolution)
@@ -286,7 +291,9 @@ class qtmantra(QtGui.QMainWindow):
 		self.et.monitor_webcam = self.ui.checkbox_monitor_webcam.isChecked()
 		etracker.camera.cvar.match_mode = self.ui.combobox_match_mode.currentIndex()
 		etracker.camera.cvar.size_mode = self.ui.combobox_size_mode.currentIndex()
+		etracker.camera.cvar.scan_mode = self.scan_modes[self.ui.combobox_scan_mode.currentIndex()]
 		etracker.camera.cvar.min_z = self.ui.spinbox_min_z.value()
+		etracker.camera.cvar.nr_of_threads = self.ui.spinbox_threads.value()
 		self.et.control_mouse = self.ui.checkbox_control_mouse.isChecked()
 		self.et.host = str(self.ui.edit_host.text())
 		self.et.port = self.ui.spinbox_port.value()
@@ -314,7 +321,10 @@ class qtmantra(QtGui.QMainWindow):
 		self.ui.checkbox_monitor_webcam.setChecked(self.et.monitor_webcam)
 		self.ui.combobox_match_mode.setCurrentIndex(etracker.camera.cvar.match_mode)
 		self.ui.combobox_size_mode.setCurrentIndex(etracker.camera.cvar.size_mode)
+		if etracker.camera.cvar.scan_mode in self.scan_modes:
+			self.ui.combobox_scan_mode.setCurrentIndex(self.scan_modes.index(etracker.camera.cvar.scan_mode))
 		self.ui.spinbox_min_z.setValue(etracker.camera.cvar.min_z)
+		self.ui.spinbox_threads.setValue(etracker.camera.cvar.nr_of_threads)
 		self.ui.checkbox_control_mouse.setChecked(self.et.control_mouse)	
 		self.ui.edit_host.setText(self.et.host)			
 		self.ui.spinbox_port.setValue(self.et.port)
@@ -349,6 +359,19 @@ class qtmantra(QtGui.QMainWindow):
 		
 		camera_dev = settings["camera_dev"]
 		resolution = settings["resolution"]
+
+		# The buffer ring and the capture thread are set up when the camera is
+		# initialized
+		if "capture_mode" in settings:
+			etracker.camera.cvar.capture_mode = settings["capture_mode"]
+		if "nr_of_buffers" in settings:
+			etracker.camera.cvar.nr_of_buffers = settings["nr_of_buffers"]
+		if "capture_pixel_format" in settings:
+			etracker.camera.cvar.capture_pixel_format = settings["capture_pixel_format"]
+		if "capture_threaded" in settings:
+			etracker.camera.cvar.capture_threaded = settings["capture_threaded"]
+			etracker.camera.cvar.capture_policy = settings["capture_policy"]
+			etracker.camera.cvar.capture_queue_size = settings["capture_queue_size"]
 		
 		# Initialize if etracker has not yet been initialized, reinit otherwise
 		if hasattr(self, "et"):
@@ -364,7 +387,19 @@ class qtmantra(QtGui.QMainWindow):
 		self.et.monitor_webcam = settings["monitor_webcam"]
 		etracker.camera.cvar.match_mode = settings["match_mode"]
 		etracker.camera.cvar.size_mode = settings["size_mode"]
+		if "scan_mode" in settings:
+			etracker.camera.cvar.scan_mode = settings["scan_mode"]
 		etracker.camera.cvar.min_z = settings["min_z"]
+		if "nr_of_threads" in settings:
+			etracker.camera.cvar.nr_of_threads = settings["nr_of_threads"]
+		if "acquire_mode" in settings:
+			etracker.camera.cvar.acquire_mode = settings["acquire_mode"]
+			etracker.camera.cvar.acquire_step = settings["acquire_step"]
+		if "motion_acquire" in settings:
+			etracker.camera.cvar.background_model = settings["background_model"]
+			etracker.camera.cvar.background_warmup = settings["background_warmup"]
+			etracker.camera.cvar.background_threshold = settings["background_threshold"]
+			etracker.camera.cvar.motion_acquire = settings["motion_acquire"]
 		self.et.control_mouse = settings["control_mouse"]
 		self.et.host = settings["host"]
 		self.et.port = settings["port"]
@@ -400,7 +435,21 @@ class qtmantra(QtGui.QMainWindow):
 		settings["monitor_webcam"] = self.et.monitor_webcam
 		settings["match_mode"] = etracker.camera.cvar.match_mode
 		settings["size_mode"] = etracker.camera.cvar.size_mode
+		settings["scan_mode"] = etracker.camera.cvar.scan_mode
+		settings["capture_mode"] = etracker.camera.cvar.capture_mode
+		settings["nr_of_buffers"] = etracker.camera.cvar.nr_of_buffers
+		settings["capture_pixel_format"] = etracker.camera.cvar.capture_pixel_format
+		settings["capture_threaded"] = etracker.camera.cvar.capture_threaded
+		settings["capture_policy"] = etracker.camera.cvar.capture_policy
+		settings["capture_queue_size"] = etracker.camera.cvar.capture_queue_size
 		settings["min_z"] = etracker.camera.cvar.min_z
+		settings["nr_of_threads"] = etracker.camera.cvar.nr_of_threads
+		settings["acquire_mode"] = etracker.camera.cvar.acquire_mode
+		settings["acquire_step"] = etracker.camera.cvar.acquire_step
+		settings["background_model"] = etracker.camera.cvar.background_model
+		settings["background_warmup"] = etracker.camera.cvar.background_warmup
+		settings["background_threshold"] = etracker.camera.cvar.background_threshold
+		settings["motion_acquire"] = etracker.camera.cvar.motion_acquire
 		settings["control_mouse"] = self.et.control_mouse
 		settings["host"] = self.et.host	
 		settings["port"] = self.et.port
@@ -0,0 +1,237 @@
+#include <stdlib.h>
+#include <stdio.h>
+#include <string.h>
+#include <math.h>
+#include "camera.h"
+
+// The color of the synthetic background and the amplitude of the noise that
+// is added to it. The blobs belong to the camera
+int synthetic_r = 128;
+int synthetic_g = 128;
+int synthetic_b = 128;
+int synthetic_noise = 0;
+
+// The number of frames after which the synthetic source runs dry, or 0 to
+// generate frames forever, so that a known number of frames can be queued
+int synthetic_frames = 0;
+
+int synthetic_add_blob(CAMERA *cam, int r, int g, int b, int radius, int x, int y, int vx, int vy)
+{
+
+	/**
+	Adds a blob to the synthetic source. The velocity is expressed in pixels
+	per frame and blobs bounce off the edges of the frame. Returns the blob
+	number or -1 if no more blobs can be added
+	**/
+
+	BLOB *blob;
+
+	if (cam->nr_of_blobs >= MAX_BLOBS) {
+		return -1;
+	}
+
+	blob = &cam->blobs[cam->nr_of_blobs];
+	blob->r = r;
+	blob->g = g;
+	blob->b = b;
+	blob->radius = radius;
+	blob->x = x;
+	blob->y = y;
+	blob->vx = vx;
+	blob->vy = vy;
+	blob->drawn_x = -1;
+	blob->drawn_y = -1;
+
+	return cam->nr_of_blobs++;
+}
+
+void synthetic_clear_blobs(CAMERA *cam)
+{
+	cam->nr_of_blobs = 0;
+}
+
+PyObject *synthetic_blob_position(CAMERA *cam, int i)
+{
+
+	/**
+	Returns the ground truth for a blob as an (x, y, radius) tuple, describing
+	where it was drawn in the last frame. Note that these are image
+	coordinates, whereas track_x is mirrored horizontally
+	**/
+
+	if (i < 0 || i >= cam->nr_of_blobs) {
+		return Py_BuildValue("(ddi)", -1.0, -1.0, 0);
+	}
+	return Py_BuildValue("(ddi)", cam->blobs[i].drawn_x, cam->blobs[i].drawn_y, cam->blobs[i].radius);
+}
+
+void synthetic_init(CAMERA *cam, char *device, int width, int height)
+{
+
+	/**
+	Frames are generated in RGB24, unless a YUV format has been requested
+	**/
+
+	extern short capture_pixel_format;
+
+	camera_set_pixel_format(cam, width, height, capture_pixel_format == PIXEL_AUTO ? PIXEL_RGB24 : capture_pixel_format);
+	cam->synthetic_frame_nr = 0;
+}
+
+short synthetic_grab(CAMERA *cam, FRAME_SLOT *slot)
+{
+
+	/**
+	Draws the background and all blobs and moves the blobs for the next frame.
+	The noise is seeded by the frame number, so that a sequence of frames can
+	be reproduced exactly
+	**/
+
+	extern int synthetic_r, synthetic_g, synthetic_b, synthetic_noise;
+	extern int synthetic_frames;
+
+	int width = cam->format.fmt.pix.width;
+	int height = cam->format.fmt.pix.height;
+	int bpl = cam->format.fmt.pix.bytesperline;
+	unsigned int seed = 2463534242u + cam->synthetic_frame_nr;
+	unsigned char *frame = slot->own;
+	short rgb24 = cam->pixel_format == PIXEL_RGB24;
+	int x, y, i, n;
+	long offset;
+
+	if (synthetic_frames > 0 && cam->synthetic_frame_nr >= synthetic_frames) {
+		return 0;
+	}
+
+	for (y = 0; y < height; y++) {
+		offset = y * bpl;
+		for (x = 0; x < width; x++) {
+			if (synthetic_noise > 0) {
+				// Xorshift, which is cheap and good enough for noise
+				seed ^= seed << 13;
+				seed ^= seed >> 17;
+				seed ^= seed << 5;
+				n = (int) (seed % (2 * synthetic_noise + 1)) - synthetic_noise;
+			} else {
+				n = 0;
+			}
+			if (!rgb24) {
+				frame_put_rgb(cam, frame, x, y, (clip_byte(synthetic_r + n) << 16)
+					| (clip_byte(synthetic_g + n) << 8) | clip_byte(synthetic_b + n));
+				continue;
+			}
+			frame[offset] = MAX(0, MIN(255, synthetic_r + n));
+			frame[offset + 1] = MAX(0, MIN(255, synthetic_g + n));
+			frame[offset + 2] = MAX(0, MIN(255, synthetic_b + n));
+			offset += 3;
+		}
+	}
+
+	for (i = 0; i < cam->nr_of_blobs; i++) {
+
+		BLOB *blob = &cam->blobs[i];
+		int bx = (int) blob->x;
+		int by = (int) blob->y;
+		int rr = blob->radius * blob->radius;
+
+		for (y = MAX(0, by - blob->radius); y <= MIN(height - 1, by + blob->radius); y++) {
+			for (x = MAX(0, bx - blob->radius); x <= MIN(width - 1, bx + blob->radius); x++) {
+				if ((x - bx) * (x - bx) + (y - by) * (y - by) > rr) {
+					continue;
+				}
+				if (!rgb24) {
+					frame_put_rgb(cam, frame, x, y, (blob->r << 16) | (blob->g << 8) | blob->b);
+					continue;
+				}
+				offset = x * 3 + y * bpl;
+				frame[offset] = blob->r;
+				frame[offset + 1] = blob->g;
+				frame[offset + 2] = blob->b;
+			}
+		}
+
+		blob->drawn_x = bx;
+		blob->drawn_y = by;
+
+		// Move the blob and bounce off the edges
+		blob->x += blob->vx;
+		blob->y += blob->vy;
+		if (blob->x < 0 || blob->x >= width) {
+			blob->vx = -blob->vx;
+			blob->x = MAX(0, MIN(width - 1, blob->x));
+		}
+		if (blob->y < 0 || blob->y >= height) {
+			blob->vy = -blob->vy;
+			blob->y = MAX(0, MIN(height - 1, blob->y));
+		}
+	}
+
+	slot->data = frame;
+	slot->index = -1;
+	slot->timestamp = capture_clock();
+	slot->sequence = cam->synthetic_frame_nr++;
+	return 1;
+}
+
+void synthetic_release(CAMERA *cam, FRAME_SLOT *slot)
+{
+}
+
+void synthetic_close(CAMERA *cam)
+{
+}
+
+FRAME_SOURCE synthetic_source = {synthetic_init, synthetic_grab, synthetic_release, synthetic_close};
+
+void file_init(CAMERA *cam, char *device, int width, int height)
+{
+	camera_set_rgb_format(cam, width, height);
+	cam->replay_frame_nr = 0;
+	cam->replay_fp = fopen(device, "rb");
+	if (cam->replay_fp == NULL) {
+		printf("Failed to open %s\n", device);
+	}
+}
+
+short file_grab(CAMERA *cam, FRAME_SLOT *slot)
+{
+
+	/**
+	Reads the next raw frame from the file, and starts from the beginning when
+	the end of the file has been reached
+	**/
+
+	size_t size = cam->format.fmt.pix.sizeimage;
+
+	if (cam->replay_fp == NULL) {
+		return 0;
+	}
+
+	if (fread(slot->own, size, 1, cam->replay_fp) != 1) {
+		rewind(cam->replay_fp);
+		if (fread(slot->own, size, 1, cam->replay_fp) != 1) {
+			printf("Replay file does not contain a complete frame\n");
+			return 0;
+		}
+	}
+
+	slot->data = slot->own;
+	slot->index = -1;
+	slot->timestamp = capture_clock();
+	slot->sequence = cam->replay_frame_nr++;
+	return 1;
+}
+
+void file_release(CAMERA *cam, FRAME_SLOT *slot)
+{
+}
+
+void file_close(CAMERA *cam)
+{
+	if (cam->replay_fp != NULL) {
+		fclose(cam->replay_fp);
+		cam->replay_fp = NULL;
+	}
+}
+
+FRAME_SOURCE file_source = {file_init, file_grab, file_release, file_close};
@@ -0,0 +1,154 @@
+#include <stdio.h>
+#include <pthread.h>
+#include "camera.h"
+
+// The maximum number of threads that can work on a single frame
+#define MAX_WORKERS		32
+
+// The nr of threads that process the tiles of a frame, including the thread
+// that calls workers_run(). With a single thread, everything runs on the
+// calling thread, exactly as before.
+int nr_of_threads = 1;
+
+pthread_t workers[MAX_WORKERS];
+int nr_of_workers = 0;
+
+pthread_mutex_t workers_lock = PTHREAD_MUTEX_INITIALIZER;
+
+// The workers are shared by all cameras, so a job of one camera has to wait
+// until the job of another camera is done
+pthread_mutex_t workers_busy = PTHREAD_MUTEX_INITIALIZER;
+pthread_cond_t work_ready = PTHREAD_COND_INITIALIZER;
+pthread_cond_t work_done = PTHREAD_COND_INITIALIZER;
+
+// The job that is currently being processed. Every job gets a new
+// generation, so that the workers can tell that there is new work
+TILE_JOB current_job = NULL;
+CAMERA *current_cam = NULL;
+void *current_arg = NULL;
+int current_tiles = 0;
+int active_workers = 0;
+int next_tile = 0;
+int tiles_done = 0;
+unsigned int generation = 0;
+
+void workers_process(void)
+{
+
+	/**
+	Processes tiles of the current job until none are left. Must be called
+	with workers_lock held
+	**/
+
+	extern TILE_JOB current_job;
+	extern CAMERA *current_cam;
+	extern void *current_arg;
+	extern int current_tiles, next_tile, tiles_done;
+	int tile;
+
+	while (next_tile < current_tiles) {
+		tile = next_tile++;
+		pthread_mutex_unlock(&workers_lock);
+		current_job(current_cam, tile, current_tiles, current_arg);
+		pthread_mutex_lock(&workers_lock);
+		tiles_done++;
+		if (tiles_done == current_tiles) {
+			pthread_cond_signal(&work_done);
+		}
+	}
+}
+
+void *worker_loop(void *arg)
+{
+	extern unsigned int generation;
+	extern int active_workers;
+	int id = (int) (long) arg;
+	unsigned int seen = 0;
+
+	pthread_mutex_lock(&workers_lock);
+	while (1) {
+		while (generation == seen) {
+			pthread_cond_wait(&work_ready, &workers_lock);
+		}
+		seen = generation;
+		// Workers beyond the current nr of threads sit this job out
+		if (id < active_workers) {
+			workers_process();
+		}
+	}
+	return NULL;
+}
+
+int workers_tiles(int size)
+{
+
+	/**
+	Returns the number of tiles in which a dimension of the given size is
+	split. There are a few tiles per thread, so that a thread that finishes
+	early can take over some of the work
+	**/
+
+	extern int nr_of_threads;
+
+	if (nr_of_threads <= 1) {
+		return 1;
+	}
+	return MAX(1, MIN(size, MIN(MAX_TILES, 4 * nr_of_threads)));
+}
+
+void workers_run(CAMERA *cam, TILE_JOB job, int nr_of_tiles, void *arg)
+{
+
+	/**
+	Runs job for all tiles of a camera, spread over nr_of_threads threads,
+	and returns when all tiles have been processed. The calling thread
+	processes tiles as well. The job must not touch any Python objects
+	**/
+
+	extern int nr_of_threads, nr_of_workers;
+	extern pthread_t workers[];
+	extern TILE_JOB current_job;
+	extern CAMERA *current_cam;
+	extern void *current_arg;
+	extern int current_tiles, active_workers, next_tile, tiles_done;
+	extern unsigned int generation;
+	int tile;
+
+	if (nr_of_threads <= 1 || nr_of_tiles <= 1) {
+		for (tile = 0; tile < nr_of_tiles; tile++) {
+			job(cam, tile, nr_of_tiles, arg);
+		}
+		return;
+	}
+
+	pthread_mutex_lock(&workers_busy);
+	pthread_mutex_lock(&workers_lock);
+
+	// The workers are started when they are first needed and then kept
+	while (nr_of_workers < MIN(nr_of_threads - 1, MAX_WORKERS)) {
+		if (pthread_create(&workers[nr_of_workers], NULL, worker_loop, (void *) (long) nr_of_workers)) {
+			printf("Failed to start a worker thread\n");
+			break;
+		}
+		pthread_detach(workers[nr_of_workers]);
+		nr_of_workers++;
+	}
+
+	current_job = job;
+	current_cam = cam;
+	current_arg = arg;
+	current_tiles = nr_of_tiles;
+	active_workers = MIN(nr_of_threads - 1, nr_of_workers);
+	next_tile = 0;
+	tiles_done = 0;
+	generation++;
+	pthread_cond_broadcast(&work_ready);
+
+	workers_process();
+	while (tiles_done < current_tiles) {
+		pthread_cond_wait(&work_done, &workers_lock);
+	}
+
+	pthread_mutex_unlock(&workers_lock);
+	pthread_mutex_unlock(&workers_busy);
+}
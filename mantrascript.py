@@ -34,12 +34,23 @@ import os
 
 # Some options
 resolution = 320, 240
-device = None # Get first device
+device = None # Get first device ('synthetic' or a recording also work)
 mantra = None # No GUI
 protocol = 'udp' # udp for OpenSesame, tcp for E-Prime
 log_file = 'recording.tsv'
+capture_threaded = False # Capture in a separate thread, paced by the camera
+threads = 1 # The nr of threads that scan the frame
+coarse_acquisition = False # Search a coarse grid for objects that are lost
+motion_acquisition = False # Only search for lost objects where the scene changed
 
 # Initialize the tracker
+etracker.camera.cvar.capture_threaded = capture_threaded
+etracker.camera.cvar.nr_of_threads = threads
+if coarse_acquisition:
+	etracker.camera.cvar.acquire_mode = etracker.camera.ACQUIRE_PYRAMID
+if motion_acquisition:
+	etracker.camera.cvar.background_model = 1
+	etracker.camera.cvar.motion_acquire = 1
 et = etracker.etracker(device, resolution, mantra)
 et.comm_protocol = protocol
 et.fname = log_file
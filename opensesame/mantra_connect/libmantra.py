@@ -16,8 +16,22 @@ along with Etrack.  If not, see <http://www.gnu.org/licenses/>.
 """
 
 import socket
+import struct
 import time
 
+# The binary sample record and packet header, which must match those in
+# mantra/comm.py: the object nr, whether the object is moving, whether the
+# sample was streamed, the sample nr, the timestamp, the position (x, y, z),
+# the velocity and the acceleration
+SAMPLE_RECORD = struct.Struct("<HbBIdfffff")
+PACKET_HEADER = struct.Struct("<2sH")
+FRAME_HEADER = struct.Struct("<2sHI")
+
+# The server forgets clients that have been silent for a minute, so while
+# samples are streamed, the client says that it is still there this often (in
+# seconds)
+KEEPALIVE_INTERVAL = 10
+
 class libmantra:
 
 	"""
@@ -26,7 +40,7 @@ class libmantra:
 	<http://www.cogsci.nl/mantra/>
 	"""
 	
-	version = 0.42
+	version = 0.45
 
 	def __init__(self, host="localhost", port=40007):
 	
@@ -41,6 +55,8 @@ class libmantra:
 	
 		self.comm_addr = host, port		
 		self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+		self.streamed = []
+		self.alive_t = 0
 		self.connected = self.comm("HI", 1) == "HI"
 		
 	def comm(self, cmd, timeout=None):
@@ -56,19 +72,91 @@ class libmantra:
 				   (default=None)
 		
 		Returns:
-		The response string of the Mantra server or None if a timeout occurred
+		The response string of the Mantra server, a sample record if the
+		response was a binary sample, a (frame, records) tuple if the response
+		was a binary frame, or None if a timeout occurred
 		"""
 
 		self.sock.sendto(cmd, self.comm_addr)
 		self.sock.settimeout(timeout)					
-		data = ""
-		while data[-1:] != "\n":		
+		while True:
 			try:
-				data, self.comm_addr = self.sock.recvfrom(128)
+				data, self.comm_addr = self.sock.recvfrom(2048)
 			except:
 				return None
-						
-		return data[:-1]
+
+			# While subscribed, streamed samples may arrive before the
+			# response. These are kept for stream()
+			if data[:2] == "MS":
+				reply = None
+				for record in self.unpack(data):
+					if record[2]:
+						self.streamed.append(self.stream_sample(record))
+					else:
+						reply = record
+				if reply != None:
+					return reply
+			elif data[:2] == "MF":
+				header = FRAME_HEADER.unpack_from(data)
+				return header[2], [SAMPLE_RECORD.unpack_from(data, \
+					FRAME_HEADER.size + i * SAMPLE_RECORD.size) for i in \
+					range(header[1])]
+			elif data.startswith("STREAM "):
+				self.streamed.append(self.stream_sample(data))
+			elif data[-1:] == "\n":
+				return data[:-1]
+
+	def unpack(self, data):
+
+		"""
+		Unpacks a binary packet
+
+		Arguments:
+		data -- the packet
+
+		Returns:
+		A list of (o, moving, streamed, sample_nr, timestamp, x, y, z,
+		velocity, acceleration) tuples
+		"""
+
+		n = PACKET_HEADER.unpack_from(data)[1]
+		return [SAMPLE_RECORD.unpack_from(data, PACKET_HEADER.size + i * \
+			SAMPLE_RECORD.size) for i in range(n)]
+
+	def stream_sample(self, res):
+
+		"""
+		Converts a streamed sample to an (o, moving, coordinates) tuple
+
+		Arguments:
+		res -- a sample record or a STREAM line
+		"""
+
+		if type(res) == tuple:
+			return res[0], res[1], res[5:8]
+		res = res.split(" ")
+		return int(res[1]), int(res[2]), (float(res[3]), float(res[4]), \
+			float(res[5]))
+
+	def set_binary(self, binary=True, timeout=1):
+
+		"""
+		Asks the server to send samples in a compact binary format instead of
+		as text, which is cheaper to decode and allows multiple samples per
+		datagram. Servers that don't support this keep sending text, which
+		libmantra understands as well. Replies are recognized by their
+		contents, so the format doesn't need to be remembered.
+
+		Keyword arguments:
+		binary -- True for binary samples, False for text (default=True)
+		timeout -- a maximum time to wait for the server (default=1)
+
+		Returns:
+		True if the server uses the requested format, False otherwise
+		"""
+
+		fmt = {True : "BINARY", False : "TEXT"}[bool(binary)]
+		return self.comm("FORMAT %s\n" % fmt, timeout) == "FORMAT %s" % fmt
 		
 	def set_fname(self, fname):
 	
@@ -145,11 +233,7 @@ class libmantra:
 		(moving) and coordinates is a (x,y,z) tuple.		
 		"""	
 	
-		res = self.comm("SAMP %d\n" % o, timeout)
-		if res == None:
-			return None
-		res = res.split(" ")
-		return int(res[0]), (float(res[1]), float(res[2]), float(res[3]))
+		return self.parse_sample(self.comm("SAMP %d\n" % o, timeout))
 		
 	def nb_sample(self, o=0, timeout=None):
 	
@@ -168,13 +252,198 @@ class libmantra:
 		(moving) and coordinates is a (x,y,z) tuple.		
 		"""		
 	
-		res = self.comm("NBSAMP %d\n" % o, timeout)
+		return self.parse_sample(self.comm("NBSAMP %d\n" % o, timeout))
+
+	def samples(self, objects=None, timeout=None):
+
+		"""
+		Returns the samples of several objects, which all come from the same
+		frame. This function waits for a frame of which no samples have been
+		returned yet and therefore blocks the program until a new frame is
+		available.
+
+		Keyword arguments:
+		objects -- a list of object nrs or None for all objects (default=None)
+		timeout -- a maximum time, after which a timeout is signaled
+				   (default=None)
+
+		Returns:
+		A (frame, samples) tuple, where frame is the sequence number of the
+		frame and samples is a list with a (moving, coordinates) tuple for
+		every object, or None if a timeout occurred
+		"""
+
+		return self.parse_frame(self.comm("MSAMP %s\n" % self.object_list( \
+			objects), timeout))
+
+	def nb_samples(self, objects=None, timeout=None):
+
+		"""
+		Returns the samples of several objects, which all come from the same
+		frame. Unlike samples(), this function returns the latest samples
+		right away.
+
+		Keyword arguments:
+		objects -- a list of object nrs or None for all objects (default=None)
+		timeout -- a maximum time, after which a timeout is signaled
+				   (default=None)
+
+		Returns:
+		A (frame, samples) tuple, where frame is the sequence number of the
+		frame and samples is a list with a (moving, coordinates) tuple for
+		every object, or None if a timeout occurred
+		"""
+
+		return self.parse_frame(self.comm("NBMSAMP %s\n" % \
+			self.object_list(objects), timeout))
+
+	def object_list(self, objects):
+
+		"""
+		Returns a list of object nrs as a string for a command
+		"""
+
+		if objects == None:
+			return ""
+		return " ".join([str(o) for o in objects])
+
+	def parse_frame(self, res):
+
+		"""
+		Converts the response to MSAMP or NBMSAMP to a (frame, samples) tuple
+
+		Arguments:
+		res -- the response, which is a string or a (frame, records) tuple
+
+		Returns:
+		A (frame, samples) tuple or None if there was no response
+		"""
+
+		if res == None:
+			return None
+		if type(res) == tuple:
+			return res[0], [(r[1], r[5:8]) for r in res[1]]
+		res = res.split(" ")
+		return int(res[0]), [(int(res[i]), (float(res[i + 1]), \
+			float(res[i + 2]), float(res[i + 3]))) for i in range(1, \
+			len(res), 4)]
+
+	def parse_sample(self, res):
+
+		"""
+		Converts the response to SAMP or NBSAMP to a (moving, coordinates)
+		tuple
+
+		Arguments:
+		res -- the response, which is a string or a sample record
+
+		Returns:
+		A (moving, coordinates) tuple or None if there was no response
+		"""
+
 		if res == None:
 			return None
+		if type(res) == tuple:
+			return res[1], res[5:8]
 		res = res.split(" ")
 		return int(res[0]), (float(res[1]), float(res[2]), float(res[3]))
 		
 					
+	def subscribe(self, objects=None, every=1):
+
+		"""
+		Asks the server to send every new sample of one or more objects as
+		soon as it is available, so that no request has to be sent for each
+		sample. The samples are obtained with stream() or stream_callback().
+
+		Keyword arguments:
+		objects -- a list of object nrs or None for all objects (default=None)
+		every -- only every nth sample is sent (default=1)
+		"""
+
+		self.sock.sendto("SUBSCRIBE EVERY %d %s\n" % (every, \
+			self.object_list(objects)), self.comm_addr)
+		self.alive_t = time.time()
+
+	def unsubscribe(self, objects=None):
+
+		"""
+		Stops the samples of one or more objects from being sent. Samples that
+		were already underway may still arrive.
+
+		Keyword arguments:
+		objects -- a list of object nrs or None for all objects (default=None)
+		"""
+
+		self.sock.sendto("UNSUBSCRIBE %s\n" % self.object_list(objects), \
+			self.comm_addr)
+
+	def stream(self, timeout=None):
+
+		"""
+		Iterates over the samples of the objects that have been subscribed to,
+		in the order in which they arrive. The iteration ends if no sample
+		arrives within the timeout. While iterating, the subscription is kept
+		alive.
+
+		Keyword arguments:
+		timeout -- a maximum time to wait for a sample (default=None)
+
+		Returns:
+		An iterator of (o, moving, coordinates) tuples, where o is the object
+		nr, moving is 0 (not moving) or 1 (moving) and coordinates is a
+		(x,y,z) tuple.
+		"""
+
+		if timeout != None:
+			deadline = time.time() + timeout
+		while True:
+			while len(self.streamed) > 0:
+				yield self.streamed.pop(0)
+			t = time.time()
+			if t - self.alive_t >= KEEPALIVE_INTERVAL:
+				self.sock.sendto("ALIVE\n", self.comm_addr)
+				self.alive_t = t
+			wait = KEEPALIVE_INTERVAL
+			if timeout != None:
+				wait = min(wait, deadline - t)
+				if wait <= 0:
+					return
+			self.sock.settimeout(wait)
+			try:
+				data, addr = self.sock.recvfrom(2048)
+			except socket.timeout:
+				continue
+			except:
+				return
+			if timeout != None:
+				deadline = time.time() + timeout
+			if data[:2] == "MS":
+				for record in self.unpack(data):
+					if record[2]:
+						self.streamed.append(self.stream_sample(record))
+			elif data.startswith("STREAM "):
+				self.streamed.append(self.stream_sample(data))
+
+	def stream_callback(self, callback, timeout=None):
+
+		"""
+		Calls a function for every sample of the objects that have been
+		subscribed to, until the function returns False or no sample arrives
+		within the timeout.
+
+		Arguments:
+		callback -- a function that accepts the object nr, the movement
+					status and an (x,y,z) tuple
+
+		Keyword arguments:
+		timeout -- a maximum time to wait for a sample (default=None)
+		"""
+
+		for o, moving, coordinates in self.stream(timeout):
+			if callback(o, moving, coordinates) == False:
+				break
+
 	def smov(self, o=0, timeout=None):	
 	
 		"""
@@ -262,6 +531,27 @@ class libmantra_dummy:
 		
 	def nb_sample(self, o = 0, timeout = None):
 		pass	
+
+	def set_binary(self, binary = True, timeout = 1):
+		return False
+
+	def samples(self, objects = None, timeout = None):
+		pass
+
+	def nb_samples(self, objects = None, timeout = None):
+		pass
+
+	def subscribe(self, objects = None, every = 1):
+		pass
+
+	def unsubscribe(self, objects = None):
+		pass
+
+	def stream(self, timeout = None):
+		return iter([])
+
+	def stream_callback(self, callback, timeout = None):
+		pass
 					
 	def smov(self, o = 0, timeout = None):	
 		time.sleep(0.5)
@@ -12,7 +12,7 @@ setup(name='mantra',
 	scripts=['qtmantra'],	      
 	packages=['mantra'],
 	package_dir={'mantra' : 'mantra'},
-	package_data={'mantra' : ['resources/icons/*.png', '*.c', '*.o', '*.so']},
+	package_data={'mantra' : ['resources/icons/*.png', '*.c', '*.h', '*.o', '*.so']},
 	data_files=[
 		('share/applications', ['data/mantra.desktop']),
 		('share/pixmaps', ['data/icons/32x32/apps/mantra.png']),
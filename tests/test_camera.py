@@ -0,0 +1,265 @@
+"""
+This file is part of Mantra.
+
+Mantra is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Mantra is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Mantra.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import time
+import unittest
+from mantra import camera
+
+# Colors that differ from each other and from the gray background in both
+# match modes
+COLORS = [
+	(255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 0), (255, 0, 255),
+	(0, 255, 255), (128, 0, 0), (0, 128, 0), (0, 0, 128), (128, 128, 0)
+	]
+
+# The settings that tests change, which are restored afterwards
+SETTINGS = [
+	"capture_threaded", "capture_policy", "capture_queue_size",
+	"synthetic_frames", "nr_of_threads", "capture_pixel_format", "scan_mode",
+	"acquire_mode", "background_model", "background_warmup", "motion_acquire"
+	]
+
+class test_camera(unittest.TestCase):
+
+	"""
+	Tests the camera extension on the synthetic source
+	"""
+
+	def setUp(self):
+
+		self.cam = camera.CAMERA()
+		self.width, self.height = 320, 240
+		self.settings = dict( (name, getattr(camera.cvar, name)) for name in SETTINGS)
+
+	def tearDown(self):
+
+		camera.camera_close(self.cam)
+		for name, value in self.settings.items():
+			setattr(camera.cvar, name, value)
+
+	def add_blobs(self, colors):
+
+		"""
+		Adds a still blob for every color, five blobs per row
+		"""
+
+		for i, (r, g, b) in enumerate(colors):
+			camera.synthetic_add_blob(self.cam, r, g, b, 8, 40 + 60 * (i % 5), 60 + 100 * (i / 5), 0, 0)
+
+	def test_label_many_colors(self):
+
+		"""
+		Labels more objects than there used to be color tables
+		"""
+
+		camera.camera_init(self.cam, "synthetic", self.width, self.height)
+		self.add_blobs(COLORS)
+		camera.camera_capture(self.cam)
+		result = camera.label_objects(self.cam, [color + (30, ) for color in COLORS], 0)
+		self.assertEqual(len(result), len(COLORS))
+		for i, (x, y, z) in enumerate(result):
+			drawn_x, drawn_y, radius = camera.synthetic_blob_position(self.cam, i)
+			self.assertTrue(z > 0, "object %d was not found" % i)
+			self.assertTrue(abs(x - (self.width - drawn_x)) <= 1, "object %d at x %d" % (i, x))
+			self.assertTrue(abs(y - drawn_y) <= 1, "object %d at y %d" % (i, y))
+
+	def test_worker_tiles(self):
+
+		"""
+		Labels and highlights the same pixels when the frame is split into
+		tiles for several threads as with a single thread
+		"""
+
+		camera.camera_init(self.cam, "synthetic", self.width, self.height)
+		self.add_blobs(COLORS[:5])
+		results = []
+		for nr_of_threads in 1, 4:
+			camera.cvar.nr_of_threads = nr_of_threads
+			camera.camera_capture(self.cam)
+			plain = camera.camera_to_string(self.cam)
+			positions = camera.label_objects(self.cam, [color + (30, ) for color in COLORS[:5]], 1)
+			camera.highlight_color(self.cam, 255, 0, 0, 30)
+			frame = camera.camera_to_string(self.cam)
+			self.assertNotEqual(frame, plain)
+			results.append( (positions, frame) )
+		self.assertEqual(results[0], results[1])
+
+	def test_pixel_formats(self):
+
+		"""
+		Tracks objects at the same positions in YUYV and YUV420 frames as in
+		RGB24 frames
+		"""
+
+		results = []
+		for pixel_format in camera.PIXEL_RGB24, camera.PIXEL_YUYV, camera.PIXEL_YUV420:
+			camera.cvar.capture_pixel_format = pixel_format
+			camera.camera_init(self.cam, "synthetic", self.width, self.height)
+			self.assertEqual(self.cam.pixel_format, pixel_format)
+			self.add_blobs(COLORS[:3])
+			camera.camera_capture(self.cam)
+			positions = []
+			for i, (r, g, b) in enumerate(COLORS[:3]):
+				camera.track_object(self.cam, r, g, b, 30, self.width - 40 - 60 * i + 20, 80, 0)
+				positions.append( (self.cam.track_x, self.cam.track_y, self.cam.track_z) )
+			results.append(positions)
+			camera.camera_close(self.cam)
+		self.assertTrue(results[0][0][2] > 0)
+		self.assertEqual(results[1], results[0])
+		self.assertEqual(results[2], results[0])
+
+	def test_components(self):
+
+		"""
+		Finds every blob of a color as a component, except for blobs that are
+		smaller than min_z, and tracks the one closest to the prediction
+		"""
+
+		camera.camera_init(self.cam, "synthetic", self.width, self.height)
+		camera.synthetic_add_blob(self.cam, 255, 0, 0, 10, 80, 80, 0, 0)
+		camera.synthetic_add_blob(self.cam, 255, 0, 0, 6, 240, 160, 0, 0)
+		camera.synthetic_add_blob(self.cam, 255, 0, 0, 2, 160, 40, 0, 0)
+		camera.synthetic_add_blob(self.cam, 0, 255, 0, 10, 160, 120, 0, 0)
+		camera.camera_capture(self.cam)
+		components = camera.object_components(self.cam, 255, 0, 0, 30, 0)
+		self.assertEqual(len(components), 2)
+		for (x, y, area, left, top, right, bottom), (drawn_x, drawn_y, radius) in \
+			zip(sorted(components, reverse=True), [(80, 80, 10), (240, 160, 6)]):
+			self.assertTrue(abs(x - (self.width - drawn_x)) <= 1)
+			self.assertTrue(abs(y - drawn_y) <= 1)
+			self.assertTrue(abs(area - 3.14 * radius ** 2) < 0.1 * area)
+			self.assertTrue(left < x < right and top < y < bottom)
+		camera.cvar.scan_mode = camera.SCAN_COMPONENTS
+		camera.track_object(self.cam, 255, 0, 0, 30, self.width - 200, 150, 0)
+		self.assertTrue(abs(self.cam.track_x - (self.width - 240)) <= 1)
+		self.assertTrue(abs(self.cam.track_y - 160) <= 1)
+
+	def test_pyramid_acquisition(self):
+
+		"""
+		Acquires an object far from the prediction in ACQUIRE_PYRAMID mode,
+		ignoring a few stray pixels of the same color close to it
+		"""
+
+		camera.cvar.acquire_mode = camera.ACQUIRE_PYRAMID
+		camera.camera_init(self.cam, "synthetic", self.width, self.height)
+		camera.synthetic_add_blob(self.cam, 255, 0, 0, 1, 60, 60, 0, 0)
+		camera.synthetic_add_blob(self.cam, 255, 0, 0, 10, 250, 180, 0, 0)
+		camera.camera_capture(self.cam)
+		camera.track_object(self.cam, 255, 0, 0, 30, self.width - 50, 50, 0)
+		self.assertTrue(self.cam.track_z >= camera.cvar.min_z)
+		self.assertTrue(abs(self.cam.track_x - (self.width - 250)) <= 10)
+		self.assertTrue(abs(self.cam.track_y - 180) <= 10)
+
+	def test_motion_acquire(self):
+
+		"""
+		Acquires an object that appeared after the background was learned,
+		rather than a static object of the same color that is closer to the
+		prediction
+		"""
+
+		camera.cvar.background_model = 1
+		camera.cvar.background_warmup = 3
+		for motion_acquire, drawn_x, drawn_y in (0, 80, 80), (1, 240, 160):
+			camera.cvar.motion_acquire = motion_acquire
+			camera.camera_init(self.cam, "synthetic", self.width, self.height)
+			camera.synthetic_clear_blobs(self.cam)
+			camera.synthetic_add_blob(self.cam, 255, 0, 0, 10, 80, 80, 0, 0)
+			for i in range(3):
+				camera.camera_capture(self.cam)
+			self.assertTrue(self.cam.background_ready)
+			camera.synthetic_add_blob(self.cam, 255, 0, 0, 10, 240, 160, 0, 0)
+			camera.camera_capture(self.cam)
+			self.assertTrue(camera.background_mask_at(self.cam, 240, 160))
+			self.assertFalse(camera.background_mask_at(self.cam, 80, 80))
+			camera.track_object(self.cam, 255, 0, 0, 30, self.width - 120, 100, 0)
+			self.assertTrue(abs(self.cam.track_x - (self.width - drawn_x)) <= 1)
+			self.assertTrue(abs(self.cam.track_y - drawn_y) <= 1)
+			camera.camera_close(self.cam)
+
+	def test_slice_prediction_first(self):
+
+		"""
+		Finds a lost object at its prediction, even if the budget doesn't
+		allow for a search of the frame
+		"""
+
+		camera.camera_init(self.cam, "synthetic", self.width, self.height)
+		camera.synthetic_add_blob(self.cam, 255, 0, 0, 10, 100, 100, 0, 0)
+		camera.camera_capture(self.cam)
+		camera.track_object_slice(self.cam, 255, 0, 0, 30, self.width - 100, 100, 20, 20, -1, 1, 0)
+		self.assertTrue(self.cam.track_z > 0)
+		self.assertTrue(abs(self.cam.track_x - (self.width - 100)) <= 1)
+		self.assertTrue(abs(self.cam.track_y - 100) <= 1)
+
+	def test_slice_nearest(self):
+
+		"""
+		Of two objects of the same color, finds the one that is closest to the
+		prediction, although the other one comes first in the search
+		"""
+
+		camera.camera_init(self.cam, "synthetic", self.width, self.height)
+		camera.synthetic_add_blob(self.cam, 255, 0, 0, 8, 160, 80, 0, 0)
+		camera.synthetic_add_blob(self.cam, 255, 0, 0, 8, 160, 200, 0, 0)
+		camera.camera_capture(self.cam)
+		camera.track_object_slice(self.cam, 255, 0, 0, 30, self.width - 160, 120, 0, 0, -1, 1000000, 0)
+		self.assertTrue(self.cam.track_z > 0)
+		self.assertTrue(abs(self.cam.track_y - 80) <= 1, "found at y %d" % self.cam.track_y)
+
+	def queue_frames(self, policy):
+
+		"""
+		Lets the capture thread queue two frames, after which the synthetic
+		source runs dry. The queue can hold more, so no frame is dropped while
+		capturing
+		"""
+
+		camera.cvar.capture_threaded = 1
+		camera.cvar.capture_policy = policy
+		camera.cvar.capture_queue_size = 3
+		camera.cvar.synthetic_frames = 2
+		camera.camera_init(self.cam, "synthetic", self.width, self.height)
+		time.sleep(0.2)
+
+	def test_capture_newest(self):
+
+		"""
+		Takes the newest queued frame and drops the older one
+		"""
+
+		self.queue_frames(camera.CAPTURE_NEWEST)
+		camera.camera_capture(self.cam)
+		self.assertEqual(self.cam.frame_sequence, 1)
+		self.assertEqual(self.cam.frames_dropped, 1)
+
+	def test_capture_every(self):
+
+		"""
+		Takes the queued frames in order
+		"""
+
+		self.queue_frames(camera.CAPTURE_EVERY)
+		camera.camera_capture(self.cam)
+		self.assertEqual(self.cam.frame_sequence, 0)
+		camera.camera_capture(self.cam)
+		self.assertEqual(self.cam.frame_sequence, 1)
+		self.assertEqual(self.cam.frames_dropped, 0)
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,98 @@
+"""
+This file is part of Mantra.
+
+Mantra is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Mantra is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Mantra.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import socket
+import thread
+import time
+import unittest
+from mantra import comm
+
+class handler:
+
+	"""
+	Handles requests like etracker does: FLOOD sends more than a client that
+	doesn't read can take and WAIT pretends to wait for a sample
+	"""
+
+	def comm_process(self, session, s):
+
+		if s == "FLOOD":
+			for i in range(64):
+				session.send("x" * 65536)
+		elif s == "WAIT":
+			session.samp_waiting.append( ("SAMP", 0) )
+		return True
+
+	def comm_update(self, session):
+
+		pass
+
+class test_comm_server(unittest.TestCase):
+
+	"""
+	Tests how the server deals with clients that misbehave
+	"""
+
+	def setUp(self):
+
+		self.udp_timeout = comm.UDP_TIMEOUT
+
+	def tearDown(self):
+
+		comm.UDP_TIMEOUT = self.udp_timeout
+
+	def start(self, protocol):
+
+		server = comm.comm_server(handler(), "localhost", 41007, protocol)
+		thread.start_new_thread(server.run, ())
+		return server
+
+	def test_slow_tcp_client(self):
+
+		"""
+		Disconnects a TCP client that doesn't read what is sent to it
+		"""
+
+		server = self.start("tcp")
+		sock = socket.create_connection( ("localhost", server.port) )
+		sock.sendall("FLOOD\n")
+		time.sleep(0.5)
+		self.assertEqual(len(server.sessions), 0)
+		sock.close()
+
+	def test_idle_udp_client(self):
+
+		"""
+		Forgets a UDP client that has gone silent, unless it waits for a
+		sample
+		"""
+
+		comm.UDP_TIMEOUT = 0.5
+		server = self.start("udp")
+		silent = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+		waiting = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+		silent.sendto("HI\n", ("localhost", server.port))
+		waiting.sendto("WAIT\n", ("localhost", server.port))
+		time.sleep(0.2)
+		self.assertEqual(len(server.sessions), 2)
+		time.sleep(2)
+		self.assertEqual(len(server.sessions), 1)
+		silent.close()
+		waiting.close()
+
+if __name__ == "__main__":
+	unittest.main()
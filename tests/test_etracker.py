@@ -0,0 +1,230 @@
+"""
+This file is part of Mantra.
+
+Mantra is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Mantra is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Mantra.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import socket
+import struct
+import time
+import unittest
+import StringIO
+from mantra import camera, comm, etracker
+
+class test_tracker_object(unittest.TestCase):
+
+	"""
+	Tests the bookkeeping of tracked objects on the synthetic source
+	"""
+
+	def setUp(self):
+
+		self.size_mode = camera.cvar.size_mode
+		self.et = etracker.etracker("synthetic", (320, 240), None)
+		self.et.log = StringIO.StringIO()
+		camera.synthetic_add_blob(self.et.cam, 255, 0, 0, 10, 100, 80, 2, 1)
+		self.o = etracker.tracker_object("red", (255, 0, 0), 30, self.et)
+
+	def tearDown(self):
+
+		self.et.close()
+		camera.cvar.size_mode = self.size_mode
+
+	def track(self, frames):
+
+		"""
+		Tracks the object in a number of frames, as the tracking loop does
+		"""
+
+		for t in range(0, 40 * frames, 40):
+			camera.camera_capture(self.et.cam)
+			camera.track_object(self.et.cam, 255, 0, 0, 30, self.o.pre[0], self.o.pre[1], 0)
+			cam = self.et.cam
+			self.o.track( (cam.track_x, cam.track_y, cam.track_z), t, 40)
+
+	def test_track_window(self):
+
+		"""
+		Updates the window around the prediction in both size modes
+		"""
+
+		for size_mode in camera.SIZE_SURFACE, camera.SIZE_WIDTH:
+			camera.cvar.size_mode = size_mode
+			self.track(5)
+			self.assertFalse(self.o.lost)
+			self.assertTrue(self.o.window[0] > self.et.window_margin)
+			self.assertTrue(self.o.window[1] > self.et.window_margin)
+
+class test_comm_requests(unittest.TestCase):
+
+	"""
+	Tests how requests of a client are answered, without a server
+	"""
+
+	def setUp(self):
+
+		self.et = etracker.etracker("synthetic", (320, 240), None)
+		self.et.log = StringIO.StringIO()
+		self.et.objects.append(etracker.tracker_object("red", (255, 0, 0), 30, self.et))
+		self.session = comm.comm_session(None, ("localhost", 0))
+		self.session.binary = True
+
+	def tearDown(self):
+
+		self.et.close()
+
+	def test_failed_request(self):
+
+		"""
+		Drops a waiting request that can't be answered, so that the next one
+		is still answered
+		"""
+
+		self.session.samp_waiting = [("SAMP", 70000), ("SAMP", 0)]
+		self.assertRaises(struct.error, self.et.comm_update, self.session)
+		self.et.comm_update(self.session)
+		self.assertEqual(self.session.samp_waiting, [])
+		self.assertEqual(len(self.session.records), 1)
+
+	def test_object_nr_out_of_range(self):
+
+		"""
+		Rejects object nrs that don't fit in a sample record, and answers
+		with an unknown object for nrs that fit but don't exist
+		"""
+
+		self.et.tracking = True
+		for request in "SAMP -1", "NBSAMP 70000", "MSAMP 0 70000", "NBMSAMP -1":
+			self.assertRaises(ValueError, self.et.comm_process, self.session, request)
+		self.assertEqual(self.session.samp_waiting, [])
+		self.assertEqual(self.et.comm_snapshot(-1)[3], -1)
+		self.et.comm_process(self.session, "NBSAMP 1")
+		self.assertEqual(comm.SAMPLE_RECORD.unpack(self.session.records[0])[:2], (1, -1))
+
+class test_comm_clients(unittest.TestCase):
+
+	"""
+	Tests requests of a client that talks to the server of a tracker, which is
+	fed by tracking objects as the tracking loop does
+	"""
+
+	def setUp(self):
+
+		self.et = etracker.etracker("synthetic", (320, 240), None)
+		self.et.log = StringIO.StringIO()
+		self.et.comm_protocol = "udp"
+		camera.synthetic_add_blob(self.et.cam, 255, 0, 0, 10, 100, 80, 0, 0)
+		camera.synthetic_add_blob(self.et.cam, 0, 0, 255, 10, 200, 160, 0, 0)
+		self.et.objects.append(etracker.tracker_object("red", (255, 0, 0), 30, self.et))
+		self.et.objects.append(etracker.tracker_object("blue", (0, 0, 255), 30, self.et))
+		self.et.comm_start()
+		self.et.tracking = True
+		self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+		self.sock.settimeout(0.5)
+
+	def tearDown(self):
+
+		self.sock.close()
+		self.et.close()
+
+	def send(self, s):
+
+		"""
+		Sends a request and gives the server some time to handle it
+		"""
+
+		self.sock.sendto(s + "\n", ("localhost", self.et.port))
+		time.sleep(0.1)
+
+	def receive(self):
+
+		"""
+		Returns the next reply, or None if there is none
+		"""
+
+		try:
+			return self.sock.recv(65536)
+		except socket.timeout:
+			return None
+
+	def track(self, frames):
+
+		"""
+		Tracks all objects in a number of frames and publishes the samples
+		"""
+
+		et = self.et
+		for i in range(frames):
+			camera.camera_capture(et.cam)
+			for o in et.objects:
+				camera.track_object(et.cam, o.color[0], o.color[1], o.color[2], o.fuzziness, o.pre[0], o.pre[1], 0)
+				o.track( (et.cam.track_x, et.cam.track_y, et.cam.track_z), 40 * i, 40)
+				et.sample_nr += 1
+				et.comm_publish(o)
+			et.comm_publish_frame()
+			time.sleep(0.05)
+
+	def test_subscribe(self):
+
+		"""
+		Streams every other sample of a subscribed object, until the client
+		unsubscribes
+		"""
+
+		self.send("SUBSCRIBE EVERY 2 1")
+		self.track(4)
+		for i in range(2):
+			data = self.receive().split()
+			self.assertEqual(data[:2], ["STREAM", "1"])
+			self.assertTrue(abs(float(data[3]) - (320 - 200)) <= 1)
+			self.assertTrue(abs(float(data[4]) - 160) <= 1)
+		self.assertEqual(self.receive(), None)
+		self.send("UNSUBSCRIBE")
+		self.track(2)
+		self.assertEqual(self.receive(), None)
+
+	def test_msamp(self):
+
+		"""
+		Returns the samples of the listed objects from a single frame right
+		away with NBMSAMP, and those of all objects from the next frame with
+		MSAMP
+		"""
+
+		self.send("FORMAT BINARY")
+		self.assertEqual(self.receive(), "FORMAT BINARY\n")
+		self.track(1)
+		self.send("NBMSAMP 1 0 5")
+		data = self.receive()
+		header, count, sequence = comm.FRAME_HEADER.unpack_from(data)
+		self.assertEqual( (header, count), ("MF", 3) )
+		records = [comm.SAMPLE_RECORD.unpack_from(data, comm.FRAME_HEADER.size + i * \
+			comm.SAMPLE_RECORD.size) for i in range(count)]
+		self.assertEqual([record[0] for record in records], [1, 0, 5])
+		self.assertEqual(records[2][1], -1)
+		for (i, moving, streamed, sample_nr, timestamp, x, y, z, v, a), (drawn_x, drawn_y) in \
+			zip(records[:2], [(200, 160), (100, 80)]):
+			self.assertTrue(abs(x - (320 - drawn_x)) <= 1)
+			self.assertTrue(abs(y - drawn_y) <= 1)
+
+		# The client already has the last frame, so MSAMP waits for the next
+		self.send("MSAMP")
+		self.assertEqual(self.receive(), None)
+		self.track(1)
+		data = self.receive()
+		self.assertEqual(comm.FRAME_HEADER.unpack_from(data)[:2], ("MF", 2))
+		self.assertTrue(comm.FRAME_HEADER.unpack_from(data)[2] > sequence)
+
+if __name__ == "__main__":
+	unittest.main()